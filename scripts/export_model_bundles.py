@@ -0,0 +1,70 @@
+# futurisys-ml-deploy/scripts/export_model_bundles.py
+
+"""
+Exporte les modèles du registry en bundles .npz natifs (sans sklearn).
+
+Chaque modèle joblib est compilé vers son scoreur natif, contrôlé
+(parité sklearn sur e02_X_test_final.npy), puis écrit dans
+data/ml_artifacts/bundles/<modèle>.npz. Servis avec MODEL_FORMAT=bundle.
+
+Usage :
+    PYTHONPATH=. python -m scripts.export_model_bundles [modèle ...]
+"""
+
+import sys
+
+import joblib
+import numpy as np
+
+import src.ml.model_registry as registry
+from src.ml.native import compile_model, export_bundle, parity_delta
+
+
+def export_registry_bundles(names: list[str] | None = None) -> dict:
+    """
+    Exporte les modèles demandés (tous par défaut).
+    Retourne, par modèle, le chemin du bundle ou la raison de l'échec.
+    """
+    metadata = registry._read_metadata()
+    paths = registry._model_paths(metadata)
+    X_probe = np.load(registry.BASE_PATH / "e02_X_test_final.npy")
+
+    report = {}
+
+    for name in names or list(paths):
+        path = paths[name]
+        if path.suffix != ".joblib" or not path.exists():
+            report[name] = f"skipped: no joblib artifact at {path}"
+            continue
+
+        model = joblib.load(path)
+
+        try:
+            scorer = compile_model(model)
+        except ValueError as e:
+            report[name] = f"skipped: {e}"
+            continue
+
+        delta = parity_delta(scorer, model, X_probe)
+        if delta > registry.NATIVE_PARITY_ATOL:
+            report[name] = f"skipped: parity delta {delta:.3g}"
+            continue
+
+        bundle = export_bundle(
+            scorer,
+            registry.bundle_path(name),
+            source={
+                "model_name": name,
+                "file": str(path.relative_to(registry.BASE_PATH)),
+                "artifacts_version": metadata.get("artifacts_version"),
+                "parity_delta": delta,
+            },
+        )
+        report[name] = str(bundle)
+
+    return report
+
+
+if __name__ == "__main__":
+    for model_name, outcome in export_registry_bundles(sys.argv[1:]).items():
+        print(f"{model_name}: {outcome}")
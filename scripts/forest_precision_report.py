@@ -0,0 +1,66 @@
+# futurisys-ml-deploy/scripts/forest_precision_report.py
+
+"""
+Rapport de dérive du backend compact (float32 / int32) des forêts.
+
+Pour chaque forêt du registry : compilation native (float64), copie
+compacte, puis comparaison sur e02_X_test_final.npy :
+- écart maximal / moyen de probabilité (classe positive)
+- lignes dont la classe change au seuil 0.5
+- mémoire des tableaux (float64 → compact)
+
+Usage :
+    PYTHONPATH=. python -m scripts.forest_precision_report [modèle ...]
+"""
+
+import json
+import sys
+
+import joblib
+import numpy as np
+
+import src.ml.model_registry as registry
+from src.ml.native import CompiledForest, compile_model, precision_drift
+
+
+def forest_precision_report(names: list[str] | None = None) -> dict:
+    """
+    Rapport par modèle (ou raison pour laquelle il est ignoré).
+    """
+    paths = registry._model_paths(registry._read_metadata())
+    X_test = np.load(registry.BASE_PATH / "e02_X_test_final.npy")
+
+    report = {}
+
+    for name in names or list(paths):
+        path = paths[name]
+        if path.suffix != ".joblib" or not path.exists():
+            report[name] = f"skipped: no joblib artifact at {path}"
+            continue
+
+        model = joblib.load(path)
+
+        try:
+            native = compile_model(model)
+        except ValueError as e:
+            report[name] = f"skipped: {e}"
+            continue
+
+        if not isinstance(native, CompiledForest):
+            report[name] = "skipped: not a forest"
+            continue
+
+        compact = native.compact()
+
+        report[name] = {
+            "nodes": native.n_nodes,
+            "bytes": {"float64": native.nbytes, "compact": compact.nbytes},
+            "vs_sklearn": precision_drift(model, compact, X_test),
+            "vs_native": precision_drift(native, compact, X_test),
+        }
+
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(forest_precision_report(sys.argv[1:]), indent=2))
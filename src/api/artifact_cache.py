@@ -0,0 +1,272 @@
+# futurisys-ml-deploy/src/api/artifact_cache.py
+
+"""
+Cache des réponses des endpoints en lecture seule (artefacts) :
+/metrics/summary, /metrics/{filename}, /docs/{doc_name}, /metadata/,
+/models/.
+
+Chaque réponse est construite une seule fois par version de ses
+sources (chemin + mtime + taille des fichiers, ou génération du
+registry), puis conservée sous forme finale :
+- corps JSON pré-sérialisé (mêmes options que JSONResponse) et sa
+  version gzip (à partir de ARTIFACT_CACHE_GZIP_MIN_BYTES)
+- ETag faible (empreinte du corps, commune aux deux encodages) et
+  Last-Modified (mtime le plus récent des sources)
+
+Une requête servie depuis le cache ne coûte qu'un stat() par fichier
+source : ni lecture, ni parsing, ni encodage JSON. If-None-Match
+(prioritaire) ou If-Modified-Since → 304 sans corps.
+
+Configuration (variables d'environnement) :
+- ARTIFACT_CACHE_GZIP_MIN_BYTES : taille minimale d'un corps compressé
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+# ============================================================
+# Configuration
+# ============================================================
+
+ARTIFACT_CACHE_GZIP_MIN_BYTES = int(
+    os.getenv("ARTIFACT_CACHE_GZIP_MIN_BYTES", "512"),
+)
+
+# Revalidation systématique : le client garde le corps, le serveur
+# répond 304 tant que les sources n'ont pas changé
+CACHE_CONTROL = "no-cache"
+
+# ============================================================
+# Cached payload
+# ============================================================
+
+
+class CachedPayload:
+    """
+    Réponse prête à l'envoi (corps, gzip, validateurs).
+    """
+
+    __slots__ = ("signature", "body", "gzipped", "etag", "last_modified_s")
+
+    def __init__(
+        self,
+        signature: Hashable,
+        body: bytes,
+        last_modified_s: int,
+        gzip_min_bytes: int = ARTIFACT_CACHE_GZIP_MIN_BYTES,
+    ):
+        self.signature = signature
+        self.body = body
+        self.last_modified_s = last_modified_s
+
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self.etag = f'W/"{digest}"'
+
+        # mtime=0 : compression déterministe
+        self.gzipped = None
+        if len(body) >= gzip_min_bytes:
+            self.gzipped = gzip.compress(body, mtime=0)
+
+    @property
+    def last_modified(self) -> str:
+        return formatdate(self.last_modified_s, usegmt=True)
+
+    def not_modified(self, request: Request) -> bool:
+        """
+        Validateurs de la requête (If-None-Match prioritaire).
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # Comparaison faible : W/ ignoré
+            tags = if_none_match.split(",")
+            opaque = self.etag.removeprefix("W/")
+            return any(t.strip().removeprefix("W/") == opaque for t in tags)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified_s <= since
+
+        return False
+
+    def response(self, request: Request) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Last-Modified": self.last_modified,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        if self.not_modified(request):
+            return Response(status_code=304, headers=headers)
+
+        body = self.body
+        accept = request.headers.get("accept-encoding", "")
+        if self.gzipped is not None and accepts_gzip(accept):
+            body = self.gzipped
+            headers["Content-Encoding"] = "gzip"
+
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Jeton gzip présent dans Accept-Encoding avec q > 0
+    ("gzip;q=0" est un refus explicite).
+    """
+    for token in accept_encoding.split(","):
+        coding, *params = token.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        return q > 0
+
+    return False
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Sérialisation identique à JSONResponse (jsonable_encoder inclus).
+    """
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# ============================================================
+# Artifact cache
+# ============================================================
+
+
+class ArtifactCache:
+    """
+    Réponses par clé (route + paramètres), reconstruites dès que la
+    signature des sources change. Nombre d'entrées borné par les
+    fichiers servis (les clés inconnues sont rejetées par les routes).
+    """
+
+    def __init__(self, gzip_min_bytes: int = ARTIFACT_CACHE_GZIP_MIN_BYTES):
+        self.gzip_min_bytes = gzip_min_bytes
+
+        self._entries: Dict[Hashable, CachedPayload] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(
+        self,
+        key: Hashable,
+        build: Callable[[], Any],
+        paths: Sequence[Path] = (),
+        version: Hashable = None,
+        modified_ns: int | None = None,
+    ) -> CachedPayload:
+        """
+        Entrée à jour pour ``key`` ; ``build`` n'est appelé que si
+        ``paths`` (mtime, taille) ou ``version`` ont changé.
+        Les exceptions de ``build`` (HTTPException…) ne sont pas mises
+        en cache.
+        """
+        stats = [path.stat() for path in paths]
+        signature = (
+            version,
+            tuple(
+                (str(path), st.st_mtime_ns, st.st_size)
+                for path, st in zip(paths, stats)
+            ),
+        )
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature:
+            self.hits += 1
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self.hits += 1
+                return entry
+
+            mtimes = [st.st_mtime_ns for st in stats]
+            if modified_ns is not None:
+                mtimes.append(modified_ns)
+            last_modified_s = (
+                max(mtimes) // 1_000_000_000 if mtimes else int(time.time())
+            )
+
+            entry = CachedPayload(
+                signature,
+                render_json(build()),
+                last_modified_s,
+                self.gzip_min_bytes,
+            )
+            self._entries[key] = entry
+            self.misses += 1
+
+        return entry
+
+    def serve(self, request: Request, key: Hashable, build, **kwargs):
+        """
+        Réponse HTTP (200, 200 gzip ou 304) pour ``key``
+        (arguments : cf. get).
+        """
+        entry = self.get(key, build, **kwargs)
+        response = entry.response(request)
+        if response.status_code == 304:
+            self.not_modified += 1
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        entries = list(self._entries.values())
+        return {
+            "entries": len(entries),
+            "bytes": sum(len(e.body) for e in entries),
+            "gzip_bytes": sum(len(e.gzipped or b"") for e in entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+
+_cache = ArtifactCache()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    return _cache
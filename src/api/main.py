@@ -1,19 +1,36 @@
 # futurisys-ml-deploy/src/api/main.py
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
+from src.api.profiling import ProfilingMiddleware
+from src.api.routes.admin import router as admin_router
 from src.api.routes.docs_api import router as docs_router  # 👈 NOUVEAU
 from src.api.routes.metadata import router as metadata_router
 from src.api.routes.metrics import router as metrics_router
 from src.api.routes.models import router as models_router
 from src.api.routes.predictions import router as predictions_router
+from src.api.routes.profiles import router as profiles_router
+from src.api.routes.runtime import router as runtime_router
+from src.api.timing import ServerTimingMiddleware, TimedJSONResponse
+from src.api.warmup import lifespan, warmup_state
 
 app = FastAPI(
     title="Futurisys ML API",
     description="API MLOps – Dataset, Prediction & Artefacts",
     version="1.1.0",
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
 )
 
+# ============================================================
+# Middleware (mesure des étapes, en-tête Server-Timing ;
+# profilage à la demande, ajouté en dernier = le plus externe)
+# ============================================================
+
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(ProfilingMiddleware)
+
 # ============================================================
 # Routes datasets
 # ============================================================
@@ -49,6 +66,19 @@ app.include_router(metrics_router)
 
 app.include_router(docs_router)
 
+# ============================================================
+# Routes runtime (statistiques d'inférence)
+# ============================================================
+
+app.include_router(runtime_router)
+
+# ============================================================
+# Routes admin (rechargement à chaud des modèles, profilage)
+# ============================================================
+
+app.include_router(admin_router)
+app.include_router(profiles_router)
+
 # ============================================================
 # Root / health
 # ============================================================
@@ -57,3 +87,14 @@ app.include_router(docs_router)
 @app.get("/", tags=["health"])
 def root():
     return {"status": "ok", "service": "futurisys-ml-api"}
+
+
+@app.get("/ready", tags=["health"])
+def ready():
+    """
+    Readiness : 200 une fois le warm-up terminé, 503 sinon.
+    """
+    return JSONResponse(
+        status_code=200 if warmup_state.ready else 503,
+        content=warmup_state.as_dict(),
+    )
@@ -0,0 +1,46 @@
+# futurisys-ml-deploy/src/api/offload.py
+
+"""
+Exécution de l'inférence synchrone hors de l'event loop, pour les routes.
+"""
+
+from contextlib import contextmanager
+
+from fastapi import HTTPException, status
+
+from src.ml.batching import MicroBatchQueueFull, MicroBatchTimeout
+from src.ml.executor import InferenceQueueFull, get_inference_executor
+from src.ml.pool import InferencePoolTimeout
+
+
+@contextmanager
+def inference_errors():
+    """
+    Erreurs de saturation de l'inférence → réponses HTTP, communes à
+    l'exécuteur et au micro-batching :
+    - exécuteur ou file de micro-batch saturé → 503 + Retry-After
+      (délai estimé par le composant saturé)
+    - timeout du pool ou du micro-batch → 504
+    """
+    try:
+        yield
+    except (InferenceQueueFull, MicroBatchQueueFull) as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_s)},
+        )
+    except (InferencePoolTimeout, MicroBatchTimeout) as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e),
+        )
+
+
+async def offload(fn, *args, **kwargs):
+    """
+    Inférence synchrone exécutée par l'exécuteur borné (hors event loop).
+    Erreurs de saturation traduites par inference_errors.
+    """
+    with inference_errors():
+        return await get_inference_executor().run(fn, *args, **kwargs)
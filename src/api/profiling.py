@@ -0,0 +1,114 @@
+# futurisys-ml-deploy/src/api/profiling.py
+
+"""
+Profilage à la demande des requêtes HTTP (cf. src/core/profiling.py).
+
+Une requête est profilée :
+- par tirage, avec la probabilité PROFILE_SAMPLE_RATE (modifiable à
+  chaud via POST /admin/profiling), hors routes /admin
+- sur demande, avec l'en-tête ``X-Profile: 1`` accompagné d'un
+  ``X-Admin-Token`` valide (sans jeton valide, l'en-tête est ignoré)
+
+L'identifiant du profil est renvoyé dans l'en-tête ``X-Profile-Id`` ;
+le profil se télécharge via GET /admin/profiles/{profile_id}.
+
+Configuration (variables d'environnement) :
+- PROFILE_SAMPLE_RATE : fraction des requêtes profilées (0 = désactivé)
+"""
+
+import os
+import random
+
+from src.api.routes.admin import is_admin_token
+from src.core.profiling import StackSampler, get_stack_sampler
+
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+EXCLUDED_PREFIX = "/admin"
+
+
+class ProfilingPolicy:
+    """
+    Décide quelles requêtes profiler.
+    """
+
+    def __init__(self, sample_rate: float = PROFILE_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+
+    def reason(self, scope) -> str | None:
+        """
+        "header", "sampled" ou None (requête non profilée).
+        """
+        headers = dict(scope.get("headers") or ())
+
+        if headers.get(PROFILE_HEADER) == b"1":
+            token = headers.get(ADMIN_TOKEN_HEADER, b"").decode("latin-1")
+            if is_admin_token(token):
+                return "header"
+
+        if self.sample_rate <= 0 or scope["path"].startswith(EXCLUDED_PREFIX):
+            return None
+        if random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    def stats(self) -> dict:
+        return {"sample_rate": self.sample_rate}
+
+
+_policy = ProfilingPolicy()
+
+
+def get_profiling_policy() -> ProfilingPolicy:
+    return _policy
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI pur : ne coûte qu'un tirage aléatoire par requête
+    non profilée.
+    """
+
+    def __init__(
+        self,
+        app,
+        policy: ProfilingPolicy | None = None,
+        sampler: StackSampler | None = None,
+    ):
+        self.app = app
+        self.policy = policy or get_profiling_policy()
+        self.sampler = sampler or get_stack_sampler()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        reason = self.policy.reason(scope)
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        profile, token = self.sampler.start(label, reason)
+        status = None
+
+        async def send_with_profile_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-profile-id", profile.id.encode("latin-1")),
+                    ],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            self.sampler.stop(profile, token, status)
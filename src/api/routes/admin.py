@@ -0,0 +1,61 @@
+# futurisys-ml-deploy/src/api/routes/admin.py
+
+"""
+Routes d'administration, protégées par le header X-Admin-Token.
+Désactivées (403) si ADMIN_TOKEN n'est pas défini.
+"""
+
+import asyncio
+import os
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from src.ml.model_registry import RegistryReloadError, reload_registry
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+def is_admin_token(token: str | None) -> bool:
+    """
+    Vérification à temps constant (toujours faux si ADMIN_TOKEN absent).
+    """
+    if not ADMIN_TOKEN:
+        return False
+    return secrets.compare_digest(token or "", ADMIN_TOKEN)
+
+
+def require_admin_token(x_admin_token: str | None = Header(None)):
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled",
+        )
+
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+        )
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@router.post("/reload")
+async def reload_models():
+    """
+    Recharge le registry depuis data/ml_artifacts sans interruption :
+    nouveau snapshot chargé et validé hors event loop, puis remplacé.
+    """
+    try:
+        return await asyncio.to_thread(reload_registry)
+    except RegistryReloadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Reload failed, previous models kept: {e}",
+        )
@@ -3,7 +3,9 @@
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+
+from src.api.artifact_cache import get_artifact_cache
 
 router = APIRouter(
     prefix="/docs",
@@ -31,12 +33,15 @@ ALLOWED_DOCS = {
 
 
 @router.get("/{doc_name}", summary="Get API documentation (Markdown)")
-def get_documentation(doc_name: str):
+def get_documentation(doc_name: str, request: Request):
     """
     Retrieve a Markdown documentation file.
 
     - **doc_name**: Name of the documentation
       (api, architecture, model, monitoring, tests, update_policy)
+
+    Served from cache until the file changes (ETag / Last-Modified,
+    304 Not Modified, gzip).
     """
 
     if doc_name not in ALLOWED_DOCS:
@@ -53,7 +58,12 @@ def get_documentation(doc_name: str):
             detail=f"Documentation file missing: {doc_file.name}",
         )
 
-    return {
-        "name": doc_name,
-        "content": doc_file.read_text(encoding="utf-8"),
-    }
+    return get_artifact_cache().serve(
+        request,
+        ("docs", doc_name),
+        lambda: {
+            "name": doc_name,
+            "content": doc_file.read_text(encoding="utf-8"),
+        },
+        paths=[doc_file],
+    )
@@ -1,16 +1,25 @@
 # futurisys-ml-deploy/src/api/routes/metadata.py
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from src.ml.model_registry import get_metadata
+from src.api.artifact_cache import get_artifact_cache
+from src.ml.model_registry import get_snapshot
 
 router = APIRouter(prefix="/metadata", tags=["metadata"])
 
 
 @router.get("/")
-def metadata():
+def metadata(request: Request):
     """
     Retourne les métadonnées complètes des artefacts ML.
-    Lecture seule.
+    Lecture seule ; réponse mise en cache par snapshot du registry
+    (ETag / Last-Modified de metadata.json, 304, gzip).
     """
-    return get_metadata()
+    snapshot = get_snapshot()
+    return get_artifact_cache().serve(
+        request,
+        ("metadata",),
+        lambda: snapshot.metadata,
+        version=snapshot.generation,
+        modified_ns=snapshot.metadata_mtime_ns,
+    )
@@ -3,18 +3,32 @@
 from pathlib import Path
 
 import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+
+from src.api.artifact_cache import get_artifact_cache
+from src.api.offload import offload
+from src.ml.evaluation import get_model_evaluator
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 METRICS_PATH = Path("data/ml_artifacts/metrics")
 
 
+def _records(df: pd.DataFrame) -> list:
+    """
+    Lignes du DataFrame ; cellules vides (NaN) → null
+    (NaN n'est pas du JSON valide).
+    """
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
 @router.get("/summary")
-def get_metrics_summary():
+def get_metrics_summary(request: Request):
     """
     Retourne les métriques agrégées par modèle
     (utilisé par le dashboard Streamlit).
+    Servi depuis le cache tant que le CSV n'a pas changé
+    (ETag / Last-Modified, 304, gzip).
     """
     metrics_file = METRICS_PATH / "e04_rf_smote_test_metrics.csv"
 
@@ -24,6 +38,15 @@ def get_metrics_summary():
             detail="Summary metrics file not found",
         )
 
+    return get_artifact_cache().serve(
+        request,
+        ("metrics", "summary"),
+        lambda: _summary(metrics_file),
+        paths=[metrics_file],
+    )
+
+
+def _summary(metrics_file: Path) -> list:
     try:
         df = pd.read_csv(metrics_file)
     except Exception:
@@ -47,7 +70,7 @@ def get_metrics_summary():
         }
     )
 
-    return summary_df.to_dict(orient="records")
+    return _records(summary_df)
 
 
 @router.get("/")
@@ -61,10 +84,39 @@ def list_metrics():
     return {"metrics": [f.name for f in METRICS_PATH.glob("*.csv")]}
 
 
+# Routes "live" déclarées avant /{filename} (sinon capturées par elle)
+@router.get("/live")
+async def get_live_metrics():
+    """
+    Métriques recalculées sur le jeu de test pour chaque modèle servi
+    (version d'artefact incluse, cache par version).
+    Évaluation exécutée par l'exécuteur d'inférence borné.
+    """
+    return await offload(get_model_evaluator().evaluate_all)
+
+
+@router.get("/live/{model_name}")
+async def get_live_model_metrics(model_name: str):
+    """
+    Métriques recalculées pour un modèle
+    ("default" → modèle par défaut).
+    """
+    try:
+        return await offload(get_model_evaluator().evaluate, model_name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Model artifact unavailable: {e}",
+        )
+
+
 @router.get("/{filename}")
-def get_metric_file(filename: str):
+def get_metric_file(filename: str, request: Request):
     """
-    Retourne le contenu d'un fichier de métriques CSV.
+    Retourne le contenu d'un fichier de métriques CSV
+    (cache : cf. /summary).
     """
     if ".." in filename or "/" in filename:
         raise HTTPException(status_code=400, detail="Invalid filename")
@@ -80,6 +132,15 @@ def get_metric_file(filename: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Metric file not found")
 
+    return get_artifact_cache().serve(
+        request,
+        ("metrics", filename),
+        lambda: _metric_file(file_path),
+        paths=[file_path],
+    )
+
+
+def _metric_file(file_path: Path) -> dict:
     try:
         df = pd.read_csv(file_path)
     except Exception:
@@ -89,7 +150,7 @@ def get_metric_file(filename: str):
         )
 
     return {
-        "file": filename,
+        "file": file_path.name,
         "rows": len(df),
-        "data": df.to_dict(orient="records"),
+        "data": _records(df),
     }
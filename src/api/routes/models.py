@@ -1,23 +1,57 @@
 # futurisys-ml-deploy/src/api/routes/models.py
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 
-from src.ml.model_registry import DEFAULT_MODEL_NAME
+from src.api.artifact_cache import get_artifact_cache
+from src.api.offload import offload
+from src.api.schemas import ModelCompareInput, ModelCompareResponse
+from src.ml.inference import run_model_comparison
+from src.ml.model_registry import DEFAULT_MODEL_NAME, get_snapshot
+from src.ml.shadow import get_shadow_scorer
 
 router = APIRouter(prefix="/models", tags=["models"])
 
 
 @router.get("/")
-def list_models():
+def list_models(request: Request):
     """
-    Liste les modèles disponibles dans le registry.
+    Liste les modèles disponibles dans le registry
+    (cache par snapshot du registry, cf. /metadata).
     """
-    return {
-        "available_models": [
-            "dummy",
-            "logistic",
-            "random_forest",
-            "random_forest_e04",
-        ],
-        "default_model": DEFAULT_MODEL_NAME,
-    }
+    snapshot = get_snapshot()
+    return get_artifact_cache().serve(
+        request,
+        ("models",),
+        lambda: {
+            "available_models": list(snapshot.model_paths),
+            "default_model": DEFAULT_MODEL_NAME,
+        },
+        version=snapshot.generation,
+        modified_ns=snapshot.metadata_mtime_ns,
+    )
+
+
+@router.get("/shadow")
+def shadow_report():
+    """
+    Shadow scoring : pour chaque modèle candidat, taux d'accord avec
+    le modèle principal, écarts de probabilité et latences.
+    """
+    return get_shadow_scorer().stats()
+
+
+@router.post("/compare", response_model=ModelCompareResponse)
+async def compare_models(payload: ModelCompareInput):
+    """
+    Compare plusieurs modèles sur les mêmes lignes (une ou un lot) :
+    features préparées une fois, un passage vectorisé par modèle,
+    probabilités et latence de chaque modèle.
+    """
+    try:
+        return await offload(
+            run_model_comparison,
+            [item.model_dump(mode="json") for item in payload.items],
+            payload.models,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
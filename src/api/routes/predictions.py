@@ -5,6 +5,7 @@ Routes de gestion des prédictions ML (DB-first).
 - Soumission de requêtes de prédiction
 - Consultation des résultats (polling)
 - Historique des prédictions
+- Explications (contributions par feature)
 - Aucune inférence ML n'est exécutée ici
 """
 
@@ -14,16 +15,32 @@ from typing import List
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.api.schemas.input import PredictionInput
-from src.api.schemas.output import (  # fmt: off; fmt: on;
+from src.api.offload import inference_errors, offload
+from src.api.schemas import (
+    PredictionBatchInput,
+    PredictionBatchItemError,
+    PredictionBatchItemResult,
+    PredictionBatchResponse,
+    PredictionExplainBatchInput,
+    PredictionExplainResponse,
+    PredictionInput,
     PredictionResultResponse,
 )
+from src.core.timing import stage
 from src.db.session import get_async_session
-from src.ml.inference import run_inference
+from src.ml.batching import MICROBATCH_ENABLED, get_micro_batcher
+from src.ml.inference import (
+    run_batch_inference,
+    run_explanation,
+    run_inference,
+)
+from src.ml.model_registry import DEFAULT_MODEL_NAME
+from src.ml.session import get_inference_session
 from src.models.enums import PredictionStatus
 from src.models.prediction_request import PredictionRequest
 from src.models.prediction_result import PredictionResult
@@ -45,9 +62,14 @@ router = APIRouter(
 )
 async def submit_prediction_request(
     payload: PredictionInput,
-    model_name: str = Query("default"),
+    model_name: str = Query(DEFAULT_MODEL_NAME),
     session: AsyncSession = Depends(get_async_session),
 ):
+    try:
+        get_inference_session(model_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     request_uuid = str(uuid4())
     now = datetime.now(UTC)
 
@@ -66,24 +88,34 @@ async def submit_prediction_request(
     session.add(prediction_request)
     await session.flush()  # 🔑 get DB id
 
-    # 2️⃣ Run inference
+    # 2️⃣ Run inference (micro-batchée si activée)
     start = perf_counter()
 
-    result = run_inference(
-        payload.dict(),
-        model_name=model_name,
-    )
+    with inference_errors():
+        if MICROBATCH_ENABLED:
+            result = await get_micro_batcher().submit(
+                payload.model_dump(mode="json"),
+                model_name=model_name,
+            )
+        else:
+            result = await offload(
+                run_inference,
+                payload.model_dump(mode="json"),
+                model_name=model_name,
+            )
 
     latency_ms = (perf_counter() - start) * 1000
 
     prediction = result["prediction"]
     probability = result["probability"]
+    probability_exact = result.get("probability_exact", True)
 
     # 3️⃣ Save result
     prediction_result = PredictionResult(
         request_id=prediction_request.id,
         prediction=prediction,
         probability=probability,
+        probability_exact=probability_exact,
         latency_ms=latency_ms,
         created_at=now,
     )
@@ -101,10 +133,142 @@ async def submit_prediction_request(
         status=PredictionStatus.completed.value,
         prediction=prediction,
         probability=probability,
+        probability_exact=probability_exact,
         created_at=now,
     )
 
 
+# ============================================================
+# SUBMIT PREDICTION BATCH
+# POST /predictions/batch
+# ============================================================
+@router.post(
+    "/batch",
+    response_model=PredictionBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def submit_prediction_batch(
+    batch: PredictionBatchInput,
+    model_name: str = Query(DEFAULT_MODEL_NAME),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Score un lot d'entrées en un seul passage vectorisé.
+
+    - Chaque ligne est validée individuellement : les lignes invalides
+      sont reportées dans `errors` sans faire échouer le lot
+    - Les lignes valides sont scorées en un seul appel au modèle
+    - Les requêtes / résultats sont persistés en bloc (un flush, un commit)
+    """
+    try:
+        get_inference_session(model_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 1️⃣ Validation ligne par ligne
+    valid: List[tuple[int, PredictionInput]] = []
+    errors: List[PredictionBatchItemError] = []
+
+    with stage("validate"):
+        for index, item in enumerate(batch.items):
+            try:
+                valid.append((index, PredictionInput.model_validate(item)))
+            except ValidationError as e:
+                errors.append(
+                    PredictionBatchItemError(
+                        index=index,
+                        errors=e.errors(
+                            include_url=False,
+                            include_context=False,
+                        ),
+                    )
+                )
+
+    now = datetime.now(UTC)
+    results: List[PredictionBatchItemResult] = []
+    latency_ms = 0.0
+
+    if valid:
+        # 2️⃣ Create requests (bulk)
+        prediction_requests = [
+            PredictionRequest(
+                request_id=str(uuid4()),
+                model_name=model_name,
+                status=PredictionStatus.pending,
+                created_at=now,
+                age=payload.age,
+                revenu_mensuel=payload.revenu_mensuel,
+                annees_dans_l_entreprise=payload.annees_dans_l_entreprise,
+                frequence_deplacement=payload.frequence_deplacement.value,
+            )
+            for _, payload in valid
+        ]
+
+        session.add_all(prediction_requests)
+        await session.flush()  # 🔑 get DB ids (un seul aller-retour)
+
+        # 3️⃣ Run inference (une matrice, un appel modèle)
+        start = perf_counter()
+
+        outputs = await offload(
+            run_batch_inference,
+            [payload.model_dump(mode="json") for _, payload in valid],
+            model_name=model_name,
+        )
+
+        latency_ms = (perf_counter() - start) * 1000
+
+        # Latence amortie par ligne (colonne latency_ms de la DB)
+        row_latency_ms = latency_ms / len(valid)
+
+        # 4️⃣ Save results (bulk)
+        prediction_results = [
+            PredictionResult(
+                request_id=prediction_request.id,
+                prediction=output["prediction"],
+                probability=output["probability"],
+                probability_exact=output.get("probability_exact", True),
+                latency_ms=row_latency_ms,
+                created_at=now,
+            )
+            for prediction_request, output in zip(prediction_requests, outputs)
+        ]
+
+        session.add_all(prediction_results)
+
+        for prediction_request in prediction_requests:
+            prediction_request.status = PredictionStatus.completed
+
+        # 5️⃣ Commit transaction
+        await session.commit()
+
+        results = [
+            PredictionBatchItemResult(
+                index=index,
+                request_id=prediction_request.request_id,
+                status=PredictionStatus.completed.value,
+                prediction=output["prediction"],
+                probability=output["probability"],
+                probability_exact=output.get("probability_exact"),
+                model_name=model_name,
+                created_at=now,
+            )
+            for (index, _), prediction_request, output in zip(
+                valid, prediction_requests, outputs
+            )
+        ]
+
+    return PredictionBatchResponse(
+        model_name=model_name,
+        submitted=len(batch.items),
+        accepted=len(results),
+        rejected=len(errors),
+        inference_latency_ms=latency_ms,
+        results=results,
+        errors=errors,
+    )
+
+
 # ============================================================
 # PREDICTION HISTORY
 # GET /predictions/history
@@ -136,6 +300,7 @@ async def get_prediction_history(
                 status=PredictionStatus.completed.value,
                 prediction=r.prediction,
                 probability=r.probability,
+                probability_exact=r.probability_exact,
                 created_at=r.created_at,
             )
         )
@@ -194,5 +359,89 @@ async def get_prediction_result(
         status=PredictionStatus.completed.value,
         prediction=prediction_result.prediction,
         probability=prediction_result.probability,
+        probability_exact=prediction_result.probability_exact,
         created_at=prediction_result.created_at,
     )
+
+
+# ============================================================
+# EXPLANATIONS
+# POST /predictions/explain
+# GET /predictions/{request_id}/explain
+# ============================================================
+async def _explain(payloads, model_name: str, top_k: int) -> dict:
+    """
+    Modèle inconnu → 400 ; modèle sans méthode d'explication → 422.
+    """
+    try:
+        get_inference_session(model_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        return await offload(
+            run_explanation,
+            payloads,
+            model_name=model_name,
+            top_k=top_k,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/explain",
+    response_model=PredictionExplainResponse,
+)
+async def explain_prediction_batch(
+    batch: PredictionExplainBatchInput,
+    model_name: str = Query(DEFAULT_MODEL_NAME),
+    top_k: int = Query(10, ge=1),
+):
+    """
+    Contributions par feature d'un lot de lignes (sans persistance).
+    Tout le lot est expliqué en un seul parcours du modèle.
+    """
+    return await _explain(
+        [item.model_dump(mode="json") for item in batch.items],
+        model_name,
+        top_k,
+    )
+
+
+@router.get(
+    "/{request_id}/explain",
+    response_model=PredictionExplainResponse,
+)
+async def explain_prediction(
+    request_id: UUID,
+    top_k: int = Query(10, ge=1),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Contributions par feature d'une prédiction enregistrée, recalculées
+    à partir de ses entrées avec le modèle actuellement servi.
+    """
+    stmt = select(PredictionRequest).where(
+        PredictionRequest.request_id == str(request_id)
+    )
+    prediction_request = (await session.execute(stmt)).scalar_one_or_none()
+
+    if prediction_request is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Prediction request not found",
+        )
+
+    # Entrées telles que soumises (cf. PredictionInput)
+    payload = {
+        field: getattr(prediction_request, field)
+        for field in PredictionInput.model_fields
+    }
+
+    result = await _explain([payload], prediction_request.model_name, top_k)
+    result["explanations"][0]["request_id"] = prediction_request.request_id
+    return result
@@ -0,0 +1,68 @@
+# futurisys-ml-deploy/src/api/routes/profiles.py
+
+"""
+Profilage à la demande (cf. src/api/profiling.py), routes protégées
+par le header X-Admin-Token comme les autres routes /admin.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.api.profiling import get_profiling_policy
+from src.api.routes.admin import require_admin_token
+from src.core.profiling import get_stack_sampler
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@router.get("/profiling")
+def profiling_status():
+    """
+    Fraction de requêtes profilées et profils conservés
+    (les plus récents d'abord, sans les piles).
+    """
+    return {
+        **get_profiling_policy().stats(),
+        "profiles": get_stack_sampler().profiles(),
+    }
+
+
+@router.post("/profiling")
+def set_profiling(sample_rate: float = Query(..., ge=0.0, le=1.0)):
+    """
+    Modifie à chaud la fraction de requêtes profilées (0 = désactivé).
+    """
+    policy = get_profiling_policy()
+    policy.sample_rate = sample_rate
+    return policy.stats()
+
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT)
+def clear_profiles():
+    get_stack_sampler().clear()
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: str):
+    """
+    Profil au format "folded stacks" (flamegraph.pl, speedscope).
+    """
+    profile = get_stack_sampler().get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found (expired or unknown)",
+        )
+
+    return PlainTextResponse(
+        profile.folded(),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="profile-{profile.id}.folded"'
+            ),
+        },
+    )
@@ -0,0 +1,82 @@
+# futurisys-ml-deploy/src/api/routes/runtime.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.api.artifact_cache import get_artifact_cache
+from src.core.timing import get_stage_metrics
+from src.ml.batching import get_micro_batcher
+from src.ml.cache import get_prediction_cache
+from src.ml.executor import get_inference_executor
+from src.ml.model_registry import get_load_stats
+from src.ml.pool import get_inference_pool
+from src.ml.reload import get_metadata_watcher
+
+router = APIRouter(prefix="/runtime", tags=["runtime"])
+
+
+@router.get("/batching")
+def batching_stats():
+    """
+    Configuration et histogrammes du micro-batcher
+    (taille des lots, temps d'attente en file).
+    """
+    return get_micro_batcher().stats()
+
+
+@router.get("/artifacts")
+def artifact_cache_stats():
+    """
+    Cache des réponses en lecture seule (/metrics, /docs, /metadata,
+    /models) : entrées, taille des corps, hits, 304 servis.
+    """
+    return get_artifact_cache().stats()
+
+
+@router.get("/cache")
+def cache_stats():
+    """
+    Statistiques du cache de prédictions
+    (hits, misses, évictions, expirations, invalidations par version).
+    """
+    return get_prediction_cache().stats()
+
+
+@router.get("/executor")
+def executor_stats():
+    """
+    Exécuteur d'inférence borné : occupation des threads, temps
+    d'attente en file, durée d'exécution, requêtes refusées (503).
+    """
+    return get_inference_executor().stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def stage_metrics():
+    """
+    Histogrammes de durée par étape (normalize, prepare, predict,
+    db_flush, db_commit, serialize…), par route et par modèle,
+    au format texte Prometheus.
+    """
+    return PlainTextResponse(
+        get_stage_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@router.get("/models")
+def model_load_stats():
+    """
+    Modèles chargés (lazy) : temps de chargement et taille résidente,
+    génération du snapshot et état du rechargement à chaud.
+    """
+    return {**get_load_stats(), "reload": get_metadata_watcher().stats()}
+
+
+@router.get("/pool")
+def pool_stats():
+    """
+    Pool de processus d'inférence : configuration, tâches,
+    timeouts, redémarrages et modèles exportés.
+    """
+    return get_inference_pool().stats()
@@ -1,12 +1,39 @@
 # futurisys-ml-deploy/src/api/schemas/__init__.py
 
 from .enums import FrequenceDeplacement
-from .input import PredictionInput
-from .output import PredictionRequestResponse, PredictionResultResponse
+from .input import (
+    ModelCompareInput,
+    PredictionBatchInput,
+    PredictionExplainBatchInput,
+    PredictionInput,
+)
+from .output import (
+    FeatureContribution,
+    ModelCompareResponse,
+    ModelCompareResult,
+    PredictionBatchItemError,
+    PredictionBatchItemResult,
+    PredictionBatchResponse,
+    PredictionExplainResponse,
+    PredictionExplanation,
+    PredictionRequestResponse,
+    PredictionResultResponse,
+)
 
 __all__ = [
     "PredictionInput",
+    "PredictionBatchInput",
     "PredictionRequestResponse",
     "PredictionResultResponse",
+    "PredictionBatchItemError",
+    "PredictionBatchItemResult",
+    "PredictionBatchResponse",
+    "ModelCompareInput",
+    "ModelCompareResult",
+    "ModelCompareResponse",
+    "PredictionExplainBatchInput",
+    "FeatureContribution",
+    "PredictionExplanation",
+    "PredictionExplainResponse",
     "FrequenceDeplacement",
 ]
@@ -1,5 +1,7 @@
 # futurisys-ml-deploy/src/api/schemas/input.py
 
+from typing import Any, Dict, List, Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from .enums import FrequenceDeplacement
@@ -40,3 +42,111 @@ class PredictionInput(BaseModel):
             }
         }
     )
+
+
+# Taille maximale d'un lot (protection mémoire / durée de transaction)
+MAX_BATCH_SIZE = 5000
+
+
+class PredictionBatchInput(BaseModel):
+    """
+    Schéma d'entrée pour la prédiction ML par lot.
+
+    Les éléments sont validés individuellement (contre PredictionInput)
+    par la route : une ligne invalide est rejetée sans faire échouer
+    le lot complet.
+    """
+
+    items: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Liste des payloads à scorer (format PredictionInput)",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "age": 30,
+                        "revenu_mensuel": 5000,
+                        "annees_dans_l_entreprise": 5,
+                        "frequence_deplacement": "occasionnel",
+                    },
+                    {
+                        "age": 52,
+                        "revenu_mensuel": 7200,
+                        "annees_dans_l_entreprise": 20,
+                        "frequence_deplacement": "aucun",
+                    },
+                ]
+            }
+        }
+    )
+
+
+class ModelCompareInput(BaseModel):
+    """
+    Schéma d'entrée pour la comparaison de modèles.
+
+    Les lignes sont préparées une seule fois puis scorées par chaque
+    modèle demandé (tous les modèles du registry par défaut).
+    """
+
+    items: List[PredictionInput] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Lignes à scorer (une seule pour un salarié donné)",
+    )
+    models: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        description="Modèles à comparer (défaut : tous les modèles)",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "age": 30,
+                        "revenu_mensuel": 5000,
+                        "annees_dans_l_entreprise": 5,
+                        "frequence_deplacement": "occasionnel",
+                    }
+                ],
+                "models": ["logistic", "random_forest_e04"],
+            }
+        },
+    )
+
+
+class PredictionExplainBatchInput(BaseModel):
+    """
+    Schéma d'entrée pour l'explication d'un lot de lignes
+    (un seul parcours du modèle pour tout le lot).
+    """
+
+    items: List[PredictionInput] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Lignes à expliquer",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "age": 30,
+                        "revenu_mensuel": 5000,
+                        "annees_dans_l_entreprise": 5,
+                        "frequence_deplacement": "occasionnel",
+                    }
+                ]
+            }
+        },
+    )
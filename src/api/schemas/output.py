@@ -1,7 +1,7 @@
 # futurisys-ml-deploy/src/api/schemas/output.py
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -73,6 +73,15 @@ class PredictionResultResponse(BaseModel):
         json_schema_extra={"example": 0.87},
     )
 
+    probability_exact: Optional[bool] = Field(
+        default=None,
+        description=(
+            "False si la probabilité est approximative (sortie anticipée "
+            "d'une forêt : classe exacte, arbres partiellement évalués)"
+        ),
+        json_schema_extra={"example": True},
+    )
+
     # Métadonnées du modèle
     model_name: Optional[str] = Field(
         default=None,
@@ -91,3 +100,205 @@ class PredictionResultResponse(BaseModel):
         description="Date de création du résultat ou de la requête",
         json_schema_extra={"example": "2025-01-15T10:13:02Z"},
     )
+
+
+# ============================================================
+# RESPONSE FOR BATCH SCORING
+# POST /predictions/batch
+# ============================================================
+class PredictionBatchItemError(BaseModel):
+    """
+    Erreur de validation d'une ligne du lot.
+    """
+
+    index: int = Field(
+        ...,
+        description="Position de la ligne dans le lot soumis",
+        json_schema_extra={"example": 3},
+    )
+
+    errors: List[Dict[str, Any]] = Field(
+        ...,
+        description="Détail des erreurs de validation (format Pydantic)",
+    )
+
+
+class PredictionBatchItemResult(PredictionResultResponse):
+    """
+    Résultat d'une ligne valide du lot.
+    """
+
+    index: int = Field(
+        ...,
+        description="Position de la ligne dans le lot soumis",
+        json_schema_extra={"example": 0},
+    )
+
+
+class PredictionBatchResponse(BaseModel):
+    """
+    Réponse retournée après le scoring d'un lot.
+    """
+
+    model_name: str = Field(
+        ...,
+        description="Nom du modèle utilisé pour le lot",
+        json_schema_extra={"example": "random_forest_e04"},
+    )
+
+    submitted: int = Field(..., description="Nombre de lignes soumises")
+    accepted: int = Field(..., description="Nombre de lignes scorées")
+    rejected: int = Field(..., description="Nombre de lignes rejetées")
+
+    inference_latency_ms: float = Field(
+        ...,
+        description="Latence de l'inférence vectorisée pour tout le lot",
+        json_schema_extra={"example": 12.4},
+    )
+
+    results: List[PredictionBatchItemResult] = Field(default_factory=list)
+    errors: List[PredictionBatchItemError] = Field(default_factory=list)
+
+
+# ============================================================
+# RESPONSE FOR MODEL COMPARISON
+# POST /models/compare
+# ============================================================
+class ModelCompareResult(BaseModel):
+    """
+    Scores d'un modèle sur toutes les lignes comparées.
+    """
+
+    model_name: str = Field(
+        ...,
+        json_schema_extra={"example": "logistic"},
+    )
+
+    model_version: Optional[str] = Field(
+        None,
+        description="Version de l'artefact servi",
+    )
+
+    latency_ms: Optional[float] = Field(
+        None,
+        description="Latence du passage vectorisé du modèle (toutes lignes)",
+        json_schema_extra={"example": 1.8},
+    )
+
+    predictions: List[int] = Field(default_factory=list)
+    probabilities: List[float] = Field(default_factory=list)
+
+    error: Optional[str] = Field(
+        None,
+        description="Erreur de chargement / scoring (autres modèles servis)",
+    )
+
+
+class ModelCompareResponse(BaseModel):
+    """
+    Réponse de la comparaison multi-modèles.
+    """
+
+    rows: int = Field(..., description="Nombre de lignes comparées")
+
+    prepare_latency_ms: float = Field(
+        ...,
+        description="Préparation de la matrice de features (une seule fois)",
+    )
+
+    results: List[ModelCompareResult] = Field(default_factory=list)
+
+
+# ============================================================
+# RESPONSE FOR EXPLANATIONS
+# GET /predictions/{request_id}/explain
+# POST /predictions/explain
+# ============================================================
+class FeatureContribution(BaseModel):
+    """
+    Contribution d'une feature à la sortie du modèle.
+    """
+
+    feature: str = Field(..., json_schema_extra={"example": "age"})
+
+    value: float = Field(
+        ...,
+        description="Valeur de la feature transmise au modèle",
+        json_schema_extra={"example": 30.0},
+    )
+
+    contribution: float = Field(
+        ...,
+        description="Part de la sortie attribuée à la feature",
+        json_schema_extra={"example": -0.042},
+    )
+
+
+class PredictionExplanation(BaseModel):
+    """
+    Explication d'une ligne : base_value + somme des contributions
+    (toutes features) = output_value.
+    """
+
+    request_id: Optional[str] = Field(
+        None,
+        description="Requête expliquée (absent pour une explication de lot)",
+    )
+
+    output_value: float = Field(
+        ...,
+        description="Sortie expliquée (probabilité ou log-odds)",
+    )
+
+    probability: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Probabilité de la classe positive",
+        json_schema_extra={"example": 0.87},
+    )
+
+    contributions: List[FeatureContribution] = Field(
+        default_factory=list,
+        description="Contributions triées par valeur absolue décroissante",
+    )
+
+
+class PredictionExplainResponse(BaseModel):
+    """
+    Explications d'une ou plusieurs lignes par un même modèle.
+    """
+
+    model_name: str = Field(
+        ...,
+        json_schema_extra={"example": "random_forest_e04"},
+    )
+
+    model_version: Optional[str] = Field(
+        None,
+        description="Version de l'artefact servi",
+    )
+
+    method: str = Field(
+        ...,
+        description="path_attribution (forêts) ou linear (coef x valeur)",
+        json_schema_extra={"example": "path_attribution"},
+    )
+
+    output: str = Field(
+        ...,
+        description="Espace de la sortie expliquée : probability ou log_odds",
+        json_schema_extra={"example": "probability"},
+    )
+
+    base_value: float = Field(
+        ...,
+        description="Sortie moyenne du modèle (ou intercept)",
+    )
+
+    explain_latency_ms: float = Field(
+        ...,
+        description="Latence du calcul des contributions (tout le lot)",
+    )
+
+    explanations: List[PredictionExplanation] = Field(default_factory=list)
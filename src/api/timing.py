@@ -0,0 +1,94 @@
+# futurisys-ml-deploy/src/api/timing.py
+
+"""
+Mesure des étapes côté HTTP (cf. src/core/timing.py).
+
+- ServerTimingMiddleware (ASGI) : ouvre le contexte de mesure de chaque
+  requête, ajoute l'en-tête ``Server-Timing`` à la réponse et agrège les
+  étapes par route (gabarit de chemin, ex. /predictions/{request_id})
+- TimedJSONResponse : mesure la sérialisation JSON (étape "serialize")
+
+Configuration (variables d'environnement) :
+- SERVER_TIMING_HEADER : "0" pour ne pas exposer l'en-tête
+  (les histogrammes restent alimentés)
+"""
+
+import os
+from time import perf_counter
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from src.core.timing import (
+    begin_request,
+    end_request,
+    get_stage_metrics,
+    record_stage,
+)
+
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "1") == "1"
+
+# Requêtes sans route correspondante (404) : une seule étiquette
+UNMATCHED_ROUTE = "unmatched"
+
+
+class TimedJSONResponse(JSONResponse):
+    """
+    JSONResponse dont le rendu est mesuré (étape "serialize").
+    """
+
+    def render(self, content: Any) -> bytes:
+        start = perf_counter()
+        body = super().render(content)
+        record_stage("serialize", perf_counter() - start)
+        return body
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware ASGI pur (pas de BaseHTTPMiddleware : ni tâche ni file
+    supplémentaire par requête).
+    """
+
+    def __init__(self, app, header: bool = SERVER_TIMING_HEADER):
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = begin_request()
+        start = perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_s = perf_counter() - start
+
+                # Étiquettes bornées : gabarit de route, méthode vide
+                # pour les chemins inconnus (valeurs choisies par le client)
+                route = scope.get("route")
+                get_stage_metrics().observe_request(
+                    scope["method"] if route is not None else "",
+                    getattr(route, "path", UNMATCHED_ROUTE),
+                    timings,
+                    total_s,
+                )
+
+                if self.header:
+                    value = timings.server_timing(total_s)
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"server-timing", value.encode("latin-1")),
+                        ],
+                    }
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(token)
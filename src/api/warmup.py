@@ -0,0 +1,217 @@
+# futurisys-ml-deploy/src/api/warmup.py
+
+"""
+Phase de warm-up au démarrage (FastAPI lifespan).
+
+Avant de déclarer l'instance prête (GET /ready), on :
+- charge les features, les métadonnées et le plan de features
+- démarre le pool de processus d'inférence (si INFERENCE_POOL_SIZE > 0)
+- charge les modèles configurés et exécute une inférence synthétique
+- précalcule les tables d'explication des modèles explicables
+- ouvre un nombre minimal de connexions DB poolées (TLS inclus)
+
+Configuration (variables d'environnement) :
+- WARMUP_ENABLED        : "0" pour désactiver (prêt immédiatement)
+- WARMUP_MODELS         : modèles à préchauffer (séparés par des virgules)
+- WARMUP_DB_CONNECTIONS : connexions DB à ouvrir (0 = aucune)
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from src.ml.features import get_feature_plan
+from src.ml.inference import normalize_payload
+from src.ml.model_registry import WARMUP_MODELS, get_metadata
+from src.ml.pool import get_inference_pool
+from src.ml.reload import get_metadata_watcher
+from src.ml.session import get_inference_session
+from src.ml.shadow import get_shadow_scorer
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "1") == "1"
+WARMUP_DB_CONNECTIONS = int(os.getenv("WARMUP_DB_CONNECTIONS", "2"))
+
+# WARMUP_MODELS est lu par le registry (validé aussi à chaque rechargement)
+
+# Payload synthétique (exemple du schéma PredictionInput)
+SYNTHETIC_PAYLOAD = {
+    "age": 30,
+    "revenu_mensuel": 5000,
+    "annees_dans_l_entreprise": 5,
+    "frequence_deplacement": "occasionnel",
+}
+
+# ============================================================
+# Readiness state
+# ============================================================
+
+
+class WarmupState:
+    """
+    Etat du warm-up, exposé par GET /ready.
+    """
+
+    def __init__(self):
+        self.status = "pending"  # pending | running | ready | failed
+        self.duration_ms: float | None = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def as_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "steps": self.steps,
+        }
+
+
+warmup_state = WarmupState()
+
+
+# ============================================================
+# Warm-up steps
+# ============================================================
+
+
+def _warm_artifacts() -> dict:
+    metadata = get_metadata()
+    plan = get_feature_plan()
+    return {
+        "artifacts_version": metadata.get("artifacts_version"),
+        "n_features": plan.n_features,
+    }
+
+
+def _warm_model(model_name: str) -> dict:
+    session = get_inference_session(model_name)
+    result = session.predict(normalize_payload(SYNTHETIC_PAYLOAD))
+
+    # Tables d'explication précalculées au chargement (si explicable)
+    try:
+        explanation = session.explainer.method
+    except ValueError:
+        explanation = None
+
+    return {
+        "model": session.model_name,
+        "probability": result["probability"],
+        "explanation": explanation,
+    }
+
+
+def _warm_pool() -> dict:
+    pool = get_inference_pool()
+    pool.start()
+    return {"processes": pool.size}
+
+
+async def _warm_db(n_connections: int) -> dict:
+    from src.db.session import engine
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Connexions ouvertes simultanément : le pool en conserve n_connections
+    await asyncio.gather(*[_ping() for _ in range(n_connections)])
+
+    return {"connections": n_connections}
+
+
+async def _run_step(name: str, step: Callable, *args) -> None:
+    start = perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(step):
+            detail = await step(*args)
+        else:
+            detail = await asyncio.to_thread(step, *args)
+    except Exception as e:
+        warmup_state.steps[name] = {
+            "status": "failed",
+            "duration_ms": (perf_counter() - start) * 1000,
+            "error": f"{type(e).__name__}: {e}",
+        }
+        logger.exception("Warm-up step %s failed", name)
+        return
+
+    warmup_state.steps[name] = {
+        "status": "ok",
+        "duration_ms": (perf_counter() - start) * 1000,
+        **detail,
+    }
+
+
+async def run_warmup() -> None:
+    """
+    Exécute toutes les étapes ; l'instance n'est prête que si
+    toutes les étapes ont réussi.
+    """
+    warmup_state.status = "running"
+    start = perf_counter()
+
+    await _run_step("artifacts", _warm_artifacts)
+
+    if get_inference_pool().enabled:
+        await _run_step("pool", _warm_pool)
+
+    for model_name in WARMUP_MODELS:
+        await _run_step(f"model:{model_name}", _warm_model, model_name)
+
+    if WARMUP_DB_CONNECTIONS > 0:
+        await _run_step("db", _warm_db, WARMUP_DB_CONNECTIONS)
+
+    warmup_state.duration_ms = (perf_counter() - start) * 1000
+
+    steps = warmup_state.steps
+    failed = [name for name, step in steps.items() if step["status"] != "ok"]
+    warmup_state.status = "failed" if failed else "ready"
+
+    logger.info("Warm-up %s", warmup_state.as_dict())
+
+
+# ============================================================
+# Lifespan
+# ============================================================
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Le warm-up tourne en tâche de fond : GET / (liveness) répond
+    immédiatement, GET /ready (readiness) attend la fin du warm-up.
+    La scrutation de metadata.json (MODEL_RELOAD_POLL_S) démarre
+    avec l'application.
+    """
+    task = None
+
+    if WARMUP_ENABLED:
+        task = asyncio.create_task(run_warmup())
+    else:
+        warmup_state.status = "ready"
+
+    watcher = get_metadata_watcher()
+    watcher.start()
+
+    yield
+
+    watcher.stop()
+    get_shadow_scorer().stop()
+    get_inference_pool().shutdown()
+
+    if task is not None and not task.done():
+        task.cancel()
@@ -0,0 +1,62 @@
+# futurisys-ml-deploy/src/core/metrics.py
+
+"""
+Primitives de mesure runtime (in-process, sans dépendance externe).
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Sequence
+
+# ============================================================
+# Histogram
+# ============================================================
+
+
+class Histogram:
+    """
+    Histogramme à buckets fixes (bornes supérieures inclusives).
+    Thread-safe, coût d'observation O(log buckets).
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # +Inf en dernier
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+            self._count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+    def snapshot(self) -> dict:
+        """
+        Etat courant : buckets cumulés (format Prometheus), somme, total.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+
+        cumulative = []
+        running = 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts):
+            running += count
+            cumulative.append({"le": bound, "count": running})
+
+        return {
+            "count": total,
+            "sum": total_sum,
+            "mean": total_sum / total if total else None,
+            "buckets": cumulative,
+        }
@@ -0,0 +1,258 @@
+# futurisys-ml-deploy/src/core/profiling.py
+
+"""
+Profilage par échantillonnage de piles (requêtes en production).
+
+Un profil couvre une requête : un thread d'échantillonnage relève,
+toutes les PROFILE_INTERVAL_S secondes, la pile Python des threads
+rattachés à la requête (thread de l'event loop, threads d'inférence
+via attach_thread, cf. src/ml/executor.py).
+
+Contrairement à cProfile (un seul profileur par thread, qui verrait
+toutes les coroutines de l'event loop), l'échantillonnage supporte
+plusieurs profils simultanés et ne coûte rien hors profilage (le
+thread ne tourne que si un profil est actif). Le thread de l'event
+loop étant partagé, ses échantillons peuvent inclure d'autres
+requêtes concurrentes.
+
+Les profils terminés sont conservés dans un anneau borné (les plus
+récents), au format "folded stacks" (flamegraph.pl, speedscope).
+
+Configuration (variables d'environnement) :
+- PROFILE_INTERVAL_S : période d'échantillonnage (secondes)
+- PROFILE_RING_SIZE  : nombre de profils conservés
+- PROFILE_MAX_DEPTH  : profondeur maximale des piles relevées
+"""
+
+import os
+import sys
+import threading
+import uuid
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from time import perf_counter, sleep
+from typing import Any, Dict, List
+
+# ============================================================
+# Configuration
+# ============================================================
+
+PROFILE_INTERVAL_S = float(os.getenv("PROFILE_INTERVAL_S", "0.001"))
+PROFILE_RING_SIZE = int(os.getenv("PROFILE_RING_SIZE", "32"))
+PROFILE_MAX_DEPTH = int(os.getenv("PROFILE_MAX_DEPTH", "64"))
+
+# ============================================================
+# Request profile
+# ============================================================
+
+
+class RequestProfile:
+    """
+    Échantillons de piles d'une requête.
+    """
+
+    def __init__(self, label: str, reason: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.label = label
+        self.reason = reason  # sampled | header
+        self.started_at = datetime.now(UTC)
+        self.duration_ms: float | None = None
+        self.status: int | None = None
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.threads: set[int] = set()
+        self._start = perf_counter()
+
+    def finish(self, status: int | None) -> None:
+        self.duration_ms = (perf_counter() - self._start) * 1000
+        self.status = status
+
+    def folded(self) -> str:
+        """
+        Format "folded stacks" : ``frame;frame;frame <échantillons>``.
+        """
+        stacks = self.stacks.most_common()
+        return "".join(f"{';'.join(s)} {count}\n" for s, count in stacks)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "label": self.label,
+            "reason": self.reason,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+        }
+
+
+_current: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile",
+    default=None,
+)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_qualname}:{frame.f_lineno}"
+
+
+# ============================================================
+# Sampler + ring
+# ============================================================
+
+
+class StackSampler:
+    """
+    Thread d'échantillonnage partagé par les profils actifs,
+    et anneau des profils terminés.
+    """
+
+    def __init__(
+        self,
+        interval_s: float = PROFILE_INTERVAL_S,
+        ring_size: int = PROFILE_RING_SIZE,
+        max_depth: int = PROFILE_MAX_DEPTH,
+    ):
+        self.interval_s = interval_s
+        self.max_depth = max_depth
+
+        self._active: List[RequestProfile] = []
+        self._ring: deque = deque(maxlen=ring_size)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+
+    # --------------------------------------------------------
+    # Profile lifecycle
+    # --------------------------------------------------------
+    def start(self, label: str, reason: str) -> tuple[RequestProfile, Token]:
+        """
+        Démarre un profil rattaché au thread courant et au contexte
+        courant (les threads attachés via attach_thread le rejoignent).
+        """
+        profile = RequestProfile(label, reason)
+        profile.threads.add(threading.get_ident())
+
+        with self._lock:
+            self._active.append(profile)
+            self._ensure_started()
+            self._wakeup.notify()
+
+        return profile, _current.set(profile)
+
+    def stop(
+        self,
+        profile: RequestProfile,
+        token: Token,
+        status: int | None,
+    ) -> None:
+        _current.reset(token)
+        profile.finish(status)
+
+        with self._lock:
+            self._active.remove(profile)
+            self._ring.append(profile)
+
+    # --------------------------------------------------------
+    # Ring access
+    # --------------------------------------------------------
+    def profiles(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [p.as_dict() for p in reversed(self._ring)]
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            for profile in self._ring:
+                if profile.id == profile_id:
+                    return profile
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ring.clear()
+
+    # --------------------------------------------------------
+    # Sampling thread
+    # --------------------------------------------------------
+    def _ensure_started(self) -> None:
+        """
+        Démarre le thread d'échantillonnage (lock tenu).
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="stack-sampler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                # En veille tant qu'aucun profil n'est actif
+                while not self._active:
+                    self._wakeup.wait()
+                active = list(self._active)
+
+            self._sample(active)
+            sleep(self.interval_s)
+
+    def _sample(self, active: List[RequestProfile]) -> None:
+        frames = sys._current_frames()
+        sampler = threading.get_ident()
+
+        for profile in active:
+            if profile.duration_ms is not None:  # terminé entre-temps
+                continue
+            for thread_id in list(profile.threads):
+                frame = frames.get(thread_id)
+                if frame is None or thread_id == sampler:
+                    continue
+
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+
+                profile.stacks[tuple(reversed(stack))] += 1
+                profile.samples += 1
+
+
+# ============================================================
+# Thread attachment
+# ============================================================
+
+
+@contextmanager
+def attach_thread():
+    """
+    Rattache le thread courant au profil de la requête en cours
+    (aucun effet hors profilage).
+    """
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+
+    thread_id = threading.get_ident()
+    profile.threads.add(thread_id)
+    try:
+        yield
+    finally:
+        profile.threads.discard(thread_id)
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_sampler = StackSampler()
+
+
+def get_stack_sampler() -> StackSampler:
+    return _sampler
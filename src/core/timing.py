@@ -0,0 +1,246 @@
+# futurisys-ml-deploy/src/core/timing.py
+
+"""
+Instrumentation par étape du traitement d'une requête.
+
+Étapes mesurées : normalize, validate, prepare, predict, queue_wait,
+microbatch, db_flush, db_commit, serialize.
+
+Pendant une requête HTTP (cf. src/api/timing.py), les durées sont
+accumulées dans le contexte de la requête (contextvar, propagé aux
+threads d'inférence) puis, en fin de requête :
+- renvoyées dans l'en-tête ``Server-Timing``
+- agrégées dans des histogrammes par (méthode, route, modèle, étape)
+
+Hors requête (collecte du micro-batch, thread shadow), les étapes
+alimentent directement les histogrammes (route "background").
+
+Coût d'une étape : deux perf_counter, une lecture de contextvar,
+un append (cf. tests/benchmarks/bench_stage_timing.py).
+"""
+
+import threading
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from src.core.metrics import Histogram
+
+# Buckets (secondes, convention Prometheus)
+STAGE_BUCKETS_S = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+# Garde-fou : étapes conservées par requête
+MAX_STAGES_PER_REQUEST = 64
+
+BACKGROUND_ROUTE = "background"
+METRIC_NAME = "futurisys_stage_duration_seconds"
+
+# ============================================================
+# Request context
+# ============================================================
+
+
+class RequestTimings:
+    """
+    Étapes d'une requête : (nom, secondes), dans l'ordre d'exécution.
+    """
+
+    __slots__ = ("stages", "model")
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+        self.model: str | None = None
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Durée cumulée par étape (ordre de première apparition).
+        """
+        totals: Dict[str, float] = {}
+        for name, seconds in self.stages:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return totals
+
+    def server_timing(self, total_s: float) -> str:
+        """
+        Valeur de l'en-tête Server-Timing (durées en ms).
+        """
+        parts = [
+            f"{name};dur={seconds * 1000:.3f}"
+            for name, seconds in self.totals().items()
+        ]
+        parts.append(f"total;dur={total_s * 1000:.3f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings",
+    default=None,
+)
+
+
+def begin_request() -> Tuple[RequestTimings, Token]:
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+# ============================================================
+# Stage histograms
+# ============================================================
+
+
+class StageMetrics:
+    """
+    Histogrammes par (méthode, route, modèle, étape).
+    """
+
+    def __init__(self, buckets=STAGE_BUCKETS_S):
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        model: str | None,
+        stage: str,
+        seconds: float,
+    ) -> None:
+        key = (method, route, model or "", stage)
+        histogram = self._histograms.get(key)
+
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    key,
+                    Histogram(self.buckets),
+                )
+
+        histogram.observe(seconds)
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        timings: RequestTimings,
+        total_s: float,
+    ) -> None:
+        for stage, seconds in timings.totals().items():
+            self.observe(method, route, timings.model, stage, seconds)
+        self.observe(method, route, timings.model, "total", total_s)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+
+    def render_prometheus(self) -> str:
+        """
+        Format texte d'exposition Prometheus (version 0.0.4).
+        """
+        lines = [
+            f"# HELP {METRIC_NAME} Durée des étapes de traitement.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+
+        with self._lock:
+            items = sorted(self._histograms.items())
+
+        for (method, route, model, stage), histogram in items:
+            labels = (
+                f'method="{_escape(method)}",route="{_escape(route)}",'
+                f'model="{_escape(model)}",stage="{_escape(stage)}"'
+            )
+            snapshot = histogram.snapshot()
+
+            for bucket in snapshot["buckets"]:
+                le = bucket["le"]
+                le = le if isinstance(le, str) else repr(float(le))
+                count = bucket["count"]
+                lines.append(
+                    f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {count}',
+                )
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {snapshot['sum']}")
+            lines.append(
+                f"{METRIC_NAME}_count{{{labels}}} {snapshot['count']}",
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_metrics = StageMetrics()
+
+
+def get_stage_metrics() -> StageMetrics:
+    return _metrics
+
+
+# ============================================================
+# Recording API
+# ============================================================
+
+
+def record_stage(name: str, seconds: float, model: str | None = None):
+    """
+    Enregistre une étape déjà mesurée.
+    ``model`` étiquette la requête (premier modèle rencontré).
+    """
+    timings = _current.get()
+
+    if timings is None:
+        _metrics.observe("", BACKGROUND_ROUTE, model, name, seconds)
+        return
+
+    if model is not None and timings.model is None:
+        timings.model = model
+    if len(timings.stages) < MAX_STAGES_PER_REQUEST:
+        timings.stages.append((name, seconds))
+
+
+class StageTimer:
+    """
+    Context manager de mesure d'une étape (cf. stage).
+    """
+
+    __slots__ = ("name", "model", "start")
+
+    def __init__(self, name: str, model: str | None = None):
+        self.name = name
+        self.model = model
+
+    def __enter__(self) -> "StageTimer":
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        record_stage(self.name, perf_counter() - self.start, self.model)
+
+
+def stage(name: str, model: str | None = None) -> StageTimer:
+    """
+    ``with stage("predict", model=...):`` mesure le bloc.
+    """
+    return StageTimer(name, model)
@@ -1,7 +1,7 @@
 # futurisys-ml-deploy/src/db/session.py
 
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterable
 
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import (  # fmt: off; fmt: on
@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import (  # fmt: off; fmt: on
     create_async_engine,
 )
 
+from src.core.timing import stage
+
 # from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 # from sqlalchemy.orm import sessionmaker
 
@@ -21,14 +23,35 @@ if not DATABASE_URL:
 # 🔧 Suppression des query params (sslmode, etc.)
 url = make_url(DATABASE_URL).set(query={})
 
+# ssl requis par Neon ; option propre à asyncpg (refusée par aiosqlite,
+# utilisé en local et par le harnais de charge)
+connect_args = {"ssl": "require"} if url.get_driver_name() == "asyncpg" else {}
+
 engine = create_async_engine(
     url,
     echo=False,
-    connect_args={"ssl": "require"},  # ✅ compatible asyncpg + Neon
+    connect_args=connect_args,  # ✅ compatible asyncpg + Neon
 )
 
+
+class TimedAsyncSession(AsyncSession):
+    """
+    AsyncSession dont flush et commit sont mesurés
+    (étapes db_flush / db_commit, cf. src/core/timing.py).
+    """
+
+    async def flush(self, objects: Iterable[object] | None = None) -> None:
+        with stage("db_flush"):
+            await super().flush(objects)
+
+    async def commit(self) -> None:
+        with stage("db_commit"):
+            await super().commit()
+
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
+    class_=TimedAsyncSession,
     expire_on_commit=False,
 )
 
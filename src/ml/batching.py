@@ -0,0 +1,299 @@
+# futurisys-ml-deploy/src/ml/batching.py
+
+"""
+Micro-batching dynamique des requêtes de prédiction concurrentes.
+
+Les requêtes unitaires concurrentes sont mises en file par modèle pendant
+une courte fenêtre (ex. 2 ms ou 64 lignes), scorées en un seul appel
+vectorisé, puis chaque appelant reçoit sa propre ligne via un future.
+
+Configuration (variables d'environnement) :
+- MICROBATCH_ENABLED      : "1" pour activer dans la route /predictions/request
+- MICROBATCH_WINDOW_MS    : fenêtre d'attente maximale (défaut 2 ms)
+- MICROBATCH_MAX_BATCH    : taille maximale d'un lot (défaut 64)
+- MICROBATCH_QUEUE_DEPTH  : profondeur maximale de la file par modèle
+- MICROBATCH_TIMEOUT_S    : attente maximale d'un résultat par requête
+
+Un lot qui échoue (scoring, session) propage l'exception à chacun de
+ses appelants ; la tâche collectrice n'est jamais interrompue (et est
+recréée si elle s'est arrêtée).
+"""
+
+import asyncio
+import contextvars
+import logging
+import math
+import os
+from time import perf_counter
+from typing import Any, Dict
+
+from src.core.metrics import Histogram
+from src.core.timing import stage
+from src.ml.cache import get_prediction_cache
+from src.ml.executor import get_inference_executor
+from src.ml.inference import normalize_payload
+from src.ml.session import InferenceSession, get_inference_session
+from src.ml.shadow import get_shadow_scorer
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+MICROBATCH_ENABLED = os.getenv("MICROBATCH_ENABLED", "0") == "1"
+MICROBATCH_WINDOW_MS = float(os.getenv("MICROBATCH_WINDOW_MS", "2"))
+MICROBATCH_MAX_BATCH = int(os.getenv("MICROBATCH_MAX_BATCH", "64"))
+MICROBATCH_QUEUE_DEPTH = int(os.getenv("MICROBATCH_QUEUE_DEPTH", "1024"))
+MICROBATCH_TIMEOUT_S = float(os.getenv("MICROBATCH_TIMEOUT_S", "30"))
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+WAIT_TIME_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class MicroBatchQueueFull(RuntimeError):
+    """
+    La file du modèle a atteint MICROBATCH_QUEUE_DEPTH.
+    """
+
+    def __init__(self, message: str, retry_after_s: int):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+class MicroBatchTimeout(RuntimeError):
+    """
+    Aucun résultat dans le délai MICROBATCH_TIMEOUT_S.
+    """
+
+
+# ============================================================
+# Micro-batcher
+# ============================================================
+
+
+class MicroBatcher:
+    """
+    File d'attente par modèle + tâche collectrice qui forme les lots.
+    Lié à l'event loop courant (recréé si la loop change).
+    """
+
+    def __init__(
+        self,
+        window_ms: float = MICROBATCH_WINDOW_MS,
+        max_batch: int = MICROBATCH_MAX_BATCH,
+        queue_depth: int = MICROBATCH_QUEUE_DEPTH,
+        timeout_s: float = MICROBATCH_TIMEOUT_S,
+    ):
+        self.window_s = window_ms / 1000
+        self.max_batch = max_batch
+        self.queue_depth = queue_depth
+        self.timeout_s = timeout_s
+
+        self.batch_size_hist = Histogram(BATCH_SIZE_BUCKETS)
+        self.wait_time_hist = Histogram(WAIT_TIME_BUCKETS_MS)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    async def submit(
+        self,
+        payload: Dict[str, Any],
+        model_name: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Met la requête en file et attend son résultat (sa propre ligne).
+        Lève ValueError (modèle inconnu), MicroBatchQueueFull ou
+        MicroBatchTimeout.
+        """
+        session = get_inference_session(model_name)
+        with stage("normalize", model=session.model_name):
+            row = normalize_payload(payload)
+
+        # Les payloads déjà scorés ne passent pas par la file
+        cache = get_prediction_cache()
+        cached = cache.get(cache.key(session.model_name, row), session.version)
+        if cached is not None:
+            return cached
+
+        queue = self._queue_for(session.model_name)
+
+        future = asyncio.get_running_loop().create_future()
+
+        try:
+            # Session résolue ici : le lot ne dépend pas d'un rechargement
+            # du registry survenu entre-temps
+            queue.put_nowait((session, row, future, perf_counter()))
+        except asyncio.QueueFull:
+            raise MicroBatchQueueFull(
+                f"Micro-batch queue full for model {session.model_name}",
+                retry_after_s=self._retry_after_s(queue),
+            )
+
+        with stage("microbatch", model=session.model_name):
+            try:
+                return await asyncio.wait_for(future, self.timeout_s)
+            except asyncio.TimeoutError:
+                raise MicroBatchTimeout(
+                    f"No micro-batch result within {self.timeout_s:g}s "
+                    f"for model {session.model_name}"
+                )
+
+    def stats(self) -> dict:
+        return {
+            "config": {
+                "enabled": MICROBATCH_ENABLED,
+                "window_ms": self.window_s * 1000,
+                "max_batch": self.max_batch,
+                "queue_depth": self.queue_depth,
+            },
+            "queued": {name: q.qsize() for name, q in self._queues.items()},
+            "batch_size": self.batch_size_hist.snapshot(),
+            "wait_time_ms": self.wait_time_hist.snapshot(),
+        }
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _queue_for(self, model_name: str) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+
+        if loop is not self._loop:
+            # Nouvelle event loop (ex. TestClient) : files et tâches obsolètes
+            self._loop = loop
+            self._queues = {}
+            self._tasks = {}
+
+        if model_name not in self._queues:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+            self._queues[model_name] = queue
+
+        task = self._tasks.get(model_name)
+        if task is None or task.done():
+            if task is not None:
+                logger.error("Micro-batch collector restarted: %s", model_name)
+            # Contexte vierge : la tâche de collecte survit à la requête
+            # qui la crée (ses étapes ne lui sont pas attribuées)
+            self._tasks[model_name] = loop.create_task(
+                self._collect(self._queues[model_name]),
+                context=contextvars.Context(),
+            )
+
+        return self._queues[model_name]
+
+    def _retry_after_s(self, queue: asyncio.Queue) -> int:
+        """
+        Délai estimé pour écouler la file : lots restants x (fenêtre +
+        durée moyenne d'exécution d'un lot par l'exécuteur).
+        """
+        run_time = get_inference_executor().run_time_hist.snapshot()
+        batches = math.ceil(queue.qsize() / self.max_batch)
+        per_batch_s = self.window_s + (run_time["mean"] or 0.0) / 1000
+        return max(1, math.ceil(batches * per_batch_s))
+
+    async def _collect(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window_s
+
+            while len(batch) < self.max_batch:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._score(batch)
+
+    async def _score(self, batch: list) -> None:
+        """
+        Score un lot ; chaque future reçoit un résultat ou l'exception
+        du scoring (aucune exception ne remonte à _collect).
+        """
+        try:
+            now = perf_counter()
+            for *_, enqueued_at in batch:
+                self.wait_time_hist.observe((now - enqueued_at) * 1000)
+            self.batch_size_hist.observe(len(batch))
+
+            # Un lot peut mêler deux snapshots (rechargement du registry)
+            groups: Dict[int, list] = {}
+            for item in batch:
+                groups.setdefault(id(item[0]), []).append(item)
+
+            for items in groups.values():
+                await self._score_session(items[0][0], items)
+
+        except Exception as e:
+            logger.exception("Micro-batch scoring failed")
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _score_session(self, session: InferenceSession, items: list):
+        rows = [row for _, row, _, _ in items]
+
+        results, latency_ms = await get_inference_executor().run(
+            _predict_timed,
+            session,
+            rows,
+        )
+
+        for (_, _, future, _), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+        # Cache et shadow : best effort, les appelants ont leur résultat
+        try:
+            cache = get_prediction_cache()
+            for row, result in zip(rows, results):
+                key = cache.key(session.model_name, row)
+                cache.put(key, session.version, result)
+
+            get_shadow_scorer().observe(
+                session.model_name,
+                session.version,
+                rows,
+                results,
+                latency_ms,
+            )
+        except Exception:
+            logger.exception("Micro-batch cache / shadow update failed")
+
+
+def _predict_timed(session: InferenceSession, rows: list) -> tuple:
+    """
+    Scoring d'un lot + durée du seul appel modèle (ms).
+    """
+    start = perf_counter()
+    results = session.predict_batch(rows)
+    return results, (perf_counter() - start) * 1000
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_batcher: MicroBatcher | None = None
+
+
+def get_micro_batcher() -> MicroBatcher:
+    global _batcher
+
+    if _batcher is None:
+        _batcher = MicroBatcher()
+
+    return _batcher
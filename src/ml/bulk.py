@@ -0,0 +1,308 @@
+# futurisys-ml-deploy/src/ml/bulk.py
+
+"""
+Scoring en masse d'un CSV (population complète, export RH), hors API.
+
+Le fichier est lu par tranches de --chunk-rows lignes ; chaque tranche
+est convertie colonne par colonne (FeaturePlan.assemble_columns) puis
+scorée en un seul appel par la session d'inférence du modèle. Les
+colonnes du CSV sont prises en compte comme dans l'API : celles qui
+portent le nom d'une feature du plan, frequence_deplacement encodée
+comme normalize_payload ; les autres sont ignorées.
+
+Avec --workers N > 0, les tranches sont réparties sur N processus
+(chacun charge le modèle via le registry). Au plus 2 x N tranches sont
+en vol et les résultats sont écrits dans l'ordre d'entrée, au fil de
+l'eau : la mémoire reste bornée quelle que soit la taille du fichier.
+
+Un CSV dont aucune colonne ne correspond aux features est scoré sur
+les valeurs par défaut (avertissement), comme une requête API.
+
+Sortie CSV : identifiant (--id-column, sinon numéro de ligne),
+prediction, probability, probability_exact (False : probabilité
+approximative, sortie anticipée d'un modèle de EARLY_EXIT_MODELS).
+
+Usage :
+    PYTHONPATH=. python -m src.ml.bulk \\
+        data/processed/e01_df_central_left_clean.csv scores.csv \\
+        --model logistic --id-column id_employee --workers 2
+"""
+
+import argparse
+import csv
+import logging
+import multiprocessing
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from src.ml.inference import FREQUENCE_MAPPING
+from src.ml.session import get_inference_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+ROW_COLUMN = "row"
+OUTPUT_COLUMNS = ("prediction", "probability", "probability_exact")
+
+# Colonnes catégorielles encodées avant assemblage (cf. normalize_payload)
+CATEGORICAL_MAPPINGS = {"frequence_deplacement": FREQUENCE_MAPPING}
+
+# ============================================================
+# Chunk scoring
+# ============================================================
+
+
+def _to_float(values: Sequence[str]) -> Tuple[np.ndarray, int]:
+    """
+    Conversion vectorisée (cellule vide → NaN, donc défaut du plan) ;
+    en cas de valeur non numérique, repli valeur par valeur
+    (valeur invalide → NaN).
+    """
+    try:
+        return np.array([v or "nan" for v in values], dtype=np.float64), 0
+    except ValueError:
+        pass
+
+    out = np.empty(len(values), dtype=np.float64)
+    invalid = 0
+    for i, value in enumerate(values):
+        try:
+            out[i] = float(value or "nan")
+        except ValueError:
+            out[i] = np.nan
+            invalid += 1
+    return out, invalid
+
+
+class ChunkScorer:
+    """
+    Score des tranches de lignes CSV brutes (listes de chaînes).
+    """
+
+    def __init__(self, model_name: str | None, header: Sequence[str]):
+        self.session = get_inference_session(model_name)
+
+        # Colonnes du CSV retenues : nom de feature → position
+        known = self.session.plan.index
+        self.columns = {n: i for i, n in enumerate(header) if n in known}
+        if not self.columns:
+            # Même comportement que l'API : features absentes = défauts
+            logger.warning(
+                "No CSV column matches a feature of %s: "
+                "all rows are scored on default values",
+                self.session.model_name,
+            )
+
+    def score(self, rows: List[List[str]]) -> Dict[str, Any]:
+        columns = {}
+        invalid = 0
+
+        # Transposition en C (lignes courtes complétées par "")
+        transposed = list(zip_longest(*rows, fillvalue=""))
+
+        for name, i in self.columns.items():
+            if i < len(transposed):
+                values = transposed[i]
+            else:
+                values = [""] * len(rows)
+            mapping = CATEGORICAL_MAPPINGS.get(name)
+            if mapping is not None:
+                columns[name] = np.array(
+                    [mapping.get(v, 0) for v in values],
+                    dtype=np.float64,
+                )
+            else:
+                columns[name], n_invalid = _to_float(values)
+                invalid += n_invalid
+
+        X = self.session.plan.assemble_columns(columns, len(rows))
+        predictions, probabilities, exact = self.session.classify(X)
+
+        return {
+            "predictions": predictions,
+            "probabilities": probabilities,
+            "exact": exact,
+            "invalid": invalid,
+        }
+
+
+# Scoreur du processus (pool) : construit une fois par processus
+_worker_scorer: ChunkScorer | None = None
+
+
+def _init_worker(model_name: str | None, header: Sequence[str]) -> None:
+    global _worker_scorer
+    _worker_scorer = ChunkScorer(model_name, header)
+
+
+def _score_in_worker(rows: List[List[str]]) -> Dict[str, Any]:
+    return _worker_scorer.score(rows)
+
+
+# ============================================================
+# Streaming
+# ============================================================
+
+
+def _chunks(reader, size: int) -> Iterator[List[List[str]]]:
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ordered_results(
+    chunks: Iterator[List[List[str]]],
+    model_name: str | None,
+    header: Sequence[str],
+    workers: int,
+) -> Iterator[Tuple[List[List[str]], Dict[str, Any]]]:
+    """
+    (tranche, résultat) dans l'ordre d'entrée ; au plus 2 x workers
+    tranches en vol.
+    """
+    if workers <= 0:
+        scorer = ChunkScorer(model_name, header)
+        for chunk in chunks:
+            yield chunk, scorer.score(chunk)
+        return
+
+    # Erreurs (modèle inconnu) et avertissements dans le processus
+    # principal plutôt que dans chaque processus du pool
+    ChunkScorer(model_name, header)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_name, list(header)),
+    ) as executor:
+        in_flight: deque = deque()
+
+        for chunk in chunks:
+            in_flight.append(
+                (chunk, executor.submit(_score_in_worker, chunk)),
+            )
+            if len(in_flight) >= 2 * workers:
+                done, future = in_flight.popleft()
+                yield done, future.result()
+
+        while in_flight:
+            done, future = in_flight.popleft()
+            yield done, future.result()
+
+
+def bulk_score(
+    input_path: Path,
+    output_path: Path,
+    model_name: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: int = 0,
+    id_column: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Score ``input_path`` et écrit ``output_path`` au fil de l'eau.
+    Retourne le bilan (lignes, durée, débit).
+    """
+    start = perf_counter()
+    rows = invalid = 0
+
+    with input_path.open(newline="", encoding="utf-8") as f_in:
+        reader = csv.reader(f_in)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Empty CSV file: {input_path}")
+
+        id_index = None
+        if id_column is not None:
+            if id_column not in header:
+                raise ValueError(f"Unknown id column: {id_column}")
+            id_index = header.index(id_column)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", newline="", encoding="utf-8") as f_out:
+            writer = csv.writer(f_out)
+            writer.writerow((id_column or ROW_COLUMN, *OUTPUT_COLUMNS))
+
+            results = _ordered_results(
+                _chunks(reader, chunk_rows),
+                model_name,
+                header,
+                workers,
+            )
+            for chunk, result in results:
+                if id_index is None:
+                    ids = range(rows, rows + len(chunk))
+                else:
+                    ids = [row[id_index] for row in chunk]
+
+                writer.writerows(
+                    zip(
+                        ids,
+                        result["predictions"].tolist(),
+                        np.round(result["probabilities"], 6).tolist(),
+                        result["exact"].tolist(),
+                    )
+                )
+                rows += len(chunk)
+                invalid += result["invalid"]
+
+    elapsed_s = perf_counter() - start
+    return {
+        "rows": rows,
+        "invalid_values": invalid,
+        "elapsed_s": elapsed_s,
+        "rows_per_s": rows / elapsed_s if elapsed_s > 0 else 0.0,
+    }
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", type=Path)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--id-column", default=None)
+    args = parser.parse_args(argv)
+
+    report = bulk_score(
+        args.input,
+        args.output,
+        model_name=args.model,
+        chunk_rows=args.chunk_rows,
+        workers=args.workers,
+        id_column=args.id_column,
+    )
+
+    print(
+        f"{report['rows']} rows scored in {report['elapsed_s']:.2f}s "
+        f"({report['rows_per_s']:,.0f} rows/s), "
+        f"{report['invalid_values']} invalid values replaced by defaults",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
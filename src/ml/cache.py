@@ -0,0 +1,210 @@
+# futurisys-ml-deploy/src/ml/cache.py
+
+"""
+Cache mémoire des résultats de prédiction (LRU + TTL).
+
+Clé : nom du modèle + tuple normalisé des features du payload.
+Le cache est borné en nombre d'entrées et en mémoire estimée, et les
+entrées d'un modèle sont purgées dès que la version de son artefact change.
+
+Configuration (variables d'environnement) :
+- PREDICTION_CACHE_MAX_ENTRIES : nombre maximal d'entrées (0 = désactivé)
+- PREDICTION_CACHE_MAX_BYTES   : mémoire maximale estimée
+- PREDICTION_CACHE_TTL_S       : durée de vie d'une entrée (secondes)
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, Mapping
+
+# ============================================================
+# Configuration
+# ============================================================
+
+PREDICTION_CACHE_MAX_ENTRIES = int(
+    os.getenv("PREDICTION_CACHE_MAX_ENTRIES", "10000"),
+)
+PREDICTION_CACHE_MAX_BYTES = int(
+    os.getenv("PREDICTION_CACHE_MAX_BYTES", str(16 * 1024 * 1024)),
+)
+PREDICTION_CACHE_TTL_S = float(os.getenv("PREDICTION_CACHE_TTL_S", "300"))
+
+# ============================================================
+# Prediction cache
+# ============================================================
+
+
+class PredictionCache:
+    """
+    Cache LRU/TTL thread-safe (utilisable depuis l'event loop
+    comme depuis les threads d'inférence : sections critiques courtes).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PREDICTION_CACHE_MAX_ENTRIES,
+        max_bytes: int = PREDICTION_CACHE_MAX_BYTES,
+        ttl_s: float = PREDICTION_CACHE_TTL_S,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+
+        # key → (expires_at, size, result)
+        self._entries: OrderedDict = OrderedDict()
+        self._versions: Dict[str, str] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    # --------------------------------------------------------
+    # Keys
+    # --------------------------------------------------------
+    @staticmethod
+    def key(model_name: str, payload: Mapping[str, Any]) -> Hashable:
+        """
+        Clé normalisée : modèle + tuple trié des champs du payload.
+        """
+        return (model_name, tuple(sorted(payload.items())))
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    def get(self, key: Hashable, version: str) -> Dict[str, Any] | None:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._check_version(key[0], version)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, size, result = entry
+            if expires_at < monotonic():
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return dict(result)
+
+    def put(
+        self,
+        key: Hashable,
+        version: str,
+        result: Mapping[str, Any],
+    ) -> None:
+        if not self.enabled:
+            return
+
+        size = _estimate_size(key, result)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._check_version(key[0], version)
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (monotonic() + self.ttl_s, size, dict(result))
+            self._bytes += size
+
+            while self._over_budget():
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "versions": dict(self._versions),
+            }
+
+    # --------------------------------------------------------
+    # Internals (lock held)
+    # --------------------------------------------------------
+    def _check_version(self, model_name: str, version: str) -> None:
+        """
+        Purge les entrées du modèle si la version de l'artefact a changé.
+        """
+        current = self._versions.get(model_name)
+        if current == version:
+            return
+
+        if current is not None:
+            stale = [k for k in self._entries if k[0] == model_name]
+            for k in stale:
+                self._remove(k, self._entries[k][1])
+            self.invalidations += 1
+
+        self._versions[model_name] = version
+
+    def _over_budget(self) -> bool:
+        too_many = len(self._entries) > self.max_entries
+        return too_many or self._bytes > self.max_bytes
+
+    def _remove(self, key: Hashable, size: int) -> None:
+        del self._entries[key]
+        self._bytes -= size
+
+
+def _estimate_size(key: Hashable, result: Mapping[str, Any]) -> int:
+    """
+    Estimation (peu coûteuse) de l'empreinte mémoire d'une entrée.
+    """
+    _, items = key
+    size = sys.getsizeof(key) + sys.getsizeof(items)
+    size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in items)
+    size += sys.getsizeof(result)
+    size += sum(sys.getsizeof(v) for v in result.values())
+    return size
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_cache = PredictionCache()
+
+
+def get_prediction_cache() -> PredictionCache:
+    return _cache
@@ -0,0 +1,216 @@
+# futurisys-ml-deploy/src/ml/evaluation.py
+
+"""
+Évaluation des modèles servis sur le jeu de test stocké.
+
+Les tableaux e02_X_test_final.npy / e02_y_test.npy sont chargés une
+seule fois ; chaque modèle du registry est scoré en un seul passage
+(predict_proba sur le lot complet, via sa session d'inférence : même
+backend que les prédictions servies).
+
+Métriques calculées en NumPy vectorisé, sans sklearn.metrics :
+- matrice de confusion (un bincount), accuracy, precision, recall, F1
+  au seuil de décision du service
+- ROC-AUC (trapèzes sur la courbe ROC) et PR-AUC (average precision),
+  une seule passe de tri, seuils distincts comme sklearn
+
+Les résultats sont mis en cache par (modèle, version d'artefact) :
+un artefact remplacé (rechargement du registry) est réévalué au
+prochain appel. Un verrou par modèle : l'évaluation à froid d'un
+modèle ne bloque pas la lecture des autres.
+"""
+
+import logging
+import threading
+from datetime import UTC, datetime
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from src.ml import model_registry as registry
+from src.ml.session import DECISION_THRESHOLD, get_inference_session
+
+logger = logging.getLogger(__name__)
+
+X_TEST_FILE = "e02_X_test_final.npy"
+Y_TEST_FILE = "e02_y_test.npy"
+
+# ============================================================
+# Test set
+# ============================================================
+
+
+@lru_cache(maxsize=1)
+def load_test_set() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (X_test, y_test), chargés une seule fois (lecture seule).
+    """
+    X = np.load(registry.BASE_PATH / X_TEST_FILE)
+    y = np.load(registry.BASE_PATH / Y_TEST_FILE).astype(np.int64).ravel()
+
+    if len(X) != len(y):
+        raise ValueError(
+            f"Test set mismatch: {len(X)} rows, {len(y)} labels",
+        )
+
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y
+
+
+# ============================================================
+# Vectorized metrics
+# ============================================================
+
+
+def _ratio(num: float, den: float) -> float:
+    return float(num / den) if den else 0.0
+
+
+def _curve(y_true: np.ndarray, scores: np.ndarray):
+    """
+    Vrais / faux positifs cumulés aux seuils distincts (scores
+    décroissants), comme sklearn._binary_clf_curve.
+    """
+    order = np.argsort(scores, kind="mergesort")[::-1]
+    scores = scores[order]
+    y_sorted = y_true[order]
+
+    # Dernier indice de chaque groupe de scores égaux
+    distinct = np.flatnonzero(np.diff(scores))
+    thresholds = np.r_[distinct, len(y_sorted) - 1]
+
+    tps = np.cumsum(y_sorted)[thresholds]
+    fps = thresholds + 1 - tps
+    return tps, fps
+
+
+def binary_metrics(
+    y_true: np.ndarray,
+    scores: np.ndarray,
+    threshold: float = DECISION_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Métriques de classification binaire (classe positive = 1).
+    ``scores`` : probabilités de la classe positive.
+    """
+    y_true = np.asarray(y_true, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    y_pred = (scores >= threshold).astype(np.int64)
+
+    # [[tn, fp], [fn, tp]] en un seul bincount
+    confusion = np.bincount(2 * y_true + y_pred, minlength=4).reshape(2, 2)
+    (tn, fp), (fn, tp) = confusion.tolist()
+
+    precision = _ratio(tp, tp + fp)
+    recall = _ratio(tp, tp + fn)
+    f1 = _ratio(2 * precision * recall, precision + recall)
+
+    positives = tp + fn
+    negatives = tn + fp
+    roc_auc = pr_auc = None
+
+    if positives and negatives:
+        tps, fps = _curve(y_true, scores)
+
+        tpr = np.r_[0.0, tps / positives]
+        fpr = np.r_[0.0, fps / negatives]
+        roc_auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+        # Average precision : somme des (R_n - R_{n-1}) x P_n
+        precisions = tps / (tps + fps)
+        pr_auc = float(np.sum(np.diff(tpr) * precisions))
+
+    return {
+        "rows": int(len(y_true)),
+        "threshold": threshold,
+        "accuracy": _ratio(tp + tn, len(y_true)),
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "roc_auc": roc_auc,
+        "pr_auc": pr_auc,
+        "confusion_matrix": {"tn": tn, "fp": fp, "fn": fn, "tp": tp},
+    }
+
+
+# ============================================================
+# Evaluator (cache par version)
+# ============================================================
+
+
+class ModelEvaluator:
+    """
+    Évalue les modèles servis ; une évaluation par version d'artefact.
+    """
+
+    def __init__(self):
+        # modèle → (version, résultat) : seule la version servie est gardée
+        self._cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.evaluations = 0
+
+    def evaluate(self, model_name: str | None = None) -> Dict[str, Any]:
+        """
+        Métriques du modèle pour l'artefact actuellement servi.
+        Lève ValueError si le modèle est inconnu.
+        """
+        session = get_inference_session(model_name)
+        name, version = session.model_name, session.version
+
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._lock_for(name):
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            X, y = load_test_set()
+
+            start = perf_counter()
+            proba = session.predict_proba(X)
+            result = {
+                "model": name,
+                "model_version": version,
+                "backend": type(session.model).__name__,
+                "computed_at": datetime.now(UTC).isoformat(),
+                **binary_metrics(y, proba[:, 1]),
+                "evaluation_ms": (perf_counter() - start) * 1000,
+            }
+
+            self._cache[name] = (version, result)
+            self.evaluations += 1
+
+        return result
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def evaluate_all(self) -> Dict[str, Any]:
+        """
+        Tous les modèles du registry ; un modèle non chargeable
+        (artefact absent…) est signalé sans bloquer les autres.
+        """
+        report: Dict[str, Any] = {}
+
+        for name in registry.available_models():
+            try:
+                report[name] = self.evaluate(name)
+            except (FileNotFoundError, ValueError) as e:
+                logger.warning("Evaluation skipped for %s: %s", name, e)
+                report[name] = {"model": name, "error": str(e)}
+
+        return report
+
+
+_evaluator = ModelEvaluator()
+
+
+def get_model_evaluator() -> ModelEvaluator:
+    return _evaluator
@@ -0,0 +1,201 @@
+# futurisys-ml-deploy/src/ml/executor.py
+
+"""
+Exécuteur d'inférence borné (hors event loop).
+
+Les appels synchrones au modèle sont exécutés dans un pool de threads
+dédié, avec :
+- une concurrence maximale (threads d'inférence)
+- une profondeur de file maximale : au-delà, la requête est refusée
+  immédiatement (InferenceQueueFull → 503 + Retry-After) plutôt que
+  d'accumuler de la latence
+
+Mesures : temps d'attente en file, durée d'exécution, taux d'occupation
+des threads, requêtes refusées.
+
+Configuration (variables d'environnement) :
+- INFERENCE_CONCURRENCY : nombre de threads d'inférence
+- INFERENCE_QUEUE_DEPTH : requêtes en attente au-delà des threads occupés
+"""
+
+import asyncio
+import contextvars
+import functools
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable
+
+from src.core.metrics import Histogram
+from src.core.profiling import attach_thread
+from src.core.timing import record_stage
+
+# ============================================================
+# Configuration
+# ============================================================
+
+INFERENCE_CONCURRENCY = int(os.getenv("INFERENCE_CONCURRENCY", "4"))
+INFERENCE_QUEUE_DEPTH = int(os.getenv("INFERENCE_QUEUE_DEPTH", "64"))
+
+QUEUE_WAIT_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+RUN_TIME_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class InferenceQueueFull(RuntimeError):
+    """
+    L'exécuteur est saturé (threads occupés et file pleine).
+    """
+
+    def __init__(self, message: str, retry_after_s: int):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+# ============================================================
+# Bounded executor
+# ============================================================
+
+
+class InferenceExecutor:
+    """
+    Pool de threads borné avec contrôle d'admission.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = INFERENCE_CONCURRENCY,
+        queue_depth: int = INFERENCE_QUEUE_DEPTH,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.queue_depth = max(0, queue_depth)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="inference",
+        )
+        self._lock = threading.Lock()
+
+        self._pending = 0  # en file + en cours
+        self._active = 0  # en cours
+        self._busy_s = 0.0
+        self._started_at = perf_counter()
+
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_hist = Histogram(QUEUE_WAIT_BUCKETS_MS)
+        self.run_time_hist = Histogram(RUN_TIME_BUCKETS_MS)
+
+    @property
+    def capacity(self) -> int:
+        return self.concurrency + self.queue_depth
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Exécute ``fn(*args, **kwargs)`` dans un thread d'inférence.
+        Lève InferenceQueueFull si l'exécuteur est saturé.
+        """
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                raise InferenceQueueFull(
+                    "Inference executor saturated",
+                    retry_after_s=self._retry_after_s(),
+                )
+            self._pending += 1
+
+        # Contexte de la requête propagé au thread (mesure des étapes)
+        call = functools.partial(
+            contextvars.copy_context().run,
+            self._execute,
+            fn,
+            args,
+            kwargs,
+            perf_counter(),
+        )
+
+        # Créneau libéré à la fin réelle du job (ou à son annulation
+        # avant démarrage), pas à l'abandon de l'appelant : un client
+        # déconnecté ne libère pas un thread encore occupé
+        future = self._executor.submit(call)
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            elapsed = perf_counter() - self._started_at
+            busy_s = self._busy_s
+            pending = self._pending
+            active = self._active
+
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.queue_depth,
+            "active": active,
+            "queued": pending - active,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "utilization": busy_s / (elapsed * self.concurrency),
+            "queue_wait_ms": self.queue_wait_hist.snapshot(),
+            "run_time_ms": self.run_time_hist.snapshot(),
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._busy_s = 0.0
+            self._started_at = perf_counter()
+            self.completed = 0
+            self.rejected = 0
+        self.queue_wait_hist.reset()
+        self.run_time_hist.reset()
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _execute(self, fn: Callable, args, kwargs, submitted_at: float):
+        start = perf_counter()
+        self.queue_wait_hist.observe((start - submitted_at) * 1000)
+        record_stage("queue_wait", start - submitted_at)
+
+        with self._lock:
+            self._active += 1
+
+        try:
+            with attach_thread():
+                return fn(*args, **kwargs)
+        finally:
+            run_s = perf_counter() - start
+            self.run_time_hist.observe(run_s * 1000)
+            with self._lock:
+                self._active -= 1
+                self._busy_s += run_s
+                self.completed += 1
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _retry_after_s(self) -> int:
+        """
+        Délai estimé (lock tenu) pour écouler la file :
+        durée moyenne d'exécution x requêtes en attente / threads.
+        """
+        mean_ms = self.run_time_hist.snapshot()["mean"] or 0.0
+        backlog = self._pending * mean_ms / 1000 / self.concurrency
+        return max(1, math.ceil(backlog))
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_executor = InferenceExecutor()
+
+
+def get_inference_executor() -> InferenceExecutor:
+    return _executor
@@ -0,0 +1,165 @@
+# futurisys-ml-deploy/src/ml/features.py
+
+"""
+Plan d'assemblage des features (sans pandas).
+
+Le plan est compilé une seule fois à partir de la liste des features
+du registry (ordre strict, cf. metadata.json → features.order_strict) :
+- index fixe nom de feature → colonne
+- vecteur de valeurs par défaut appliqué en bloc
+- pool de buffers float64 réutilisables pour les prédictions unitaires
+
+Il sert aussi bien pour une ligne que pour un lot de N lignes.
+"""
+
+import queue
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
+
+import numpy as np
+
+from src.ml.model_registry import get_features
+
+# Valeur appliquée aux features non fournies par l'API
+DEFAULT_FEATURE_VALUE = 0.0
+
+# Nombre maximal de buffers ligne conservés dans le pool
+ROW_BUFFER_POOL_SIZE = 32
+
+# ============================================================
+# Feature plan
+# ============================================================
+
+
+class FeaturePlan:
+    """
+    Plan compilé : layout des colonnes + défauts + pool de buffers.
+    """
+
+    def __init__(
+        self,
+        features: Sequence[str],
+        defaults: Mapping[str, float] | None = None,
+        pool_size: int = ROW_BUFFER_POOL_SIZE,
+    ):
+        self.features: tuple[str, ...] = tuple(features)
+
+        if len(set(self.features)) != len(self.features):
+            raise ValueError("Duplicate feature names in feature list")
+
+        self.index: Dict[str, int] = {
+            feature: i for i, feature in enumerate(self.features)
+        }
+        self.n_features = len(self.features)
+
+        self.defaults = np.full(self.n_features, DEFAULT_FEATURE_VALUE)
+        for feature, value in (defaults or {}).items():
+            self.defaults[self.index[feature]] = value
+        self.defaults.flags.writeable = False
+
+        self._pool_size = pool_size
+        self._pool: queue.SimpleQueue = queue.SimpleQueue()
+
+    # --------------------------------------------------------
+    # Single row
+    # --------------------------------------------------------
+    def fill(self, payload: Mapping[str, Any], out: np.ndarray) -> np.ndarray:
+        """
+        Remplit ``out`` (1 x features) : défauts en bloc,
+        puis uniquement les champs fournis et connus du plan.
+        """
+        row = out.reshape(-1)
+        row[:] = self.defaults
+
+        index = self.index
+        for key, value in payload.items():
+            j = index.get(key)
+            if j is not None and value is not None:
+                row[j] = value
+
+        return out
+
+    @contextmanager
+    def row(self, payload: Mapping[str, Any]) -> Iterator[np.ndarray]:
+        """
+        Prête un buffer ligne du pool rempli avec ``payload``.
+        Le buffer est rendu au pool en sortie : ne pas le conserver.
+        """
+        try:
+            buffer = self._pool.get_nowait()
+        except queue.Empty:
+            buffer = np.empty((1, self.n_features), dtype=np.float64)
+
+        try:
+            yield self.fill(payload, buffer)
+        finally:
+            if self._pool.qsize() < self._pool_size:
+                self._pool.put(buffer)
+
+    # --------------------------------------------------------
+    # Batch
+    # --------------------------------------------------------
+    def assemble(self, rows: List[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Construit une nouvelle matrice N x features (float64, ordre strict).
+        Les colonnes fournies sont remplies colonne par colonne.
+        """
+        X = np.empty((len(rows), self.n_features), dtype=np.float64)
+        X[:] = self.defaults
+
+        if not rows:
+            return X
+
+        keys = {key for row in rows for key in row if key in self.index}
+
+        for key in keys:
+            j = self.index[key]
+            default = self.defaults[j]
+            values = (row.get(key) for row in rows)
+            X[:, j] = [default if v is None else v for v in values]
+
+        return X
+
+    def assemble_columns(
+        self,
+        columns: Mapping[str, np.ndarray],
+        n_rows: int,
+    ) -> np.ndarray:
+        """
+        Construit une matrice N x features à partir de colonnes float64
+        (une affectation vectorisée par colonne connue du plan).
+        Les NaN prennent la valeur par défaut de la feature.
+        """
+        X = np.empty((n_rows, self.n_features), dtype=np.float64)
+        X[:] = self.defaults
+
+        for key, values in columns.items():
+            j = self.index.get(key)
+            if j is None:
+                continue
+            X[:, j] = values
+            missing = np.isnan(values)
+            if missing.any():
+                X[missing, j] = self.defaults[j]
+
+        return X
+
+
+# ============================================================
+# Plan cache (compilé une seule fois)
+# ============================================================
+
+
+@lru_cache(maxsize=4)
+def _build_plan(features: tuple[str, ...]) -> FeaturePlan:
+    return FeaturePlan(features)
+
+
+def get_feature_plan(features: Sequence[str] | None = None) -> FeaturePlan:
+    """
+    Retourne le plan compilé pour ``features`` (par défaut la liste
+    des features du registry). Un plan n'est recompilé que si la liste
+    change (rechargement du registry).
+    """
+    return _build_plan(tuple(get_features() if features is None else features))
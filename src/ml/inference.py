@@ -1,8 +1,16 @@
 # futurisys-ml-deploy/src/ml/inference.py
 
-from typing import Any, Dict
+from time import perf_counter
+from typing import Any, Dict, List
 
-from src.ml.loader import MLModelLoader
+import numpy as np
+
+from src.core.timing import stage
+from src.ml.cache import get_prediction_cache
+from src.ml.features import get_feature_plan
+from src.ml.model_registry import available_models, resolve_model_name
+from src.ml.session import get_inference_session
+from src.ml.shadow import get_shadow_scorer
 
 # ============================================================
 # Feature normalization (API → ML)
@@ -41,9 +49,186 @@ def run_inference(
 ) -> Dict[str, Any]:
     """
     Inference synchrone, registry-first.
+    Utilise la session d'inférence (construite une fois) du modèle,
+    derrière le cache de prédictions. Les lignes scorées sont
+    échantillonnées pour le shadow scoring (cf. shadow.py).
+    """
+    session = get_inference_session(model_name)
+    with stage("normalize", model=session.model_name):
+        normalized_payload = normalize_payload(payload)
+
+    cache = get_prediction_cache()
+
+    key = cache.key(session.model_name, normalized_payload)
+    result = cache.get(key, session.version)
+
+    if result is None:
+        start = perf_counter()
+        result = session.predict(normalized_payload)
+        latency_ms = (perf_counter() - start) * 1000
+
+        cache.put(key, session.version, result)
+        get_shadow_scorer().observe(
+            session.model_name,
+            session.version,
+            [normalized_payload],
+            [result],
+            latency_ms,
+        )
+
+    return result
+
+
+def run_batch_inference(
+    payloads: List[Dict[str, Any]],
+    model_name: str | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Inference synchrone d'un lot d'entrées.
+    Les lignes absentes du cache sont scorées avec une seule matrice
+    de features et un seul appel au modèle.
+    """
+    if not payloads:
+        return []
+
+    session = get_inference_session(model_name)
+    with stage("normalize", model=session.model_name):
+        normalized_payloads = [normalize_payload(p) for p in payloads]
+
+    cache = get_prediction_cache()
+
+    keys = [cache.key(session.model_name, p) for p in normalized_payloads]
+    results = [cache.get(key, session.version) for key in keys]
+
+    misses = [i for i, result in enumerate(results) if result is None]
+
+    if misses:
+        rows = [normalized_payloads[i] for i in misses]
+
+        start = perf_counter()
+        scored = session.predict_batch(rows)
+        latency_ms = (perf_counter() - start) * 1000
+
+        for i, result in zip(misses, scored):
+            results[i] = result
+            cache.put(keys[i], session.version, result)
+
+        get_shadow_scorer().observe(
+            session.model_name,
+            session.version,
+            rows,
+            scored,
+            latency_ms,
+        )
+
+    return results
+
+
+def run_model_comparison(
+    payloads: List[Dict[str, Any]],
+    model_names: List[str] | None = None,
+) -> Dict[str, Any]:
+    """
+    Score les mêmes lignes avec plusieurs modèles du registry.
+    La matrice de features est préparée une seule fois, puis chaque
+    modèle la score en un seul passage vectorisé (latence par modèle).
+    Ni cache ni shadow : comparaison hors trafic de production.
+    Lève ValueError si un modèle demandé est inconnu.
+    """
+    available = available_models()
+    names = [resolve_model_name(name) for name in model_names or available]
+    names = list(dict.fromkeys(names))
+
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown model: {', '.join(unknown)}")
+
+    start = perf_counter()
+    X = get_feature_plan().assemble([normalize_payload(p) for p in payloads])
+    prepare_latency_ms = (perf_counter() - start) * 1000
+
+    results = []
+
+    for name in names:
+        # Un modèle indisponible (artefact absent, échec de scoring)
+        # n'empêche pas de comparer les autres
+        try:
+            session = get_inference_session(name)
+            start = perf_counter()
+            scored = session.predict_matrix(X)
+            latency_ms = (perf_counter() - start) * 1000
+        except Exception as e:
+            results.append(
+                {"model_name": name, "error": f"{type(e).__name__}: {e}"},
+            )
+            continue
+
+        results.append(
+            {
+                "model_name": name,
+                "model_version": session.version,
+                "latency_ms": latency_ms,
+                "predictions": [r["prediction"] for r in scored],
+                "probabilities": [r["probability"] for r in scored],
+            }
+        )
+
+    return {
+        "rows": len(payloads),
+        "prepare_latency_ms": prepare_latency_ms,
+        "results": results,
+    }
+
+
+def run_explanation(
+    payloads: List[Dict[str, Any]],
+    model_name: str | None = None,
+    top_k: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Contributions par feature de chaque ligne (une matrice, un parcours
+    du modèle), triées par valeur absolue décroissante et limitées aux
+    ``top_k`` premières. Ni cache ni shadow.
+    Lève ValueError si le modèle est inconnu ou non explicable.
     """
-    normalized_payload = normalize_payload(payload)
+    session = get_inference_session(model_name)
+    explainer = session.explainer
+
+    X = session.prepare([normalize_payload(p) for p in payloads])
+
+    start = perf_counter()
+    contributions, output = session.explain(X)
+    latency_ms = (perf_counter() - start) * 1000
+
+    probabilities = explainer.probability(output)
+    order = np.argsort(-np.abs(contributions), axis=1, kind="stable")
+    order = order[:, :top_k]
 
-    loader = MLModelLoader(model_name=model_name)
+    features = session.features
+    explanations = [
+        {
+            "output_value": float(value),
+            "probability": float(probability),
+            "contributions": [
+                {
+                    "feature": features[j],
+                    "value": float(row[j]),
+                    "contribution": float(contribution[j]),
+                }
+                for j in top.tolist()
+            ],
+        }
+        for row, contribution, top, value, probability in zip(
+            X, contributions, order, output, probabilities
+        )
+    ]
 
-    return loader.predict(normalized_payload)
+    return {
+        "model_name": session.model_name,
+        "model_version": session.version,
+        "method": explainer.method,
+        "output": explainer.output,
+        "base_value": explainer.base_value,
+        "explain_latency_ms": latency_ms,
+        "explanations": explanations,
+    }
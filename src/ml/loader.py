@@ -1,11 +1,11 @@
 # futurisys-ml-deploy/src/ml/loader.py
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-import pandas as pd
+import numpy as np
 
+from src.ml.features import get_feature_plan
 from src.ml.model_registry import (
-    get_features,
     get_metadata,
     get_model,
 )
@@ -28,19 +28,29 @@ class MLModelLoader:
     def __init__(self, model_name: str | None = None):
         self.model_name = model_name
         self.model = get_model(model_name)
-        self.features = get_features()
+        self.plan = get_feature_plan()
+        self.features = self.plan.features
         self.metadata = get_metadata()
 
     # --------------------------------------------------------
     # Input preparation
     # --------------------------------------------------------
-    def prepare_inputs(self, raw_inputs: Dict[str, Any]) -> pd.DataFrame:
+    def prepare_inputs(self, raw_inputs: Dict[str, Any]) -> np.ndarray:
         """
-        Transforme un dict brut en DataFrame
-        aligné avec les features du modèle.
+        Transforme un dict brut en matrice 1 x features
+        alignée avec les features du modèle.
         """
-        data = {feature: raw_inputs.get(feature) for feature in self.features}
-        return pd.DataFrame([data])
+        return self.plan.assemble([raw_inputs])
+
+    def prepare_batch_inputs(
+        self,
+        raw_inputs: List[Dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Transforme une liste de dicts bruts en une matrice 2D
+        (une ligne par entrée), alignée avec les features du modèle.
+        """
+        return self.plan.assemble(raw_inputs)
 
     # --------------------------------------------------------
     # Inference
@@ -63,3 +73,31 @@ class MLModelLoader:
             "model_name": self.metadata.get("model_name"),
             "model_version": self.metadata.get("version"),
         }
+
+    def predict_batch(
+        self,
+        raw_inputs: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Exécute l'inférence sur un lot d'entrées en un seul appel
+        à ``predict_proba`` (matrice N x features).
+        """
+        X = self.prepare_batch_inputs(raw_inputs)
+
+        proba = np.asarray(self.model.predict_proba(X), dtype=float)
+
+        # Équivalent de model.predict : classe de probabilité maximale
+        classes = getattr(self.model, "classes_", None)
+        predictions = proba.argmax(axis=1)
+        if classes is not None:
+            predictions = np.asarray(classes)[predictions]
+
+        return [
+            {
+                "prediction": int(prediction),
+                "probability": float(p),
+                "model_name": self.metadata.get("model_name"),
+                "model_version": self.metadata.get("version"),
+            }
+            for prediction, p in zip(predictions, proba[:, 1])
+        ]
@@ -1,11 +1,18 @@
 # futurisys-ml-deploy/src/ml/model_registry.py
 
+import itertools
 import json
+import logging
 import os
-from functools import lru_cache
+import threading
 from pathlib import Path
+from time import perf_counter
+from typing import Any
 
 import joblib
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 # ============================================================
 # Base path for ML artifacts
@@ -13,6 +20,14 @@ import joblib
 
 BASE_PATH = Path("data/ml_artifacts")
 
+# Artefacts des modèles exposés (relatifs à BASE_PATH / "models")
+MODEL_FILES = {
+    "dummy": "e03_dummy_most_frequent.joblib",
+    "logistic": "e03_logistic_regression_balanced.joblib",
+    "random_forest": "e03_random_forest_balanced.joblib",
+    "random_forest_e04": "e04_random_forest_final.joblib",
+}
+
 # ============================================================
 # Environment
 # ============================================================
@@ -20,14 +35,76 @@ BASE_PATH = Path("data/ml_artifacts")
 ENV = os.getenv("ENV", "prod")
 
 # ============================================================
-# Lazy loading helpers
+# Inference backends
 # ============================================================
+#
+# Backend servi par modèle : "sklearn" (défaut), "native"
+# (évaluateur NumPy compilé, cf. src/ml/native : forêts, logistique)
+# ou "compact" (forêts natives en float32 / int32).
+# ex : MODEL_BACKENDS="random_forest_e04=compact,logistic=native"
 
+DEFAULT_BACKEND = "sklearn"
+SUPPORTED_BACKENDS = {"sklearn", "native", "compact"}
 
-@lru_cache
-def get_metadata() -> dict:
+# Tolérance de parité native / sklearn vérifiée au chargement
+NATIVE_PARITY_ATOL = 1e-9
+NATIVE_PARITY_ROWS = 64
+
+# Tolérance du backend compact (probabilités des feuilles en float32)
+COMPACT_PARITY_ATOL = 1e-6
+
+
+def _parse_backends(raw: str) -> dict[str, str]:
+    backends = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        name, _, backend = item.partition("=")
+        backend = backend.strip() or DEFAULT_BACKEND
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"Unknown inference backend: {backend}")
+        backends[name.strip()] = backend
+    return backends
+
+
+MODEL_BACKENDS = _parse_backends(os.getenv("MODEL_BACKENDS", ""))
+
+
+# ============================================================
+# Artifact format
+# ============================================================
+#
+# "joblib" (défaut) : modèles sklearn picklés (MODEL_FILES / metadata.json)
+# "bundle"          : bundles .npz natifs (BASE_PATH / "bundles"), mappés
+#                     en mémoire et scorés sans sklearn
+#                     (cf. scripts/export_model_bundles.py)
+
+MODEL_FORMAT = os.getenv("MODEL_FORMAT", "joblib")
+
+if MODEL_FORMAT not in {"joblib", "bundle"}:
+    raise ValueError(f"Unknown model format: {MODEL_FORMAT}")
+
+
+def bundle_path(name: str) -> Path:
+    """
+    Emplacement du bundle .npz d'un modèle.
+    """
+    return BASE_PATH / "bundles" / f"{name}.npz"
+
+
+def get_backend(name: str) -> str:
     """
-    Retourne les métadonnées du modèle.
+    Backend configuré pour un modèle.
+    """
+    return MODEL_BACKENDS.get(name, DEFAULT_BACKEND)
+
+
+# ============================================================
+# Artifact readers
+# ============================================================
+
+
+def _read_metadata() -> dict:
+    """
+    Lit les métadonnées du jeu d'artefacts.
     En mode test, retourne un dictionnaire minimal mocké.
     """
     if ENV == "test":
@@ -45,10 +122,9 @@ def get_metadata() -> dict:
     return json.loads(metadata_path.read_text(encoding="utf-8"))
 
 
-@lru_cache
-def get_features() -> list[str]:
+def _read_features() -> list[str]:
     """
-    Retourne la liste des features utilisées par le modèle.
+    Lit la liste des features utilisées par le modèle.
     En mode test, retourne une liste mockée.
     """
     if ENV == "test":
@@ -73,67 +149,404 @@ def get_features() -> list[str]:
     return joblib.load(features_path)
 
 
-@lru_cache
-def _load_models() -> dict:
+def _model_paths(metadata: dict) -> dict[str, Path]:
     """
-    Charge les modèles ML disponibles.
-    En mode test, retourne des modèles mockés.
-    Le modèle 'baseline' est un alias fonctionnel du modèle par défaut.
+    Fichiers des modèles : MODEL_FILES, surchargé (ou complété)
+    par metadata.json → models.<nom>.file (relatif à BASE_PATH).
+    """
+    models_dir = BASE_PATH / "models"
+    paths = {name: models_dir / file for name, file in MODEL_FILES.items()}
+
+    for name, entry in (metadata.get("models") or {}).items():
+        if isinstance(entry, dict) and entry.get("file"):
+            paths[name] = BASE_PATH / entry["file"]
+
+    if MODEL_FORMAT == "bundle":
+        for name in paths:
+            if bundle_path(name).exists():
+                paths[name] = bundle_path(name)
+            else:
+                logger.warning("No bundle for model %s, serving joblib", name)
+
+    return paths
+
+
+def metadata_mtime_ns() -> int | None:
+    """
+    Date de modification de metadata.json (None si absent ou en mode test).
     """
-    # ========================================================
-    # TEST / CI MODE
-    # ========================================================
     if ENV == "test":
+        return None
 
-        class MockModel:
-            def predict(self, X):
-                return [0]
+    try:
+        return (BASE_PATH / "metadata.json").stat().st_mtime_ns
+    except OSError:
+        return None
 
-            def predict_proba(self, X):
-                return [[0.05, 0.95]]
 
-        mock_model = MockModel()
+# ============================================================
+# Registry snapshot (lazy per-model loading)
+# ============================================================
+#
+# Un snapshot regroupe un jeu d'artefacts cohérent : métadonnées,
+# features, fichiers et modèles. Il n'est jamais modifié après sa
+# publication, hormis le chargement paresseux de ses modèles.
+#
+# Chaque modèle est chargé à sa première utilisation, sous un verrou
+# propre au modèle (deux premières requêtes concurrentes ne le chargent
+# pas deux fois). Les tableaux NumPy des artefacts sont mappés en mémoire
+# (joblib mmap_mode) afin que les workers partagent les mêmes pages.
 
-        return {
-            # Alias fonctionnel
-            "baseline": mock_model,
-            # Modèles exposés
-            "dummy": mock_model,
-            "logistic": mock_model,
-            "random_forest": mock_model,
-            "random_forest_e04": mock_model,
+# "" pour désactiver le memory-mapping
+MODEL_MMAP_MODE = os.getenv("MODEL_MMAP_MODE", "r") or None
+
+
+class _MockModel:
+    def predict(self, X):
+        return [0] * len(X)
+
+    def predict_proba(self, X):
+        return [[0.05, 0.95]] * len(X)
+
+
+_MOCK_MODEL = _MockModel()
+
+
+class RegistrySnapshot:
+    """
+    Jeu d'artefacts servi par le registry (une génération).
+    """
+
+    def __init__(self, generation: int):
+        self.generation = generation
+
+        # mtime lu avant le fichier : une écriture concurrente
+        # déclenchera un nouveau rechargement
+        self.metadata_mtime_ns = metadata_mtime_ns()
+        self.metadata = _read_metadata()
+        self.features = _read_features()
+        self.model_paths = _model_paths(self.metadata)
+        self.versions = {
+            name: _file_version(self.metadata, path)
+            for name, path in self.model_paths.items()
+        }
+
+        self.models: dict[str, Any] = {}
+        self.load_stats: dict[str, dict] = {}
+        self._load_locks = {n: threading.Lock() for n in self.model_paths}
+
+    def get_model(self, name: str):
+        if name not in self.model_paths:
+            raise ValueError(f"Unknown model: {name}")
+
+        model = self.models.get(name)
+        if model is not None:
+            return model
+
+        with self._load_locks[name]:
+            model = self.models.get(name)
+            if model is None:
+                model = self._load_model(name)
+                self.models[name] = model
+
+        return model
+
+    def _load_model(self, name: str):
+        """
+        Charge un modèle (appelé une seule fois par modèle, verrou tenu).
+        En mode test, retourne un modèle mocké.
+        """
+        # ====================================================
+        # TEST / CI MODE
+        # ====================================================
+        if ENV == "test":
+            return _MOCK_MODEL
+
+        # ====================================================
+        # PROD MODE
+        # ====================================================
+        path = self.model_paths[name]
+
+        rss_before = _rss_bytes()
+        start = perf_counter()
+
+        if path.suffix == ".npz":
+            model = _load_bundle(path, len(self.features))
+        else:
+            model = joblib.load(path, mmap_mode=MODEL_MMAP_MODE)
+
+            backend = get_backend(name)
+            if backend != "sklearn":
+                model = _to_native(name, model, compact=backend == "compact")
+
+        rss_after = _rss_bytes()
+
+        self.load_stats[name] = {
+            "file": str(path),
+            "file_bytes": path.stat().st_size,
+            "backend": type(model).__name__,
+            "mmap_mode": MODEL_MMAP_MODE,
+            "load_ms": (perf_counter() - start) * 1000,
+            "array_bytes": _array_nbytes(model),
+            "rss_delta_bytes": (
+                rss_after - rss_before
+                if rss_before is not None and rss_after is not None
+                else None
+            ),
         }
 
-    # ========================================================
-    # PROD MODE
-    # ========================================================
-    models = {
-        "dummy": joblib.load(
-            # fmt: off
-            BASE_PATH / "models" / "e03_dummy_most_frequent.joblib"
-            # fmt: on
-        ),
-        "logistic": joblib.load(
-            # fmt: off
-            BASE_PATH / "models" / "e03_logistic_regression_balanced.joblib"
-            # fmt: on
-        ),
-        "random_forest": joblib.load(
-            # fmt: off
-            BASE_PATH / "models" / "e03_random_forest_balanced.joblib"
-            # fmt: on
-        ),
-        "random_forest_e04": joblib.load(
-            # fmt: off
-            BASE_PATH / "models" / "e04_random_forest_final.joblib"
-            # fmt: on
-        ),
+        logger.info("Model %s loaded: %s", name, self.load_stats[name])
+
+        return model
+
+
+def _load_bundle(path: Path, n_features: int):
+    """
+    Charge un bundle natif (NumPy uniquement, tableaux mappés si
+    MODEL_MMAP_MODE est actif) et vérifie sa compatibilité.
+    """
+    from src.ml.native.bundle import load_bundle
+
+    model = load_bundle(path, mmap=MODEL_MMAP_MODE is not None)
+
+    if model.n_features_in_ != n_features:
+        raise ValueError(
+            f"Bundle {path.name} expects {model.n_features_in_} features, "
+            f"registry has {n_features}"
+        )
+
+    return model
+
+
+def _file_version(metadata: dict, path: Path) -> str:
+    """
+    Version d'un artefact : version des artefacts (metadata.json)
+    + date de modification du fichier. Change dès qu'il est remplacé.
+    """
+    if ENV == "test":
+        return "test"
+
+    version = metadata.get("artifacts_version", "unknown")
+
+    if path.exists():
+        return f"{version}:{path.stat().st_mtime_ns}"
+
+    return version
+
+
+# ============================================================
+# Active snapshot & hot reload
+# ============================================================
+#
+# Le snapshot actif est remplacé d'un bloc (simple réaffectation) :
+# les requêtes en cours conservent les modèles de l'ancien snapshot,
+# les suivantes voient le nouveau, déjà chargé et validé.
+
+# Nombre de lignes de test utilisées pour la prédiction de contrôle
+RELOAD_SMOKE_ROWS = 8
+
+_snapshot: RegistrySnapshot | None = None
+_generations = itertools.count(1)
+_reload_lock = threading.Lock()
+
+
+class RegistryReloadError(RuntimeError):
+    """
+    Le nouveau jeu d'artefacts n'a pas pu être chargé ou validé ;
+    le snapshot actif est conservé.
+    """
+
+
+def get_snapshot() -> RegistrySnapshot:
+    """
+    Snapshot actif (construit au premier appel).
+    """
+    global _snapshot
+
+    snapshot = _snapshot
+    if snapshot is None:
+        with _reload_lock:
+            if _snapshot is None:
+                _snapshot = RegistrySnapshot(next(_generations))
+            snapshot = _snapshot
+
+    return snapshot
+
+
+def reload_registry() -> dict:
+    """
+    Recharge le registry sans interruption de service :
+    1. construit un nouveau snapshot depuis BASE_PATH
+    2. charge le modèle par défaut, les modèles préchauffés et ceux
+       déjà chargés dans le snapshot actif
+    3. valide chacun par une prédiction de contrôle
+    4. publie le nouveau snapshot (remplacement atomique)
+
+    Lève RegistryReloadError en cas d'échec (snapshot actif conservé).
+    """
+    global _snapshot
+
+    with _reload_lock:
+        start = perf_counter()
+        current = _snapshot
+
+        names = {resolve_model_name(name) for name in WARMUP_MODELS}
+        names.add(DEFAULT_MODEL_NAME)
+        if current is not None:
+            names.update(current.models)
+
+        try:
+            snapshot = RegistrySnapshot(next(_generations))
+            X = _probe_rows(len(snapshot.features))
+            for name in sorted(names):
+                _smoke_test(snapshot, name, X)
+        except Exception as e:
+            logger.exception("Registry reload failed")
+            raise RegistryReloadError(f"{type(e).__name__}: {e}") from e
+
+        _snapshot = snapshot
+
+    report = {
+        "generation": snapshot.generation,
+        "previous_generation": current.generation if current else None,
+        "artifacts_version": snapshot.metadata.get("artifacts_version"),
+        "loaded": sorted(snapshot.models),
+        "versions": dict(snapshot.versions),
+        "duration_ms": (perf_counter() - start) * 1000,
+    }
+    logger.info("Registry reloaded: %s", report)
+
+    return report
+
+
+def _probe_rows(n_features: int) -> np.ndarray:
+    """
+    Lignes de contrôle : premières lignes du jeu de test (mappé en
+    mémoire, lu une fois par rechargement), sinon une ligne nulle.
+    """
+    probe_path = BASE_PATH / "e02_X_test_final.npy"
+    if not probe_path.exists():
+        return np.zeros((1, n_features))
+
+    X = np.asarray(np.load(probe_path, mmap_mode="r")[:RELOAD_SMOKE_ROWS])
+    if X.shape[1] != n_features:
+        raise ValueError(
+            f"Probe rows have {X.shape[1]} features, expected {n_features}",
+        )
+
+    return X
+
+
+def _smoke_test(snapshot: RegistrySnapshot, name: str, X: np.ndarray) -> None:
+    """
+    Prédiction de contrôle : probabilités N x 2 finies, dans [0, 1].
+    """
+    model = snapshot.get_model(name)
+    proba = np.asarray(model.predict_proba(X), dtype=float)
+
+    valid_shape = proba.shape == (len(X), 2)
+    if not valid_shape or not np.all((proba >= 0) & (proba <= 1)):
+        raise ValueError(f"Smoke prediction failed for model {name}")
+
+
+# ============================================================
+# Runtime helpers
+# ============================================================
+
+
+def preload_models(names: list[str] | None = None) -> dict[str, Any]:
+    """
+    Force le chargement des modèles demandés (tous par défaut).
+    """
+    return {name: get_model(name) for name in names or available_models()}
+
+
+def get_load_stats() -> dict:
+    """
+    Statistiques de chargement par modèle (temps, taille résidente).
+    """
+    snapshot = get_snapshot()
+    return {
+        "generation": snapshot.generation,
+        "available": list(snapshot.model_paths),
+        "loaded": sorted(snapshot.models),
+        "mmap_mode": MODEL_MMAP_MODE,
+        "rss_bytes": _rss_bytes(),
+        "models": {n: dict(s) for n, s in snapshot.load_stats.items()},
     }
 
-    # Alias sémantique : baseline → modèle par défaut
-    models["baseline"] = models["random_forest_e04"]
 
-    return models
+def _rss_bytes() -> int | None:
+    """
+    Mémoire résidente du process (Linux : /proc/self/statm).
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _array_nbytes(model) -> int:
+    """
+    Taille des tableaux NumPy portés par le modèle
+    (arbres sklearn, coefficients, tableaux des backends natifs).
+    """
+    estimators = getattr(model, "estimators_", None)
+    if estimators is not None:
+        from sklearn.tree._tree import NODE_DTYPE
+
+        return sum(
+            [
+                e.tree_.node_count * NODE_DTYPE.itemsize + e.tree_.value.nbytes
+                for e in estimators
+            ],
+        )
+
+    return sum(
+        [
+            value.nbytes
+            for value in vars(model).values()
+            if isinstance(value, np.ndarray)
+        ],
+    )
+
+
+def _to_native(name: str, model, compact: bool = False):
+    """
+    Compile un modèle vers le backend natif (forêts en précision réduite
+    si ``compact``), après contrôle de parité avec sklearn sur les lignes
+    de test stockées.
+    En cas d'échec, le modèle sklearn est conservé.
+    """
+    from src.ml.native import compile_model, parity_delta
+
+    try:
+        native = compile_model(model)
+    except ValueError as e:
+        logger.warning("Native backend unavailable for %s: %s", name, e)
+        return model
+
+    atol = NATIVE_PARITY_ATOL
+    if compact and hasattr(native, "compact"):
+        native = native.compact()
+        atol = COMPACT_PARITY_ATOL
+
+    probe_path = BASE_PATH / "e02_X_test_final.npy"
+    if probe_path.exists():
+        X_probe = np.load(probe_path)[:NATIVE_PARITY_ROWS]
+        delta = parity_delta(native, model, X_probe)
+        if delta > atol:
+            logger.warning(
+                "Native backend parity failed for %s (max delta %.3g)",
+                name,
+                delta,
+            )
+            return model
+
+    return native
 
 
 # ============================================================
@@ -142,22 +555,69 @@ def _load_models() -> dict:
 
 DEFAULT_MODEL_NAME = "random_forest_e04"
 
+# Modèles préchauffés au démarrage (cf. src/api/warmup.py) et toujours
+# validés au rechargement, même s'ils n'ont pas encore été chargés
+WARMUP_MODELS = [
+    name.strip()
+    for name in os.getenv("WARMUP_MODELS", DEFAULT_MODEL_NAME).split(",")
+    if name.strip()
+]
+
 # ============================================================
 # Public API
 # ============================================================
 
 
-def get_model(name: str | None = None):
+def resolve_model_name(name: str | None = None) -> str:
     """
-    Retourne un modèle ML à partir de son nom.
-    Si aucun nom n'est fourni, retourne le modèle par défaut.
+    Résout le nom de modèle demandé.
+    None ou "default" (alias accepté par les routes) → modèle par défaut.
+    Le modèle 'baseline' est un alias fonctionnel du modèle par défaut.
+    """
+    if name is None or name in ("default", "baseline"):
+        return DEFAULT_MODEL_NAME
+
+    return name
+
+
+def get_metadata() -> dict:
     """
-    models = _load_models()
+    Retourne les métadonnées du snapshot actif.
+    """
+    return get_snapshot().metadata
+
+
+def get_features() -> list[str]:
+    """
+    Retourne la liste des features du snapshot actif.
+    """
+    return get_snapshot().features
 
-    if name is None:
-        name = DEFAULT_MODEL_NAME
 
-    if name not in models:
+def get_model_version(name: str | None = None) -> str:
+    """
+    Version de l'artefact servi pour un modèle
+    (cf. _file_version : change dès qu'un artefact est remplacé).
+    """
+    name = resolve_model_name(name)
+    versions = get_snapshot().versions
+
+    if name not in versions:
         raise ValueError(f"Unknown model: {name}")
 
-    return models[name]
+    return versions[name]
+
+
+def available_models() -> list[str]:
+    """
+    Modèles exposés par le registry (hors alias).
+    """
+    return list(get_snapshot().model_paths)
+
+
+def get_model(name: str | None = None):
+    """
+    Retourne un modèle ML à partir de son nom (chargé au premier appel).
+    Si aucun nom n'est fourni, retourne le modèle par défaut.
+    """
+    return get_snapshot().get_model(resolve_model_name(name))
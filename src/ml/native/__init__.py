@@ -0,0 +1,83 @@
+# futurisys-ml-deploy/src/ml/native/__init__.py
+
+"""
+Backends d'inférence natifs (NumPy uniquement) pour les modèles du registry.
+"""
+
+import numpy as np
+
+from .bundle import export_bundle, load_bundle, read_bundle_header
+from .constant import ConstantScorer
+from .forest import CompiledForest
+from .linear import LinearScorer
+
+__all__ = [
+    "CompiledForest",
+    "ConstantScorer",
+    "LinearScorer",
+    "compile_model",
+    "export_bundle",
+    "load_bundle",
+    "parity_delta",
+    "precision_drift",
+    "read_bundle_header",
+]
+
+
+def compile_model(model):
+    """
+    Compile un modèle sklearn vers son backend natif.
+    Lève ValueError si aucun backend natif ne correspond.
+    """
+    estimator = model.steps[-1][1] if hasattr(model, "steps") else model
+
+    if hasattr(estimator, "estimators_"):
+        return CompiledForest.from_sklearn(model)
+
+    if hasattr(estimator, "coef_"):
+        return LinearScorer.from_sklearn(model)
+
+    if hasattr(estimator, "class_prior_"):
+        return ConstantScorer.from_sklearn(estimator)
+
+    raise ValueError(f"No native backend for {type(estimator).__name__}")
+
+
+def parity_delta(native, reference, X: np.ndarray) -> float:
+    """
+    Écart absolu maximal entre les probabilités natives et sklearn sur X.
+    """
+    return float(
+        np.max(
+            np.abs(
+                np.asarray(native.predict_proba(X))
+                - np.asarray(reference.predict_proba(X))
+            )
+        )
+    )
+
+
+def precision_drift(
+    reference,
+    candidate,
+    X: np.ndarray,
+    threshold: float = 0.5,
+) -> dict:
+    """
+    Dérive de ``candidate`` (ex : forêt compacte) par rapport à
+    ``reference`` sur X : écart de probabilité (classe positive) et
+    lignes dont la classe change au seuil ``threshold``.
+    """
+    p_ref = np.asarray(reference.predict_proba(X))[:, 1]
+    p_new = np.asarray(candidate.predict_proba(X))[:, 1]
+    delta = np.abs(p_new - p_ref)
+    flipped = np.flatnonzero((p_ref >= threshold) != (p_new >= threshold))
+
+    return {
+        "rows": len(X),
+        "threshold": threshold,
+        "max_abs_delta": float(delta.max()) if len(X) else 0.0,
+        "mean_abs_delta": float(delta.mean()) if len(X) else 0.0,
+        "flips": len(flipped),
+        "flipped_rows": flipped.tolist(),
+    }
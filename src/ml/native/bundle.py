@@ -0,0 +1,230 @@
+# futurisys-ml-deploy/src/ml/native/bundle.py
+
+"""
+Format d'artefact compact, sans sklearn : bundle ``.npz`` versionné.
+
+Un bundle est une archive ZIP non compressée (ZIP_STORED) contenant :
+- ``header.json`` : format, version du format, type de scoreur,
+  paramètres scalaires, provenance (modèle, version des artefacts…)
+- un membre ``<attribut>.npy`` par tableau du scoreur natif
+
+Chaque membre ``.npy`` est aligné sur 64 octets dans l'archive : le
+chargeur lit les offsets des membres et mappe directement les tableaux
+en mémoire (np.memmap), sans décompression ni unpickling d'objets
+Python. Le chargement n'importe que NumPy.
+"""
+
+import io
+import json
+import os
+import struct
+import zipfile
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+from .constant import ConstantScorer
+from .forest import CompiledForest
+from .linear import LinearScorer
+
+BUNDLE_FORMAT = "futurisys-model-bundle"
+BUNDLE_FORMAT_VERSION = 1
+HEADER_MEMBER = "header.json"
+
+# Alignement des données des tableaux dans l'archive
+ARRAY_ALIGNMENT = 64
+
+# Identifiant du champ "extra" ZIP de padding (convention zipalign)
+_PADDING_EXTRA_ID = 0xD935
+_LOCAL_HEADER_SIZE = 30
+
+# type → (classe, attributs scalaires, attributs tableaux)
+SCORER_KINDS = {
+    "forest": (
+        CompiledForest,
+        ("max_depth", "n_features_in_"),
+        (
+            "feature",
+            "threshold",
+            "left",
+            "right",
+            "missing_left",
+            "value",
+            "roots",
+            "classes_",
+        ),
+    ),
+    "linear": (
+        LinearScorer,
+        ("intercept", "n_features_in_"),
+        ("coef", "classes_"),
+    ),
+    "constant": (
+        ConstantScorer,
+        ("n_features_in_",),
+        ("proba", "classes_"),
+    ),
+}
+
+# ============================================================
+# Export
+# ============================================================
+
+
+def export_bundle(
+    scorer,
+    path: str | Path,
+    source: Dict[str, Any] | None = None,
+) -> Path:
+    """
+    Écrit le scoreur natif ``scorer`` dans un bundle ``.npz``.
+    ``source`` (provenance) est recopié tel quel dans l'en-tête.
+    """
+    kind = _kind_of(scorer)
+    _, scalar_attrs, array_attrs = SCORER_KINDS[kind]
+
+    header = {
+        "format": BUNDLE_FORMAT,
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "kind": kind,
+        "params": {name: getattr(scorer, name) for name in scalar_attrs},
+        "arrays": list(array_attrs),
+        "source": source or {},
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(HEADER_MEMBER, json.dumps(header, indent=2))
+
+        for name in array_attrs:
+            array = np.ascontiguousarray(getattr(scorer, name))
+            buffer = io.BytesIO()
+            np.lib.format.write_array(buffer, array, allow_pickle=False)
+            _write_aligned(zf, f"{name}.npy", buffer.getvalue())
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_aligned(zf: zipfile.ZipFile, member: str, data: bytes) -> None:
+    """
+    Ajoute un membre dont les données commencent sur une frontière
+    ARRAY_ALIGNMENT (padding dans le champ "extra" de l'en-tête local).
+    L'en-tête .npy étant lui-même aligné sur 64 octets, les tableaux
+    le sont aussi.
+    """
+    info = zipfile.ZipInfo(member, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_STORED
+
+    start = zf.fp.tell() + _LOCAL_HEADER_SIZE + len(member.encode()) + 4
+    padding = -start % ARRAY_ALIGNMENT
+    info.extra = struct.pack("<HH", _PADDING_EXTRA_ID, padding)
+    info.extra += b"\0" * padding
+
+    zf.writestr(info, data)
+
+
+def _kind_of(scorer) -> str:
+    for kind, (cls, _, _) in SCORER_KINDS.items():
+        if isinstance(scorer, cls):
+            return kind
+
+    raise ValueError(f"No bundle format for {type(scorer).__name__}")
+
+
+# ============================================================
+# Loading
+# ============================================================
+
+
+def read_bundle_header(path: str | Path) -> Dict[str, Any]:
+    """
+    En-tête JSON d'un bundle (sans charger les tableaux).
+    """
+    with zipfile.ZipFile(path) as zf:
+        header = json.loads(zf.read(HEADER_MEMBER))
+
+    if header.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Not a model bundle: {path}")
+    version = header.get("format_version")
+    if version != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format version: {version}")
+
+    return header
+
+
+def load_bundle(path: str | Path, mmap: bool = True):
+    """
+    Charge un bundle : tableaux mappés en mémoire (lecture seule)
+    ou copiés en mémoire si ``mmap`` est faux.
+    """
+    path = Path(path)
+    header = read_bundle_header(path)
+
+    if header["kind"] not in SCORER_KINDS:
+        raise ValueError(f"Unknown scorer kind: {header['kind']}")
+
+    cls, scalar_attrs, array_attrs = SCORER_KINDS[header["kind"]]
+
+    scorer = cls.__new__(cls)
+    for name in scalar_attrs:
+        setattr(scorer, name, header["params"][name])
+
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for name in array_attrs:
+            info = zf.getinfo(f"{name}.npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(
+                    f"Bundle member {info.filename} is compressed",
+                )
+
+            array = _map_array(path, f, _data_offset(f, info))
+            setattr(scorer, name, array if mmap else np.array(array))
+
+    return scorer
+
+
+def _data_offset(f, info: zipfile.ZipInfo) -> int:
+    """
+    Offset des données d'un membre : en-tête local lu dans le fichier
+    (ses champs "extra" peuvent différer du répertoire central).
+    """
+    f.seek(info.header_offset)
+    local = f.read(_LOCAL_HEADER_SIZE)
+
+    if local[:4] != b"PK\x03\x04":
+        raise ValueError(f"Corrupted bundle member: {info.filename}")
+
+    name_len, extra_len = struct.unpack("<HH", local[26:30])
+    return info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+
+
+def _map_array(path: Path, f, offset: int) -> np.ndarray:
+    f.seek(offset)
+    version = np.lib.format.read_magic(f)
+
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+    if dtype.hasobject:
+        raise ValueError("Object arrays are not allowed in bundles")
+
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=f.tell(),
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
@@ -0,0 +1,78 @@
+# futurisys-ml-deploy/src/ml/native/constant.py
+
+"""
+Scoreur constant natif pour les modèles de référence (DummyClassifier).
+
+Les stratégies déterministes (most_frequent, prior, constant) renvoient
+les mêmes probabilités pour toute ligne : elles sont évaluées une fois
+à la compilation puis répétées à l'inférence.
+"""
+
+import numpy as np
+
+# Stratégies sans tirage aléatoire à l'inférence
+CONSTANT_STRATEGIES = {"most_frequent", "prior", "constant"}
+
+# ============================================================
+# Constant scorer
+# ============================================================
+
+
+class ConstantScorer:
+    """
+    Probabilités identiques pour toutes les lignes.
+    Contrat identique à ``DummyClassifier.predict_proba``.
+    """
+
+    def __init__(
+        self,
+        proba: np.ndarray,
+        n_features: int,
+        classes: np.ndarray,
+    ):
+        self.proba = proba
+        self.n_features_in_ = n_features
+        self.classes_ = classes
+
+    # --------------------------------------------------------
+    # Compilation
+    # --------------------------------------------------------
+    @classmethod
+    def from_sklearn(cls, model) -> "ConstantScorer":
+        """
+        Évalue les probabilités constantes d'un DummyClassifier.
+        Lève ValueError si la stratégie n'est pas déterministe.
+        """
+        strategy = getattr(model, "strategy", None)
+        if strategy not in CONSTANT_STRATEGIES:
+            raise ValueError(f"Dummy strategy not supported: {strategy}")
+        if getattr(model, "n_outputs_", 1) != 1:
+            raise ValueError("Only single-output dummy models are supported")
+
+        n_features = int(getattr(model, "n_features_in_", 1))
+        proba = np.asarray(
+            model.predict_proba(np.zeros((1, n_features))),
+            dtype=np.float64,
+        )[0]
+
+        return cls(
+            proba=proba,
+            n_features=n_features,
+            classes=np.asarray(model.classes_),
+        )
+
+    # --------------------------------------------------------
+    # Inference
+    # --------------------------------------------------------
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X)
+
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, expected (n, {self.n_features_in_})"
+            )
+
+        return np.tile(self.proba, (X.shape[0], 1))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
@@ -0,0 +1,184 @@
+# futurisys-ml-deploy/src/ml/native/explain.py
+
+"""
+Explications par prédiction (contributions par feature), NumPy seul.
+
+Forêts : attribution par chemin (Saabas). En descendant d'un noeud à
+son enfant, la probabilité de classe positive passe de value[parent] à
+value[enfant] ; l'écart est attribué à la feature du split du parent.
+Pour une ligne : base (moyenne des racines) + somme des contributions
+= probabilité prédite (exactement, le chemin se télescope).
+
+Les contributions sont précalculées une fois par forêt : pour chaque
+feuille, la somme des écarts le long de son chemin, par feature
+(tableaux CSR : au plus max_depth entrées par feuille). Une explication
+coûte donc un parcours (``apply``) puis une somme de segments.
+
+Régression logistique : contribution = coefficient x valeur, dans
+l'espace des log-odds (base = intercept ; somme = logit prédit).
+"""
+
+import numpy as np
+
+from .constant import ConstantScorer
+from .forest import CompiledForest
+from .linear import LinearScorer
+
+# ============================================================
+# Forests (path attribution)
+# ============================================================
+
+
+class TreeExplainer:
+    """
+    Contributions par feuille précalculées pour une CompiledForest
+    (classe positive = colonne 1).
+    """
+
+    method = "path_attribution"
+    output = "probability"
+
+    def __init__(self, forest: CompiledForest):
+        if forest.value.shape[1] != 2:
+            raise ValueError("Explanations require a binary classifier")
+
+        self.forest = forest
+        self.n_features = forest.n_features_in_
+
+        value = forest.value[:, 1].astype(np.float64)
+        n_nodes = forest.n_nodes
+        nodes = np.arange(n_nodes)
+
+        # Parent de chaque noeud (-1 pour les racines)
+        internal = np.flatnonzero(forest.left != nodes)
+        parent = np.full(n_nodes, -1, dtype=np.intp)
+        parent[forest.left[internal]] = internal
+        parent[forest.right[internal]] = internal
+
+        self.base_value = float(value[forest.roots].mean())
+
+        # Remontée vectorisée de toutes les feuilles vers leur racine :
+        # une entrée (feuille, feature du parent, écart) par arête
+        leaves = np.flatnonzero(forest.left == nodes)
+        slots, features, deltas = [], [], []
+
+        slot = np.arange(len(leaves))
+        current = leaves
+        while current.size:
+            up = parent[current]
+            edge = up >= 0
+            slot, current, up = slot[edge], current[edge], up[edge]
+
+            slots.append(slot)
+            features.append(forest.feature[up].astype(np.intp))
+            deltas.append(value[current] - value[up])
+            current = up
+
+        slots = np.concatenate(slots)
+        features = np.concatenate(features)
+        deltas = np.concatenate(deltas)
+
+        # Regroupement (feuille, feature) puis tri par feuille (CSR)
+        keys, inverse = np.unique(
+            slots * self.n_features + features,
+            return_inverse=True,
+        )
+        summed = np.bincount(inverse, weights=deltas)
+
+        counts = np.bincount(keys // self.n_features, minlength=len(leaves))
+        self.indptr = np.r_[0, np.cumsum(counts)].astype(np.intp)
+        self.path_features = (keys % self.n_features).astype(np.intp)
+        self.path_deltas = summed
+
+        # Noeud (global) → position de la feuille dans le CSR
+        self.leaf_slot = np.full(n_nodes, -1, dtype=np.intp)
+        self.leaf_slot[leaves] = np.arange(len(leaves))
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.indptr.nbytes
+            + self.path_features.nbytes
+            + self.path_deltas.nbytes
+            + self.leaf_slot.nbytes
+        )
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """
+        Contributions N x features ; base_value + somme par ligne
+        = predict_proba(X)[:, 1].
+        """
+        leaves = self.forest.apply(X)
+        n_rows, n_trees = leaves.shape
+
+        slots = self.leaf_slot[leaves].ravel()
+        starts = self.indptr[slots]
+        lengths = self.indptr[slots + 1] - starts
+
+        # Positions de toutes les entrées CSR visitées, en une passe
+        ends = np.cumsum(lengths)
+        shift = np.repeat(starts - (ends - lengths), lengths)
+        entries = shift + np.arange(int(ends[-1]) if len(ends) else 0)
+
+        rows = np.repeat(np.arange(n_rows).repeat(n_trees), lengths)
+        cells = rows * self.n_features + self.path_features[entries]
+
+        contributions = np.bincount(
+            cells,
+            weights=self.path_deltas[entries],
+            minlength=n_rows * self.n_features,
+        )
+        return contributions.reshape(n_rows, self.n_features) / n_trees
+
+    def probability(self, output: np.ndarray) -> np.ndarray:
+        return output
+
+
+# ============================================================
+# Linear models
+# ============================================================
+
+
+class LinearExplainer:
+    """
+    Contributions coefficient x valeur (log-odds) d'un LinearScorer.
+    """
+
+    method = "linear"
+    output = "log_odds"
+
+    def __init__(self, scorer: LinearScorer):
+        self.scorer = scorer
+        self.n_features = scorer.n_features_in_
+        self.base_value = float(scorer.intercept)
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            expected = f"(n, {self.n_features})"
+            raise ValueError(f"X has shape {X.shape}, expected {expected}")
+
+        return X * self.scorer.coef
+
+    def probability(self, output: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-output))
+
+
+def build_explainer(model):
+    """
+    Explainer du modèle (backend natif ou sklearn, compilé si besoin).
+    Lève ValueError si le modèle n'est pas explicable.
+    """
+    native = (CompiledForest, LinearScorer, ConstantScorer)
+    if not isinstance(model, native):
+        from . import compile_model
+
+        model = compile_model(model)
+
+    if isinstance(model, CompiledForest):
+        return TreeExplainer(model)
+    if isinstance(model, LinearScorer):
+        return LinearExplainer(model)
+
+    raise ValueError(f"No explanation method for {type(model).__name__}")
@@ -0,0 +1,330 @@
+# futurisys-ml-deploy/src/ml/native/forest.py
+
+"""
+Évaluateur compilé (tableaux plats NumPy) pour les forêts aléatoires.
+
+Les tableaux de noeuds de chaque arbre sklearn (feature, threshold,
+children, value) sont concaténés dans des tableaux contigus. La forêt
+est évaluée par un parcours vectorisé de tous les arbres à la fois :
+une itération par niveau de profondeur, pour toutes les lignes et
+tous les arbres simultanément (les feuilles bouclent sur elles-mêmes).
+
+Seuls les couples (ligne, arbre) qui n'ont pas encore atteint une
+feuille restent actifs à chaque niveau.
+
+Représentation compacte (``compact``) : indices int32, seuils et
+probabilités des feuilles float32 (~25 octets par noeud au lieu de ~49).
+Les seuils sont arrondis au float32 inférieur : X étant évalué en
+float32, les décisions de parcours sont identiques ; seule la précision
+des probabilités des feuilles est réduite.
+
+Sortie anticipée (``predict_proba_early_exit``, binaire) : les arbres
+sont évalués par tranches ; une ligne sort dès que la borne du vote
+(arbres restants tous à 0 ou tous à 1) garantit sa classe au seuil.
+Sa probabilité est alors la moyenne des arbres évalués (approximative).
+"""
+
+import numpy as np
+
+# Marge des bornes de sortie anticipée (arrondis de la somme des votes)
+_BOUND_EPS = 1e-9
+
+# ============================================================
+# Compiled forest
+# ============================================================
+
+
+class CompiledForest:
+    """
+    Forêt compilée, sans dépendance sklearn à l'inférence.
+    Contrat identique à ``RandomForestClassifier.predict_proba``.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        missing_left: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        n_features: int,
+        classes: np.ndarray,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features_in_ = n_features
+        self.classes_ = classes
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            a.nbytes
+            for a in (
+                self.feature,
+                self.threshold,
+                self.left,
+                self.right,
+                self.missing_left,
+                self.value,
+                self.roots,
+            )
+        )
+
+    @property
+    def precision(self) -> str:
+        return self.value.dtype.name
+
+    # --------------------------------------------------------
+    # Compilation
+    # --------------------------------------------------------
+    @classmethod
+    def from_sklearn(cls, model) -> "CompiledForest":
+        """
+        Compile un RandomForestClassifier (ou un pipeline dont la dernière
+        étape en est un et dont les étapes précédentes sont des samplers).
+        Lève ValueError si le modèle n'est pas compilable.
+        """
+        model = unwrap_estimator(model)
+
+        estimators = getattr(model, "estimators_", None)
+        if not estimators or not hasattr(estimators[0], "tree_"):
+            raise ValueError(
+                f"Not a fitted tree ensemble: {type(model).__name__}",
+            )
+
+        features, thresholds, lefts, rights = [], [], [], []
+        missing, values, roots = [], [], []
+        offset = 0
+        max_depth = 0
+
+        for estimator in estimators:
+            tree = estimator.tree_
+            n = tree.node_count
+            nodes = np.arange(offset, offset + n)
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            lefts.append(np.where(is_leaf, nodes, tree.children_left + offset))
+            rights.append(
+                np.where(is_leaf, nodes, tree.children_right + offset),
+            )
+            missing.append(
+                np.asarray(
+                    getattr(tree, "missing_go_to_left", np.zeros(n)),
+                    dtype=bool,
+                )
+            )
+
+            # Probabilités par feuille (normalisation identique à sklearn)
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(value / normalizer)
+
+            roots.append(offset)
+            offset += n
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            missing_left=np.concatenate(missing),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=int(max_depth),
+            n_features=int(model.n_features_in_),
+            classes=np.asarray(model.classes_),
+        )
+
+    def compact(self) -> "CompiledForest":
+        """
+        Copie en précision réduite : indices int32, seuils et
+        probabilités float32.
+        """
+        if self.n_nodes >= np.iinfo(np.int32).max:
+            raise ValueError("Forest too large for int32 node indices")
+
+        # Plus grand float32 <= seuil : pour x float32,
+        # x <= seuil  <=>  x <= seuil32
+        threshold = self.threshold.astype(np.float32)
+        above = threshold.astype(np.float64) > self.threshold
+        threshold[above] = np.nextafter(threshold[above], np.float32(-np.inf))
+
+        return type(self)(
+            feature=self.feature.astype(np.int32),
+            threshold=threshold,
+            left=self.left.astype(np.int32),
+            right=self.right.astype(np.int32),
+            missing_left=self.missing_left.copy(),
+            value=self.value.astype(np.float32),
+            roots=self.roots.astype(np.int32),
+            max_depth=self.max_depth,
+            n_features=self.n_features_in_,
+            classes=self.classes_,
+        )
+
+    # --------------------------------------------------------
+    # Inference
+    # --------------------------------------------------------
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """
+        Indices (globaux) des feuilles atteintes : N x n_trees.
+        """
+        return self._traverse(self._check_input(X), self.roots)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Moyenne des probabilités des feuilles sur tous les arbres.
+        """
+        return self.value[self.apply(X)].mean(axis=1, dtype=np.float64)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def predict_proba_early_exit(
+        self,
+        X: np.ndarray,
+        threshold: float = 0.5,
+        chunk_trees: int = 32,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Probabilités avec sortie anticipée (classifieur binaire).
+
+        Retourne ``(proba, n_trees_evaluated)`` : une ligne dont
+        ``n_trees_evaluated < n_trees`` a une classe exacte (même
+        décision que predict_proba au seuil) mais une probabilité
+        approximative.
+        """
+        if self.value.shape[1] != 2:
+            raise ValueError("Early exit requires a binary classifier")
+
+        X = self._check_input(X)
+        n_rows = X.shape[0]
+        n_trees = self.n_trees
+        chunk_trees = max(1, chunk_trees)
+
+        # Somme des votes (probabilités des feuilles) des arbres évalués
+        votes = np.zeros((n_rows, 2))
+        evaluated = np.zeros(n_rows, dtype=np.intp)
+        active = np.arange(n_rows)
+
+        # Aucune classe n'est garantie avant la majorité des arbres :
+        # première passe sur n_trees // 2 + 1 arbres, puis par tranches
+        start, stop = 0, min(n_trees // 2 + 1, n_trees)
+        while start < n_trees:
+            roots = self.roots[start:stop]
+            leaves = self._traverse(X[active], roots)
+            votes[active] += self.value[leaves].sum(axis=1, dtype=np.float64)
+            evaluated[active] += len(roots)
+
+            # Probabilité finale (classe 1) bornée par
+            # [S / T, (S + arbres restants) / T]
+            positive = votes[active, 1]
+            remaining = n_trees - evaluated[active]
+            lower = positive / n_trees
+            upper = (positive + remaining) / n_trees
+
+            # Marge : jamais de sortie sur une égalité au seuil
+            decided = (lower > threshold + _BOUND_EPS) | (
+                upper < threshold - _BOUND_EPS
+            )
+            active = active[~decided]
+            if not active.size:
+                break
+
+            start, stop = stop, min(stop + chunk_trees, n_trees)
+
+        return votes / evaluated[:, None], evaluated
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _check_input(self, X: np.ndarray) -> np.ndarray:
+        # sklearn évalue les arbres en float32 : même conversion pour parité
+        X = np.asarray(X, dtype=np.float32)
+
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, expected (n, {self.n_features_in_})"
+            )
+
+        return X
+
+    def _traverse(self, X: np.ndarray, roots: np.ndarray) -> np.ndarray:
+        """
+        Feuilles atteintes depuis les racines ``roots`` : N x len(roots).
+        """
+        has_nan = bool(np.isnan(X).any())
+        n_rows = X.shape[0]
+        n_trees = len(roots)
+
+        # Couples (ligne, arbre) encore actifs, aplatis en 1D.
+        # Indices de parcours en intp (indexer avec des int32 impose
+        # une conversion à chaque accès)
+        leaves = np.tile(roots.astype(np.intp), n_rows)
+        rows = np.repeat(np.arange(n_rows), n_trees)
+        nodes = leaves.copy()
+        active = np.flatnonzero(self.left[nodes] != nodes)
+
+        rows, nodes = rows[active], nodes[active]
+
+        while active.size:
+            x = X[rows, self.feature[nodes]]
+            go_left = x <= self.threshold[nodes]
+            if has_nan:
+                go_left |= np.isnan(x) & self.missing_left[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            nodes = nodes.astype(np.intp, copy=False)
+
+            # Les feuilles bouclent sur elles-mêmes : on les retire
+            done = self.left[nodes] == nodes
+            leaves[active[done]] = nodes[done]
+
+            keep = ~done
+            active, rows, nodes = active[keep], rows[keep], nodes[keep]
+
+        return leaves.reshape(n_rows, n_trees)
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+
+def unwrap_estimator(model):
+    """
+    Retourne l'estimateur final d'un pipeline de prédiction.
+    Seuls les samplers (SMOTE…, ignorés à l'inférence) sont tolérés
+    avant l'estimateur : tout transformer rend le modèle non compilable.
+    """
+    steps = getattr(model, "steps", None)
+    if not steps:
+        return model
+
+    for name, step in steps[:-1]:
+        if step in (None, "passthrough"):
+            continue
+        if hasattr(step, "transform") or not hasattr(step, "fit_resample"):
+            raise ValueError(f"Pipeline step '{name}' is not compilable")
+
+    return steps[-1][1]
@@ -0,0 +1,113 @@
+# futurisys-ml-deploy/src/ml/native/linear.py
+
+"""
+Scoreur linéaire natif pour la régression logistique binaire.
+
+Les paramètres (coefficients, intercept et éventuel StandardScaler)
+sont extraits au chargement ; le scaler est replié dans les coefficients.
+Une ligne comme une matrice se scorent en un seul produit matriciel
+suivi d'une sigmoïde.
+"""
+
+import numpy as np
+
+# ============================================================
+# Linear scorer
+# ============================================================
+
+
+class LinearScorer:
+    """
+    Régression logistique binaire : p = sigmoid(X @ coef + intercept).
+    Contrat identique à ``LogisticRegression.predict_proba``.
+    """
+
+    def __init__(
+        self,
+        coef: np.ndarray,
+        intercept: float,
+        n_features: int,
+        classes: np.ndarray,
+    ):
+        self.coef = coef
+        self.intercept = intercept
+        self.n_features_in_ = n_features
+        self.classes_ = classes
+
+    # --------------------------------------------------------
+    # Compilation
+    # --------------------------------------------------------
+    @classmethod
+    def from_sklearn(cls, model) -> "LinearScorer":
+        """
+        Extrait les paramètres d'une LogisticRegression binaire,
+        éventuellement précédée d'un StandardScaler (pipeline).
+        Lève ValueError si le modèle n'est pas compilable.
+        """
+        scaler = None
+        steps = getattr(model, "steps", None)
+
+        if steps:
+            transformers = [
+                step
+                for _, step in steps[:-1]
+                if step is not None and step != "passthrough"
+            ]
+            if len(transformers) > 1 or (
+                transformers and not _is_standard_scaler(transformers[0])
+            ):
+                raise ValueError("Only StandardScaler pipelines are supported")
+            scaler = transformers[0] if transformers else None
+            model = steps[-1][1]
+
+        coef = getattr(model, "coef_", None)
+        if coef is None or not hasattr(model, "predict_proba"):
+            raise ValueError(
+                f"Not a fitted linear classifier: {type(model).__name__}",
+            )
+        if coef.shape[0] != 1 or len(model.classes_) != 2:
+            raise ValueError("Only binary linear classifiers are supported")
+
+        w = np.asarray(coef[0], dtype=np.float64)
+        b = float(np.asarray(model.intercept_).ravel()[0])
+
+        # Repli du scaler : w·(x - mean)/scale + b
+        if scaler is not None:
+            scale = getattr(scaler, "scale_", None)
+            mean = getattr(scaler, "mean_", None)
+            if scale is not None:
+                w = w / scale
+            if mean is not None and getattr(scaler, "with_mean", True):
+                b = b - float(w @ mean)
+
+        return cls(
+            coef=np.ascontiguousarray(w),
+            intercept=b,
+            n_features=int(w.shape[0]),
+            classes=np.asarray(model.classes_),
+        )
+
+    # --------------------------------------------------------
+    # Inference
+    # --------------------------------------------------------
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, expected (n, {self.n_features_in_})"
+            )
+
+        return X @ self.coef + self.intercept
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        # Sigmoïde numériquement stable : exp(-log(1 + exp(-z)))
+        p = np.exp(-np.logaddexp(0.0, -self.decision_function(X)))
+        return np.column_stack((1.0 - p, p))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[(self.decision_function(X) > 0).astype(np.intp)]
+
+
+def _is_standard_scaler(step) -> bool:
+    return type(step).__name__ == "StandardScaler"
@@ -0,0 +1,381 @@
+# futurisys-ml-deploy/src/ml/pool.py
+
+"""
+Exécution de l'inférence dans un pool de processus.
+
+Le scoring des forêts est CPU-bound et tient le GIL : les threads
+(asyncio.to_thread, worker de prédiction) plafonnent à un coeur.
+Le pool déporte predict_proba dans des processus dédiés.
+
+Partage des modèles :
+- le processus principal exporte une fois par version le modèle servi
+  (joblib.dump non compressé) dans INFERENCE_POOL_DIR
+- chaque processus du pool le recharge avec mmap_mode="r" : les tableaux
+  NumPy pointent sur les mêmes pages du cache disque, la mémoire ne
+  se multiplie pas par processus
+
+Le partage est effectif pour les backends natifs (MODEL_BACKENDS=...=native),
+dont l'état se limite à des tableaux NumPy ; les arbres sklearn recopient
+leurs noeuds au chargement.
+
+Les lots sont découpés en tranches contiguës, une par processus,
+transmises sans conversion (pickle protocole 5 d'un ndarray contigu).
+
+Configuration (variables d'environnement) :
+- INFERENCE_POOL_SIZE         : nombre de processus (0 = désactivé)
+- INFERENCE_POOL_TIMEOUT_S    : délai maximal d'un appel, toutes tranches
+                                confondues (secondes)
+- INFERENCE_POOL_RESTART      : "0" pour ne pas relancer un pool cassé
+                                ou dont une tâche a dépassé le délai
+- INFERENCE_POOL_MIN_CHUNK    : taille minimale d'une tranche de lot
+- INFERENCE_POOL_START_METHOD : méthode multiprocessing (spawn par défaut)
+- INFERENCE_POOL_DIR          : répertoire des modèles exportés
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict
+
+import joblib
+import numpy as np
+
+from src.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+INFERENCE_POOL_SIZE = int(os.getenv("INFERENCE_POOL_SIZE", "0"))
+INFERENCE_POOL_TIMEOUT_S = float(os.getenv("INFERENCE_POOL_TIMEOUT_S", "5"))
+INFERENCE_POOL_RESTART = os.getenv("INFERENCE_POOL_RESTART", "1") == "1"
+INFERENCE_POOL_MIN_CHUNK = int(os.getenv("INFERENCE_POOL_MIN_CHUNK", "64"))
+INFERENCE_POOL_START_METHOD = os.getenv(
+    "INFERENCE_POOL_START_METHOD",
+    "spawn",
+)
+INFERENCE_POOL_DIR = os.getenv("INFERENCE_POOL_DIR") or None
+
+# Buckets (ms) de l'histogramme de durée des tâches
+TASK_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class InferencePoolTimeout(TimeoutError):
+    """
+    Une tâche du pool a dépassé INFERENCE_POOL_TIMEOUT_S.
+    """
+
+
+# ============================================================
+# Pool process side
+# ============================================================
+
+# model_name → (path, model) : un seul export actif par modèle
+_worker_models: Dict[str, tuple[str, Any]] = {}
+
+
+def _worker_init(pids) -> None:
+    """
+    Démarrage d'un processus du pool : annonce son PID au processus
+    principal (terminaison d'un processus bloqué, cf. _reset_executor).
+    """
+    pids.put(os.getpid())
+
+
+def _worker_predict_proba(
+    model_name: str,
+    path: str,
+    X: np.ndarray,
+) -> np.ndarray:
+    """
+    Exécuté dans un processus du pool : charge (mmap) l'export
+    au premier appel, puis score la tranche reçue.
+    """
+    cached = _worker_models.get(model_name)
+    if cached is None or cached[0] != path:
+        cached = (path, joblib.load(path, mmap_mode="r"))
+        _worker_models[model_name] = cached
+
+    return np.asarray(cached[1].predict_proba(X), dtype=float)
+
+
+# ============================================================
+# Inference pool
+# ============================================================
+
+
+class InferencePool:
+    """
+    Pool de processus d'inférence (créé au premier appel).
+    Appelé depuis des threads : bloque le thread appelant, pas le GIL.
+    """
+
+    def __init__(
+        self,
+        size: int = INFERENCE_POOL_SIZE,
+        timeout_s: float = INFERENCE_POOL_TIMEOUT_S,
+        restart: bool = INFERENCE_POOL_RESTART,
+        min_chunk: int = INFERENCE_POOL_MIN_CHUNK,
+        start_method: str = INFERENCE_POOL_START_METHOD,
+        export_dir: str | None = INFERENCE_POOL_DIR,
+    ):
+        self.size = size
+        self.timeout_s = timeout_s
+        self.restart = restart
+        self.min_chunk = max(1, min_chunk)
+        self.start_method = start_method
+
+        self._export_dir = Path(export_dir) if export_dir else None
+        self._owns_export_dir = export_dir is None
+        self._exports: Dict[str, tuple[str, str]] = {}  # name → (ver, path)
+        self._export_lock = threading.Lock()
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Exécuteur → (file des PID annoncés, PID connus)
+        self._worker_pids: Dict[ProcessPoolExecutor, tuple[Any, set]] = {}
+
+        self.tasks = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self.task_ms_hist = Histogram(TASK_MS_BUCKETS)
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    def predict_proba(
+        self,
+        model_name: str,
+        version: str,
+        model,
+        X: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Probabilités (N x classes) calculées dans le pool.
+        Lève InferencePoolTimeout si une tranche dépasse le délai.
+        """
+        path = self._export(model_name, version, model)
+        X = np.ascontiguousarray(X, dtype=np.float64)
+
+        executor = self._get_executor()
+        try:
+            return self._run(executor, model_name, path, X)
+        except BrokenProcessPool:
+            if not self.restart:
+                raise
+            logger.warning("Inference pool broken, restarting")
+            self._reset_executor(executor)
+            return self._run(self._get_executor(), model_name, path, X)
+
+    def start(self) -> None:
+        """
+        Démarre les processus du pool (sinon au premier appel).
+        """
+        executor = self._get_executor()
+        # Soumission à vide : force le lancement des processus
+        list(executor.map(abs, range(self.size)))
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._close_pids(self._executor)
+                self._executor = None
+
+        with self._export_lock:
+            if self._owns_export_dir and self._export_dir is not None:
+                shutil.rmtree(self._export_dir, ignore_errors=True)
+                self._export_dir = None
+            self._exports.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "size": self.size,
+            "start_method": self.start_method,
+            "running": self._executor is not None,
+            "timeout_s": self.timeout_s,
+            "restart": self.restart,
+            "min_chunk": self.min_chunk,
+            "tasks": self.tasks,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts,
+            "exports": {
+                name: {"version": version, "path": path}
+                for name, (version, path) in self._exports.items()
+            },
+            "task_ms": self.task_ms_hist.snapshot(),
+        }
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+    def _run(
+        self,
+        executor: ProcessPoolExecutor,
+        model_name: str,
+        path: str,
+        X: np.ndarray,
+    ) -> np.ndarray:
+        n_chunks = min(self.size, max(1, len(X) // self.min_chunk))
+        chunks = np.array_split(X, n_chunks) if n_chunks > 1 else [X]
+
+        start = perf_counter()
+        futures = [
+            executor.submit(_worker_predict_proba, model_name, path, chunk)
+            for chunk in chunks
+        ]
+
+        # Un seul délai pour toutes les tranches
+        done, pending = wait(
+            futures,
+            timeout=self.timeout_s,
+            return_when=FIRST_EXCEPTION,
+        )
+        failed = [f.exception() for f in done if f.exception() is not None]
+
+        # Tranche en échec : inutile d'attendre les autres (sans délai)
+        if failed:
+            for f in pending:
+                f.cancel()
+            raise failed[0]
+
+        if pending:
+            for f in pending:
+                f.cancel()
+            self.timeouts += 1
+
+            # Une tranche en cours ne s'annule pas : le processus bloqué
+            # occuperait son créneau indéfiniment, le pool est recyclé
+            if self.restart:
+                logger.warning("Inference pool task timed out, restarting")
+                self._reset_executor(executor, terminate=True)
+
+            raise InferencePoolTimeout(
+                f"Inference pool task exceeded {self.timeout_s}s",
+            )
+
+        results = [f.result() for f in futures]
+
+        self.tasks += len(futures)
+        self.task_ms_hist.observe((perf_counter() - start) * 1000)
+
+        return results[0] if len(results) == 1 else np.concatenate(results)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        executor = self._executor
+        if executor is not None:
+            return executor
+
+        with self._executor_lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.start_method)
+                pids = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=context,
+                    initializer=_worker_init,
+                    initargs=(pids,),
+                )
+                self._worker_pids[self._executor] = (pids, set())
+            return self._executor
+
+    def _reset_executor(
+        self,
+        failed: ProcessPoolExecutor,
+        terminate: bool = False,
+    ) -> None:
+        """
+        Remplace ``failed`` s'il est toujours l'exécuteur actif
+        (plusieurs threads peuvent constater la même panne : seul le
+        premier le recycle, les suivants utilisent le nouveau).
+        """
+        with self._executor_lock:
+            if self._executor is not failed:
+                return
+
+            self._executor = None
+            self.restarts += 1
+
+            pids = self._close_pids(failed)
+            if terminate:
+                for pid in pids:
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+            failed.shutdown(wait=False, cancel_futures=True)
+
+    def _close_pids(self, executor: ProcessPoolExecutor) -> set:
+        """
+        PID des processus de ``executor`` (annoncés par _worker_init) ;
+        l'exécuteur cesse d'être suivi.
+        """
+        pids_queue, pids = self._worker_pids.pop(executor, (None, set()))
+        if pids_queue is not None:
+            while not pids_queue.empty():
+                pids.add(pids_queue.get())
+            pids_queue.close()
+        return pids
+
+    def _export(self, model_name: str, version: str, model) -> str:
+        """
+        Exporte le modèle (une fois par version) et retourne son chemin.
+        """
+        export = self._exports.get(model_name)
+        if export is not None and export[0] == version:
+            return export[1]
+
+        with self._export_lock:
+            export = self._exports.get(model_name)
+            if export is not None and export[0] == version:
+                return export[1]
+
+            if self._export_dir is None:
+                self._export_dir = Path(tempfile.mkdtemp(prefix="ml-pool-"))
+            self._export_dir.mkdir(parents=True, exist_ok=True)
+
+            digest = hashlib.sha1(version.encode()).hexdigest()[:12]
+            path = self._export_dir / f"{model_name}-{digest}.joblib"
+
+            # Écriture atomique : les processus ne voient jamais
+            # un fichier partiel
+            tmp_path = path.with_suffix(".tmp")
+            joblib.dump(model, tmp_path)
+            os.replace(tmp_path, path)
+
+            # Ancienne version : les processus qui la mappent encore
+            # conservent l'accès (unlink POSIX)
+            if export is not None and export[1] != str(path):
+                Path(export[1]).unlink(missing_ok=True)
+
+            self._exports[model_name] = (version, str(path))
+            logger.info("Model %s exported to pool: %s", model_name, path)
+
+            return str(path)
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_pool = InferencePool()
+
+
+def get_inference_pool() -> InferencePool:
+    return _pool
@@ -4,7 +4,8 @@ from typing import Optional
 
 import numpy as np
 
-from src.ml.model_registry import get_features, get_model
+from src.ml.features import get_feature_plan
+from src.ml.model_registry import get_model
 
 # Valeurs catégorielles autorisées (source de vérité = CSV)
 FREQUENCE_DEPLACEMENT_MAPPING = {
@@ -22,25 +23,19 @@ def prepare_features(payload: dict) -> np.ndarray:
 
     - Valide les catégories métier
     - Encode les variables catégorielles
-    - Retourne un array numpy 2D
+    - Retourne un array numpy 2D (via le plan de features compilé)
     """
     freq = payload.get("frequence_deplacement")
 
     if freq not in ALLOWED_FREQUENCE_DEPLACEMENT:
         raise ValueError(f"Invalid frequence_deplacement value: {freq}")
 
-    encoded_freq = FREQUENCE_DEPLACEMENT_MAPPING[freq]
-
-    features = get_features()
-
-    vector = []
-    for feature in features:
-        if feature == "frequence_deplacement":
-            vector.append(encoded_freq)
-        else:
-            vector.append(payload.get(feature, 0))
+    encoded = {
+        **payload,
+        "frequence_deplacement": FREQUENCE_DEPLACEMENT_MAPPING[freq],
+    }
 
-    return np.array(vector, dtype=float).reshape(1, -1)
+    return get_feature_plan().assemble([encoded])
 
 
 def predict(payload: dict, model_name: Optional[str] = None) -> dict:
@@ -0,0 +1,128 @@
+# futurisys-ml-deploy/src/ml/reload.py
+
+"""
+Rechargement à chaud du registry sur modification de metadata.json.
+
+Un thread de fond compare périodiquement la date de modification de
+metadata.json à celle du snapshot actif et appelle reload_registry()
+si elle a changé. Le chargement et la validation du nouveau jeu
+d'artefacts se font hors de l'event loop : le trafic en cours continue
+d'être servi par l'ancien snapshot jusqu'au remplacement.
+
+Configuration (variables d'environnement) :
+- MODEL_RELOAD_POLL_S : période de scrutation en secondes (0 = désactivé)
+"""
+
+import logging
+import os
+import threading
+
+from src.ml.model_registry import (
+    RegistryReloadError,
+    get_snapshot,
+    metadata_mtime_ns,
+    reload_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+MODEL_RELOAD_POLL_S = float(os.getenv("MODEL_RELOAD_POLL_S", "0"))
+
+# ============================================================
+# Metadata watcher
+# ============================================================
+
+
+class MetadataWatcher:
+    """
+    Thread de scrutation de metadata.json.
+    """
+
+    def __init__(self, poll_s: float = MODEL_RELOAD_POLL_S):
+        self.poll_s = poll_s
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: str | None = None
+
+        # mtime du dernier fichier rejeté (pas de nouvelle tentative)
+        self._failed_mtime_ns: int | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.poll_s > 0
+
+    def start(self) -> None:
+        if not self.enabled or self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="metadata-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """
+        Recharge le registry si metadata.json a changé.
+        Retourne True si un nouveau snapshot a été publié.
+        """
+        mtime_ns = metadata_mtime_ns()
+        known = (get_snapshot().metadata_mtime_ns, self._failed_mtime_ns)
+        if mtime_ns in known:
+            return False
+
+        try:
+            reload_registry()
+        except RegistryReloadError as e:
+            # Le snapshot actif est conservé ; nouvelle tentative
+            # uniquement sur une nouvelle modification du fichier
+            self._failed_mtime_ns = mtime_ns
+            self.failures += 1
+            self.last_error = str(e)
+            return False
+
+        self.reloads += 1
+        self.last_error = None
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "poll_s": self.poll_s,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Metadata watcher check failed")
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_watcher = MetadataWatcher()
+
+
+def get_metadata_watcher() -> MetadataWatcher:
+    return _watcher
@@ -0,0 +1,315 @@
+# futurisys-ml-deploy/src/ml/session.py
+
+"""
+Sessions d'inférence longue durée (une par modèle du registry).
+
+Une session est construite une seule fois par modèle et par snapshot
+du registry (cf. reload_registry) et conserve :
+- le modèle résolu depuis le snapshot
+- le plan d'assemblage des features (ordre strict, cf. features.py)
+- les métadonnées du modèle
+
+Chaque prédiction ne fait qu'un seul passage ``predict_proba`` :
+la classe est dérivée des probabilités (équivalent de ``model.predict``).
+
+Sortie anticipée (opt-in, forêts natives) : pour les modèles de
+EARLY_EXIT_MODELS, les lots d'au moins EARLY_EXIT_MIN_ROWS lignes sont
+scorés par tranches d'arbres ; une ligne s'arrête dès que sa classe au
+seuil 0.5 est garantie. La classe reste exacte, la probabilité devient
+approximative (``probability_exact`` = False).
+
+Explications (cf. native/explain.py) : l'explainer du modèle est
+construit une seule fois par session (tables de contributions
+précalculées), au warm-up ou à la première explication.
+
+Configuration (variables d'environnement) :
+- EARLY_EXIT_MODELS      : modèles concernés (séparés par des virgules)
+- EARLY_EXIT_CHUNK_TREES : arbres par tranche après la première passe
+- EARLY_EXIT_MIN_ROWS    : taille minimale de lot (en deçà : exact)
+"""
+
+import logging
+import os
+import threading
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.core.timing import record_stage, stage
+from src.ml.features import get_feature_plan
+from src.ml.model_registry import (
+    RegistrySnapshot,
+    get_snapshot,
+    resolve_model_name,
+)
+from src.ml.native.explain import build_explainer
+from src.ml.pool import get_inference_pool
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+EARLY_EXIT_MODELS = [
+    name.strip()
+    for name in os.getenv("EARLY_EXIT_MODELS", "").split(",")
+    if name.strip()
+]
+EARLY_EXIT_CHUNK_TREES = int(os.getenv("EARLY_EXIT_CHUNK_TREES", "32"))
+
+# Parcours vectorisé par niveau : pour une ligne seule, une passe coûte
+# presque autant que la forêt entière ; gain mesuré à partir de ~32 lignes
+EARLY_EXIT_MIN_ROWS = int(os.getenv("EARLY_EXIT_MIN_ROWS", "64"))
+
+# Seuil de décision (classe positive)
+DECISION_THRESHOLD = 0.5
+
+# ============================================================
+# Inference session
+# ============================================================
+
+
+class InferenceSession:
+    """
+    Session d'inférence liée à un modèle du registry.
+    Construite une fois, réutilisée pour toutes les requêtes.
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        snapshot: RegistrySnapshot | None = None,
+    ):
+        snapshot = snapshot or get_snapshot()
+
+        self.model_name = resolve_model_name(model_name)
+        self.model = snapshot.get_model(self.model_name)
+        self.plan = get_feature_plan(snapshot.features)
+        self.features = self.plan.features
+        self.metadata = snapshot.metadata
+        self.version = snapshot.versions[self.model_name]
+        self.generation = snapshot.generation
+
+        classes = getattr(self.model, "classes_", None)
+        self.classes = np.asarray(classes) if classes is not None else None
+
+        self.early_exit = self.model_name in EARLY_EXIT_MODELS and hasattr(
+            self.model, "predict_proba_early_exit"
+        )
+        if self.model_name in EARLY_EXIT_MODELS and not self.early_exit:
+            logger.warning(
+                "Early exit unavailable for %s (backend %s)",
+                self.model_name,
+                type(self.model).__name__,
+            )
+
+        # (modèle, explainer ou erreur) : construit à la première demande
+        self._explainer: Tuple[Any, Any] | None = None
+        self._explainer_lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # Input preparation
+    # --------------------------------------------------------
+    def prepare(self, rows: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Construit la matrice N x features dans l'ordre strict du training.
+        """
+        with stage("prepare", model=self.model_name):
+            return self.plan.assemble(rows)
+
+    # --------------------------------------------------------
+    # Inference
+    # --------------------------------------------------------
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Probabilités de classe (N x 2), un seul appel au modèle
+        (dans le pool de processus s'il est activé, cf. src/ml/pool.py).
+        """
+        pool = get_inference_pool()
+        if pool.enabled:
+            return pool.predict_proba(
+                self.model_name,
+                self.version,
+                self.model,
+                X,
+            )
+
+        return np.asarray(self.model.predict_proba(X), dtype=float)
+
+    def predict_batch(
+        self,
+        rows: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Inférence sur un lot de payloads normalisés.
+        """
+        if not rows:
+            return []
+
+        return self.predict_matrix(self.prepare(rows))
+
+    def predict_matrix(self, X: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Inférence sur une matrice déjà préparée (N x features).
+        """
+        return self._format(*self._score(X))
+
+    def predict(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Inférence sur un seul payload normalisé.
+        Utilise un buffer ligne du pool (aucune allocation de matrice).
+        """
+        start = perf_counter()
+        with self.plan.row(row) as X:
+            record_stage("prepare", perf_counter() - start, self.model_name)
+            proba, exact = self._score(X)
+
+        return self._format(proba, exact)[0]
+
+    def classify(
+        self,
+        X: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classes, probabilités positives et masque des probabilités
+        exactes sous forme de tableaux (sans formatage par ligne,
+        cf. scoring en masse dans bulk.py).
+        """
+        proba, exact = self._score(X)
+        if exact is None:
+            exact = np.ones(len(proba), dtype=bool)
+        return self._classes(proba), proba[:, 1], exact
+
+    # --------------------------------------------------------
+    # Explanations
+    # --------------------------------------------------------
+    @property
+    def explainer(self):
+        """
+        Explainer du modèle servi, construit une seule fois.
+        Lève ValueError si le modèle n'est pas explicable.
+        """
+        cached = self._explainer
+        if cached is None or cached[0] is not self.model:
+            with self._explainer_lock:
+                cached = self._explainer
+                if cached is None or cached[0] is not self.model:
+                    try:
+                        built = build_explainer(self.model)
+                    except ValueError as e:
+                        built = e
+                    cached = self._explainer = (self.model, built)
+
+        if isinstance(cached[1], ValueError):
+            raise cached[1]
+        return cached[1]
+
+    def explain(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contributions par feature (N x features) et sortie expliquée
+        (probabilité positive, ou log-odds pour un modèle linéaire) :
+        sortie = base_value + somme des contributions de la ligne.
+        """
+        explainer = self.explainer
+        with stage("explain", model=self.model_name):
+            contributions = explainer.explain(X)
+        output = explainer.base_value + contributions.sum(axis=1)
+        return contributions, output
+
+    def _classes(self, proba: np.ndarray) -> np.ndarray:
+        """
+        Classe de probabilité maximale (équivalent de model.predict).
+        """
+        predictions = proba.argmax(axis=1)
+        if self.classes is not None:
+            predictions = self.classes[predictions]
+        return predictions
+
+    def _score(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray | None]:
+        """
+        Probabilités + masque des probabilités exactes
+        (None : toutes exactes).
+        """
+        with stage("predict", model=self.model_name):
+            if (
+                self.early_exit
+                and len(X) >= EARLY_EXIT_MIN_ROWS
+                and not get_inference_pool().enabled
+            ):
+                proba, evaluated = self.model.predict_proba_early_exit(
+                    X,
+                    threshold=DECISION_THRESHOLD,
+                    chunk_trees=EARLY_EXIT_CHUNK_TREES,
+                )
+                return proba, evaluated == self.model.n_trees
+
+            return self.predict_proba(X), None
+
+    def _format(
+        self,
+        proba: np.ndarray,
+        exact: np.ndarray | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Classe (équivalent de model.predict) + probabilité positive.
+        """
+        if exact is None:
+            exact = np.ones(len(proba), dtype=bool)
+
+        predictions = self._classes(proba)
+
+        model_name = self.metadata.get("model_name")
+        model_version = self.metadata.get("version")
+
+        return [
+            {
+                "prediction": int(prediction),
+                "probability": float(p),
+                "probability_exact": bool(is_exact),
+                "model_name": model_name,
+                "model_version": model_version,
+            }
+            for prediction, p, is_exact in zip(
+                predictions,
+                proba[:, 1],
+                exact,
+            )
+        ]
+
+
+# ============================================================
+# Session cache (une session par modèle et par snapshot)
+# ============================================================
+
+_sessions: Dict[Tuple[int, str], InferenceSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_inference_session(model_name: str | None = None) -> InferenceSession:
+    """
+    Retourne la session d'inférence (construite une seule fois) du modèle,
+    pour le snapshot actif du registry.
+    Lève ValueError si le modèle est inconnu.
+    """
+    snapshot = get_snapshot()
+    key = (snapshot.generation, resolve_model_name(model_name))
+
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = InferenceSession(key[1], snapshot=snapshot)
+
+            # Sessions des snapshots précédents : les requêtes en cours
+            # conservent leur référence, le cache les libère
+            for stale in [k for k in _sessions if k[0] != key[0]]:
+                del _sessions[stale]
+
+            _sessions[key] = session
+
+    return session
@@ -0,0 +1,415 @@
+# futurisys-ml-deploy/src/ml/shadow.py
+
+"""
+Shadow scoring : évaluation de modèles candidats sur le trafic réel.
+
+Une fraction des requêtes scorées par le modèle principal est rejouée,
+hors du chemin de la requête, sur un ou plusieurs modèles candidats :
+- échantillonnage + mise en file non bloquante (file pleine → ignoré)
+- scoring en lot dans un thread dédié
+- comparaison au modèle principal : accord des classes, écart de
+  probabilité, latence ; les lignes dont une probabilité est
+  approximative (sortie anticipée, cf. session.py) sont exclues des
+  statistiques et marquées dans le fichier JSONL
+- écriture bufferisée (par lots) dans un fichier JSONL
+
+Le scoring des candidats passe par session.predict_batch, donc par le
+pool de processus s'il est activé (INFERENCE_POOL_SIZE > 0) : le thread
+shadow attend alors les processus sans tenir le GIL. Sans pool, le
+scoring des forêts tient le GIL et dispute le CPU aux requêtes servies ;
+le thread est alors limité à SHADOW_MAX_DUTY de son temps (pause
+proportionnelle après chaque lot, les appels échantillonnés pendant la
+pause sont ignorés si la file est pleine).
+
+Configuration (variables d'environnement) :
+- SHADOW_MODELS      : modèles candidats (séparés par des virgules, vide = off)
+- SHADOW_FRACTION    : fraction des requêtes rejouées (0 → 1)
+- SHADOW_SINK_PATH   : fichier JSONL des sorties (vide = pas d'écriture)
+- SHADOW_FLUSH_ROWS  : lignes bufferisées avant écriture
+- SHADOW_FLUSH_S     : délai maximal avant écriture (secondes)
+- SHADOW_QUEUE_DEPTH : requêtes en attente de scoring shadow
+- SHADOW_MAX_DUTY    : part maximale du temps passée à scorer sans pool
+                       (0 → 1, 1 = pas de limite)
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Any, Dict, List
+
+from src.core.metrics import Histogram
+from src.ml.pool import get_inference_pool
+from src.ml.session import get_inference_session
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Configuration
+# ============================================================
+
+SHADOW_MODELS = [
+    m.strip() for m in os.getenv("SHADOW_MODELS", "").split(",") if m.strip()
+]
+SHADOW_FRACTION = float(os.getenv("SHADOW_FRACTION", "0.1"))
+SHADOW_SINK_PATH = os.getenv("SHADOW_SINK_PATH", "data/shadow/shadow.jsonl")
+SHADOW_FLUSH_ROWS = int(os.getenv("SHADOW_FLUSH_ROWS", "256"))
+SHADOW_FLUSH_S = float(os.getenv("SHADOW_FLUSH_S", "5"))
+SHADOW_QUEUE_DEPTH = int(os.getenv("SHADOW_QUEUE_DEPTH", "1024"))
+SHADOW_MAX_DUTY = float(os.getenv("SHADOW_MAX_DUTY", "0.25"))
+
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+DELTA_BUCKETS = (0.001, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5)
+
+# ============================================================
+# Comparison statistics (principal vs candidat)
+# ============================================================
+
+
+class ShadowComparison:
+    """
+    Statistiques cumulées d'un couple (modèle principal, candidat),
+    sur les seules lignes aux probabilités exactes des deux côtés.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.approximate_rows = 0
+        self.agreements = 0
+        self.errors = 0
+        self.delta_sum = 0.0
+        self.delta_max = 0.0
+        self.delta_hist = Histogram(DELTA_BUCKETS)
+        self.primary_latency_hist = Histogram(LATENCY_BUCKETS_MS)
+        self.shadow_latency_hist = Histogram(LATENCY_BUCKETS_MS)
+
+    def observe(
+        self,
+        primary: List[Dict[str, Any]],
+        shadow: List[Dict[str, Any]],
+        primary_latency_ms: float,
+        shadow_latency_ms: float,
+    ) -> None:
+        for p, s in zip(primary, shadow):
+            if not _exact(p) or not _exact(s):
+                self.approximate_rows += 1
+                continue
+
+            delta = abs(s["probability"] - p["probability"])
+            self.rows += 1
+            self.agreements += s["prediction"] == p["prediction"]
+            self.delta_sum += delta
+            self.delta_max = max(self.delta_max, delta)
+            self.delta_hist.observe(delta)
+
+        self.primary_latency_hist.observe(primary_latency_ms)
+        self.shadow_latency_hist.observe(shadow_latency_ms)
+
+    def as_dict(self) -> dict:
+        rows = self.rows
+        return {
+            "rows": rows,
+            "approximate_rows": self.approximate_rows,
+            "errors": self.errors,
+            "agreement_rate": self.agreements / rows if rows else None,
+            "probability_delta": {
+                "mean_abs": self.delta_sum / rows if rows else None,
+                "max_abs": self.delta_max,
+                "histogram": self.delta_hist.snapshot(),
+            },
+            "latency_ms": {
+                "primary": self.primary_latency_hist.snapshot(),
+                "shadow": self.shadow_latency_hist.snapshot(),
+            },
+        }
+
+
+def _exact(result: Dict[str, Any]) -> bool:
+    return result.get("probability_exact", True)
+
+
+# ============================================================
+# Shadow scorer
+# ============================================================
+
+
+class ShadowScorer:
+    """
+    File + thread de scoring shadow + sink JSONL bufferisé.
+    """
+
+    def __init__(
+        self,
+        models: List[str] = SHADOW_MODELS,
+        fraction: float = SHADOW_FRACTION,
+        sink_path: str | None = SHADOW_SINK_PATH,
+        flush_rows: int = SHADOW_FLUSH_ROWS,
+        flush_s: float = SHADOW_FLUSH_S,
+        queue_depth: int = SHADOW_QUEUE_DEPTH,
+        max_duty: float = SHADOW_MAX_DUTY,
+    ):
+        self.models = list(models)
+        self.fraction = fraction
+        self.sink_path = Path(sink_path) if sink_path else None
+        self.flush_rows = flush_rows
+        self.flush_s = flush_s
+        self.max_duty = min(max(max_duty, 0.01), 1.0)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_depth)
+        self._buffer: List[str] = []
+        self._last_flush = monotonic()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+        # (modèle principal, candidat) → statistiques
+        self._comparisons: Dict[tuple[str, str], ShadowComparison] = {}
+
+        self.sampled = 0
+        self.dropped = 0
+        self.written = 0
+        self.throttled_s = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.models) and self.fraction > 0
+
+    # --------------------------------------------------------
+    # Request path (non bloquant)
+    # --------------------------------------------------------
+    def observe(
+        self,
+        model_name: str,
+        version: str,
+        rows: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        latency_ms: float,
+    ) -> None:
+        """
+        Échantillonne un appel du modèle principal (lignes normalisées
+        et résultats) pour le rejouer sur les candidats.
+        """
+        if not self.enabled or not rows or random.random() >= self.fraction:
+            return
+
+        try:
+            self._queue.put_nowait(
+                (model_name, version, rows, results, latency_ms),
+            )
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        self.sampled += 1
+        self._ensure_started()
+
+    # --------------------------------------------------------
+    # Reporting
+    # --------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            comparisons = {
+                f"{primary}→{candidate}": comparison.as_dict()
+                for (primary, candidate), comparison in sorted(
+                    self._comparisons.items()
+                )
+            }
+
+        return {
+            "config": {
+                "enabled": self.enabled,
+                "models": self.models,
+                "fraction": self.fraction,
+                "sink_path": str(self.sink_path) if self.sink_path else None,
+                "max_duty": self.max_duty,
+            },
+            "sampled": self.sampled,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize(),
+            "written": self.written,
+            "throttled_s": self.throttled_s,
+            "comparisons": comparisons,
+        }
+
+    # --------------------------------------------------------
+    # Background scoring
+    # --------------------------------------------------------
+    def drain(self) -> None:
+        """
+        Score les appels en file puis écrit le buffer
+        (thread de fond arrêté, cf. stop).
+        """
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._score(*item)
+
+        self.flush()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                # File pleine : le thread voit _stopping après son lot
+                pass
+            self._thread.join()
+            self._thread = None
+            self._stopping.clear()
+        self.drain()
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            self._last_flush = monotonic()
+
+        if not lines or self.sink_path is None:
+            return
+
+        try:
+            self.sink_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.sink_path.open("a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except OSError:
+            logger.exception("Shadow sink write failed")
+            return
+
+        self.written += len(lines)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="shadow-scorer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_s)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                break
+
+            if item:
+                start = perf_counter()
+                try:
+                    self._score(*item)
+                except Exception:
+                    logger.exception("Shadow scoring failed")
+                self._throttle(perf_counter() - start)
+
+            if self._stopping.is_set():
+                break
+
+            if monotonic() - self._last_flush >= self.flush_s:
+                self.flush()
+
+    def _throttle(self, busy_s: float) -> None:
+        """
+        Pause après un lot scoré sans pool (GIL tenu) : le thread ne
+        score pas plus de max_duty du temps. Interrompue par stop().
+        """
+        if self.max_duty >= 1 or get_inference_pool().enabled:
+            return
+
+        pause_s = busy_s * (1 - self.max_duty) / self.max_duty
+        self.throttled_s += pause_s
+        self._stopping.wait(pause_s)
+
+    def _score(
+        self,
+        model_name: str,
+        version: str,
+        rows: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        latency_ms: float,
+    ) -> None:
+        now = datetime.now(UTC).isoformat()
+
+        for candidate in self.models:
+            if candidate == model_name:
+                continue
+
+            comparison = self._comparison(model_name, candidate)
+
+            try:
+                session = get_inference_session(candidate)
+                start = perf_counter()
+                shadow = session.predict_batch(rows)
+                shadow_latency_ms = (perf_counter() - start) * 1000
+            except Exception:
+                comparison.errors += 1
+                logger.exception("Shadow model %s failed", candidate)
+                continue
+
+            lines = [
+                json.dumps(
+                    {
+                        "ts": now,
+                        "primary_model": model_name,
+                        "primary_version": version,
+                        "shadow_model": candidate,
+                        "shadow_version": session.version,
+                        "batch_size": len(rows),
+                        "prediction": p["prediction"],
+                        "probability": p["probability"],
+                        "probability_exact": _exact(p),
+                        "shadow_prediction": s["prediction"],
+                        "shadow_probability": s["probability"],
+                        "shadow_probability_exact": _exact(s),
+                        "primary_latency_ms": latency_ms,
+                        "shadow_latency_ms": shadow_latency_ms,
+                    }
+                )
+                + "\n"
+                for p, s in zip(results, shadow)
+            ]
+
+            with self._lock:
+                comparison.observe(
+                    results,
+                    shadow,
+                    latency_ms,
+                    shadow_latency_ms,
+                )
+                self._buffer.extend(lines)
+                full = len(self._buffer) >= self.flush_rows
+
+            if full:
+                self.flush()
+
+    def _comparison(self, primary: str, candidate: str) -> ShadowComparison:
+        with self._lock:
+            key = (primary, candidate)
+            if key not in self._comparisons:
+                self._comparisons[key] = ShadowComparison()
+            return self._comparisons[key]
+
+
+# ============================================================
+# Singleton
+# ============================================================
+
+_scorer = ShadowScorer()
+
+
+def get_shadow_scorer() -> ShadowScorer:
+    return _scorer
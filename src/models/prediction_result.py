@@ -4,10 +4,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
     Float,
     ForeignKey,
     Integer,
+    true,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,6 +40,14 @@ class PredictionResult(Base):
         nullable=False,
     )
 
+    # False : probabilité approximative (sortie anticipée d'une forêt)
+    probability_exact: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        server_default=true(),
+    )
+
     latency_ms: Mapped[float | None]
 
     created_at: Mapped[datetime] = mapped_column(
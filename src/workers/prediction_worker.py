@@ -2,12 +2,13 @@
 
 import asyncio
 from datetime import UTC, datetime
+from time import perf_counter
 
 from sqlalchemy import select
 
 from src.db.session import get_async_session
-from src.ml.inference import run_inference
-from src.ml.model_registry import get_metadata
+from src.ml.inference import normalize_payload
+from src.ml.session import InferenceSession, get_inference_session
 from src.models.enums import PredictionStatus
 from src.models.prediction_request import PredictionRequest
 from src.models.prediction_result import PredictionResult
@@ -18,11 +19,15 @@ from src.models.prediction_result import PredictionResult
 POLL_INTERVAL = 5  # secondes
 
 
-async def _run_inference_async(payload: dict) -> tuple[int, float]:
+async def _run_inference_async(
+    session: InferenceSession,
+    payload: dict,
+) -> dict:
     """
     Exécute l'inférence ML dans un thread pour ne pas bloquer l'event loop.
+    La session (modèle, features, métadonnées) est réutilisée entre appels.
     """
-    return await asyncio.to_thread(run_inference, payload)
+    return await asyncio.to_thread(session.predict, normalize_payload(payload))
 
 
 async def process_pending_requests():
@@ -38,33 +43,39 @@ async def process_pending_requests():
         if not requests:
             return
 
-        metadata = get_metadata()
-
         for req in requests:
             try:
-                # 1️⃣ Inference ML (non bloquante)
-                prediction, probability = await _run_inference_async(  # noqa: E501
+                # 1️⃣ Session d'inférence du modèle demandé (construite 1 fois)
+                inference_session = get_inference_session(req.model_name)
+
+                # 2️⃣ Inference ML (non bloquante, un seul predict_proba)
+                start = perf_counter()
+
+                result = await _run_inference_async(
+                    inference_session,
                     {
                         "age": req.age,
                         "revenu_mensuel": req.revenu_mensuel,
                         "annees_dans_l_entreprise": req.annees_dans_l_entreprise,  # noqa: E501
                         "frequence_deplacement": req.frequence_deplacement,
-                    }
+                    },
                 )
 
-                # 2️⃣ Écriture du résultat
+                latency_ms = (perf_counter() - start) * 1000
+
+                # 3️⃣ Écriture du résultat
                 prediction_result = PredictionResult(
                     request_id=req.id,
-                    prediction=prediction,
-                    probability=probability,
-                    model_name=metadata.get("model_name"),
-                    model_version=metadata.get("version"),
+                    prediction=result["prediction"],
+                    probability=result["probability"],
+                    probability_exact=result["probability_exact"],
+                    latency_ms=latency_ms,
                     created_at=datetime.now(UTC),
                 )
 
                 session.add(prediction_result)
 
-                # 3️⃣ Mise à jour statut
+                # 4️⃣ Mise à jour statut
                 req.status = PredictionStatus.completed
 
                 await session.commit()
@@ -0,0 +1,87 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_compact_forest.py
+
+"""
+Benchmark : forêt native float64 vs compacte (float32 / int32).
+
+Une forêt est entraînée sur e02_X_train_final.npy (les forêts du
+registry ne sont pas toujours présentes), compilée puis compactée.
+Mesures : mémoire des tableaux, latence (1 ligne, lot complet),
+dérive sur e02_X_test_final.npy.
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_compact_forest \
+        --trees 300 --repeat 20
+"""
+
+import argparse
+import json
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.ml.native import compile_model, precision_drift
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+def _median_us(models: dict, X: np.ndarray, repeat: int) -> dict:
+    """
+    Latence médiane de predict_proba, modèles alternés à chaque
+    répétition (la charge de la machine les affecte également).
+    """
+    timings = {label: [] for label in models}
+    for model in models.values():
+        model.predict_proba(X)
+
+    for _ in range(repeat):
+        for label, model in models.items():
+            start = perf_counter()
+            model.predict_proba(X)
+            timings[label].append(perf_counter() - start)
+
+    return {k: float(np.median(v)) * 1e6 for k, v in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    X_train = np.load(ARTIFACTS / "e02_X_train_final.npy")
+    y_train = np.load(ARTIFACTS / "e02_y_train.npy")
+    X_test = np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+    forest = RandomForestClassifier(
+        n_estimators=args.trees,
+        class_weight="balanced",
+        random_state=42,
+        n_jobs=1,
+    ).fit(X_train, y_train)
+
+    native = compile_model(forest)
+    compact = native.compact()
+
+    print(f"trees={args.trees} nodes={native.n_nodes} rows={len(X_test)}")
+    print(f"{'backend':<10}{'bytes':>12}{'1 row (us)':>14}{'batch (us)':>14}")
+
+    models = {"sklearn": forest, "float64": native, "compact": compact}
+    single = _median_us(models, X_test[:1], args.repeat)
+    batch = _median_us(models, X_test, args.repeat)
+
+    for label, model in models.items():
+        nbytes = getattr(model, "nbytes", "-")
+        row = f"{label:<10}{nbytes:>12}"
+        print(f"{row}{single[label]:>14.1f}{batch[label]:>14.1f}")
+
+    drift = {
+        "vs_sklearn": precision_drift(forest, compact, X_test),
+        "vs_native": precision_drift(native, compact, X_test),
+    }
+    print(json.dumps(drift, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_early_exit.py
+
+"""
+Benchmark : forêt native exacte vs sortie anticipée.
+
+Une forêt est entraînée sur e02_X_train_final.npy (les forêts du
+registry ne sont pas toujours présentes) puis compilée. Sur
+e02_X_test_final.npy, pour chaque taille de tranche :
+- fraction moyenne d'arbres évalués, lignes approximatives
+- classes modifiées (attendu : 0), écart de probabilité
+- accélération sur le lot complet et ligne par ligne
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_early_exit \\
+        --trees 300 --chunks 16,32,64 --repeat 20
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.ml.native import compile_model
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+def _median_s(fn, repeat: int) -> float:
+    fn()
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        timings.append(perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--chunks", default="16,32,64")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    X_train = np.load(ARTIFACTS / "e02_X_train_final.npy")
+    y_train = np.load(ARTIFACTS / "e02_y_train.npy")
+    X_test = np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+    forest = compile_model(
+        RandomForestClassifier(
+            n_estimators=args.trees,
+            class_weight="balanced",
+            random_state=42,
+            n_jobs=1,
+        ).fit(X_train, y_train)
+    )
+
+    exact = forest.predict_proba(X_test)
+    exact_batch_s = _median_s(
+        lambda: forest.predict_proba(X_test),
+        args.repeat,
+    )
+    exact_row_s = _median_s(
+        lambda: [forest.predict_proba(x[None]) for x in X_test],
+        max(1, args.repeat // 4),
+    )
+
+    print(f"trees={args.trees} rows={len(X_test)}")
+    print(
+        f"{'chunk':>6}{'trees %':>9}{'approx %':>10}{'flips':>7}"
+        f"{'max |dp|':>10}{'batch x':>9}{'row x':>7}"
+    )
+
+    for chunk in [int(c) for c in args.chunks.split(",")]:
+        proba, evaluated = forest.predict_proba_early_exit(
+            X_test,
+            chunk_trees=chunk,
+        )
+        flips = int(
+            (proba.argmax(axis=1) != exact.argmax(axis=1)).sum(),
+        )
+
+        batch_s = _median_s(
+            lambda: forest.predict_proba_early_exit(X_test, chunk_trees=chunk),
+            args.repeat,
+        )
+        row_s = _median_s(
+            lambda: [
+                forest.predict_proba_early_exit(x[None], chunk_trees=chunk)
+                for x in X_test
+            ],
+            max(1, args.repeat // 4),
+        )
+
+        print(
+            f"{chunk:>6}"
+            f"{evaluated.mean() / forest.n_trees:>9.1%}"
+            f"{(evaluated < forest.n_trees).mean():>10.1%}"
+            f"{flips:>7}"
+            f"{np.abs(proba - exact)[:, 1].max():>10.3f}"
+            f"{exact_batch_s / batch_s:>9.2f}"
+            f"{exact_row_s / row_s:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_explain.py
+
+"""
+Benchmark : explications par attribution de chemin (forêts) et
+coefficient x valeur (régression logistique).
+
+Une forêt est entraînée sur e02_X_train_final.npy (les forêts du
+registry ne sont pas toujours présentes). Mesures :
+- construction de l'explainer (tables précalculées, une fois par modèle)
+  et mémoire des tables
+- latence d'une explication (1 ligne) : p50 / p99 sur toutes les lignes
+  de e02_X_test_final.npy, comparée à --target-ms
+- latence par ligne en lot (toutes les lignes en un appel)
+- additivité : écart max entre base + somme des contributions et la
+  sortie du modèle
+
+Code de sortie 1 si le p99 d'une ligne dépasse --target-ms.
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_explain \
+        --trees 300 --target-ms 5
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src.ml.native.explain import build_explainer
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+def _bench(label: str, model, X: np.ndarray, repeat: int) -> dict:
+    start = perf_counter()
+    explainer = build_explainer(model)
+    build_ms = (perf_counter() - start) * 1000
+
+    explainer.explain(X[:1])
+    single = []
+    for _ in range(repeat):
+        for i in range(len(X)):
+            start = perf_counter()
+            explainer.explain(X[[i]])
+            single.append(perf_counter() - start)
+
+    batch = []
+    for _ in range(repeat):
+        start = perf_counter()
+        contributions = explainer.explain(X)
+        batch.append(perf_counter() - start)
+
+    output = explainer.base_value + contributions.sum(axis=1)
+    if explainer.output == "log_odds":
+        expected = model.decision_function(X)
+    else:
+        expected = model.predict_proba(X)[:, 1]
+
+    p50, p99 = np.percentile(single, [50, 99]) * 1000
+    return {
+        "label": label,
+        "build_ms": build_ms,
+        "nbytes": getattr(explainer, "nbytes", 0),
+        "p50_ms": p50,
+        "p99_ms": p99,
+        "batch_row_us": float(np.median(batch)) / len(X) * 1e6,
+        "additivity": float(np.max(np.abs(output - expected))),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    X_train = np.load(ARTIFACTS / "e02_X_train_final.npy")
+    y_train = np.load(ARTIFACTS / "e02_y_train.npy")
+    X_test = np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+    forest = RandomForestClassifier(
+        n_estimators=args.trees,
+        class_weight="balanced",
+        random_state=42,
+        n_jobs=1,
+    ).fit(X_train, y_train)
+    logistic = LogisticRegression(max_iter=1000).fit(X_train, y_train)
+
+    results = [
+        _bench(f"forest({args.trees})", forest, X_test, args.repeat),
+        _bench("logistic", logistic, X_test, args.repeat),
+    ]
+
+    print(f"rows={len(X_test)} target p99={args.target_ms} ms")
+    print(
+        f"{'model':<14}{'build ms':>10}{'bytes':>11}{'p50 ms':>9}"
+        f"{'p99 ms':>9}{'batch us/row':>14}{'additivity':>12}"
+    )
+    for r in results:
+        print(
+            f"{r['label']:<14}{r['build_ms']:>10.1f}{r['nbytes']:>11}"
+            f"{r['p50_ms']:>9.3f}{r['p99_ms']:>9.3f}"
+            f"{r['batch_row_us']:>14.1f}{r['additivity']:>12.1e}"
+        )
+
+    missed = [r["label"] for r in results if r["p99_ms"] > args.target_ms]
+    if missed:
+        print(f"p99 above target: {', '.join(missed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
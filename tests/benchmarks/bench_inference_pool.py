@@ -0,0 +1,106 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_inference_pool.py
+
+"""
+Benchmark : débit du pool de processus selon le nombre de processus.
+
+Une forêt (entraînée sur e02_X_train_final.npy) est scorée par
+plusieurs threads concurrents, en lots de --batch lignes :
+- "threads" : scoring dans le processus (limité par le GIL)
+- "pool=N"  : scoring dans un InferencePool de N processus
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_inference_pool \
+        --trees 300 --batch 64 --seconds 3 --backend native
+"""
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.ml.native import compile_model
+from src.ml.pool import InferencePool
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+def _throughput(score, X: np.ndarray, batch: int, threads: int, seconds):
+    """
+    Lignes scorées par seconde, ``threads`` clients en parallèle.
+    """
+    batches = np.array_split(X, max(1, len(X) // batch))
+
+    def client(offset: int) -> int:
+        rows = 0
+        deadline = perf_counter() + seconds
+        i = offset
+        while perf_counter() < deadline:
+            rows += len(score(batches[i % len(batches)]))
+            i += 1
+        return rows
+
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        rows = sum(executor.map(client, range(threads)))
+    return rows / (perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--backend", choices=["native", "sklearn"])
+    parser.add_argument("--max-procs", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    X_train = np.load(ARTIFACTS / "e02_X_train_final.npy")
+    y_train = np.load(ARTIFACTS / "e02_y_train.npy")
+    X_test = np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+    model = RandomForestClassifier(
+        n_estimators=args.trees,
+        n_jobs=1,
+        random_state=42,
+    ).fit(X_train, y_train)
+    if args.backend != "sklearn":
+        model = compile_model(model)
+
+    threads = max(2, args.max_procs)
+
+    baseline = _throughput(
+        model.predict_proba,
+        X_test,
+        args.batch,
+        threads,
+        args.seconds,
+    )
+    print(f"cores={os.cpu_count()}  clients={threads}  batch={args.batch}")
+    print(f"{'threads':>8}: {baseline:10.0f} rows/s")
+
+    for size in range(1, args.max_procs + 1):
+        # min_chunk = batch : un lot = une tâche, le parallélisme
+        # vient des clients concurrents
+        pool = InferencePool(size=size, min_chunk=args.batch)
+        try:
+            pool.start()
+            pool.predict_proba("bench", "v1", model, X_test[:1])
+            rows_s = _throughput(
+                lambda X: pool.predict_proba("bench", "v1", model, X),
+                X_test,
+                args.batch,
+                threads,
+                args.seconds,
+            )
+        finally:
+            pool.shutdown()
+
+        print(f"{'pool=' + str(size):>8}: {rows_s:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_inference_session.py
+
+"""
+Benchmark : MLModelLoader par requête vs InferenceSession réutilisée.
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_inference_session \
+        --model logistic --calls 2000
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from src.ml.loader import MLModelLoader
+from src.ml.model_registry import get_features
+from src.ml.session import get_inference_session
+
+X_TEST_PATH = Path("data/ml_artifacts/e02_X_test_final.npy")
+
+
+def _load_rows(n: int) -> list[dict]:
+    """
+    Construit n payloads à partir des lignes réelles de e02_X_test_final.npy.
+    """
+    features = get_features()
+    X = np.load(X_TEST_PATH)
+    rows = []
+    for i in range(n):
+        x = X[i % len(X)]
+        rows.append({f: float(x[j]) for j, f in enumerate(features)})
+    return rows
+
+
+def _per_call_us(fn, rows: list[dict]) -> float:
+    start = perf_counter()
+    for row in rows:
+        fn(row)
+    return (perf_counter() - start) / len(rows) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = _load_rows(args.calls)
+
+    # Warm-up : chargement registry hors mesure
+    session = get_inference_session(args.model)
+    session.predict(rows[0])
+
+    loader_us = _per_call_us(
+        lambda row: MLModelLoader(model_name=args.model).predict(row),
+        rows,
+    )
+    session_us = _per_call_us(session.predict, rows)
+
+    print(f"model            : {session.model_name}")
+    print(f"calls            : {args.calls}")
+    print(f"loader / call    : {loader_us:10.1f} µs")
+    print(f"session / call   : {session_us:10.1f} µs")
+    print(f"saving / call    : {loader_us - session_us:10.1f} µs")
+    print(f"speedup          : {loader_us / session_us:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_model_bundle.py
+
+"""
+Benchmark : artefacts joblib (sklearn) vs bundles .npz natifs.
+
+Un répertoire d'artefacts temporaire est construit avec les modèles
+réels (dummy, logistic) et une forêt entraînée sur e02_X_train_final.npy
+(servie sous le nom random_forest_e04), exportés aux deux formats.
+
+Pour chaque modèle et chaque format, un processus neuf mesure :
+- cold start : imports + chargement + première prédiction
+- RSS maximale du processus
+- latence d'une prédiction unitaire (médiane)
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_model_bundle --trees 300
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from src.ml.model_registry import MODEL_FILES
+from src.ml.native import compile_model, export_bundle
+
+ARTIFACTS = Path("data/ml_artifacts")
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CHILD = """
+import json, sys
+from statistics import median
+from time import perf_counter
+
+def PEAK_RSS_MB():
+    # VmHWM : pic de RSS du processus (remis à zéro par exec)
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+start = perf_counter()
+from src.ml.session import get_inference_session
+
+session = get_inference_session(MODEL)
+session.predict({})
+cold_start_ms = (perf_counter() - start) * 1000
+
+latencies = []
+for i in range(CALLS):
+    t = perf_counter()
+    session.predict({"age": i % 50})
+    latencies.append(perf_counter() - t)
+
+print(json.dumps({
+    "cold_start_ms": cold_start_ms,
+    "max_rss_mb": PEAK_RSS_MB(),
+    "latency_us": median(latencies) * 1e6,
+    "sklearn_imported": any(m.startswith("sklearn") for m in sys.modules),
+}))
+"""
+
+
+def _build_artifacts(root: Path, trees: int) -> None:
+    base = root / ARTIFACTS
+    for artifact in [
+        "metadata.json",
+        "e02_X_test_final.npy",
+        "features/e02_all_features_final_list.joblib",
+        "models/" + MODEL_FILES["dummy"],
+        "models/" + MODEL_FILES["logistic"],
+    ]:
+        (base / artifact).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(ARTIFACTS / artifact, base / artifact)
+
+    forest = RandomForestClassifier(n_estimators=trees, random_state=42).fit(
+        np.load(ARTIFACTS / "e02_X_train_final.npy"),
+        np.load(ARTIFACTS / "e02_y_train.npy"),
+    )
+    joblib.dump(forest, base / "models" / MODEL_FILES["random_forest_e04"])
+
+    for name in ("dummy", "logistic", "random_forest_e04"):
+        model = joblib.load(base / "models" / MODEL_FILES[name])
+        export_bundle(
+            compile_model(model),
+            base / "bundles" / f"{name}.npz",
+        )
+
+
+def _run(root: Path, model: str, model_format: str, calls: int) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    env["ENV"] = "prod"
+    env["MODEL_FORMAT"] = model_format
+
+    out = subprocess.run(
+        [sys.executable, "-c", f"MODEL = {model!r}\nCALLS = {calls}\n{CHILD}"],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trees", type=int, default=300)
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _build_artifacts(root, args.trees)
+
+        header = "model              format  cold_start_ms  max_rss_mb"
+        print(f"{header}  latency_us  sklearn")
+        for model in ("dummy", "logistic", "random_forest_e04"):
+            for model_format in ("joblib", "bundle"):
+                r = _run(root, model, model_format, args.calls)
+                print(
+                    f"{model:<18} {model_format:<7}"
+                    f" {r['cold_start_ms']:13.1f} {r['max_rss_mb']:11.1f}"
+                    f" {r['latency_us']:11.1f}  {r['sklearn_imported']}"
+                )
+
+
+if __name__ == "__main__":
+    main()
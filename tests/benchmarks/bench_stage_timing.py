@@ -0,0 +1,85 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_stage_timing.py
+
+"""
+Benchmark : coût de la mesure d'une étape (src/core/timing.py).
+
+Mesure le surcoût par étape d'un bloc ``with stage(...)`` (et de
+record_stage) par rapport au même bloc non instrumenté :
+- dans une requête (contexte ouvert, cas nominal)
+- hors requête (observation directe dans l'histogramme)
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_stage_timing \\
+        --calls 200000
+"""
+
+import argparse
+from time import perf_counter
+
+from src.core.timing import (
+    begin_request,
+    end_request,
+    get_stage_metrics,
+    record_stage,
+    stage,
+)
+
+
+def _ns_per_call(fn, calls: int) -> float:
+    start = perf_counter()
+    for _ in range(calls):
+        fn()
+    return (perf_counter() - start) / calls * 1e9
+
+
+def _bare():
+    pass
+
+
+def _staged():
+    with stage("predict", model="random_forest_e04"):
+        pass
+
+
+def _recorded():
+    record_stage("predict", 1e-4, "random_forest_e04")
+
+
+def _in_request(fn, calls: int) -> float:
+    """
+    Une requête toutes les 8 étapes (ordre de grandeur réel).
+    """
+    per_request = 8
+    total = 0.0
+    for _ in range(calls // per_request):
+        timings, token = begin_request()
+        total += _ns_per_call(fn, per_request) * per_request
+        end_request(token)
+    return total / (calls // per_request * per_request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    bare = _ns_per_call(_bare, args.calls)
+    bare_req = _in_request(_bare, args.calls)
+
+    n = args.calls
+    cases = {
+        "stage() in request": (_in_request(_staged, n), bare_req),
+        "record_stage in request": (_in_request(_recorded, n), bare_req),
+        "stage() background": (_ns_per_call(_staged, n), bare),
+        "record_stage background": (_ns_per_call(_recorded, n), bare),
+    }
+
+    print(f"{'case':<28}{'ns / stage':>12}{'overhead ns':>13}")
+    for label, (ns, baseline) in cases.items():
+        print(f"{label:<28}{ns:>12.0f}{ns - baseline:>13.0f}")
+
+    get_stage_metrics().reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# futurisys-ml-deploy/tests/benchmarks/bench_time_to_first_prediction.py
+
+"""
+Benchmark : time-to-first-prediction avec et sans warm-up.
+
+Chaque mesure tourne dans un processus neuf (import de l'app,
+démarrage du lifespan, attente de /ready, puis première requête
+POST /predictions/request avec une session DB mockée).
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.bench_time_to_first_prediction \
+        --model logistic --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+
+CHILD = """
+import json, time
+from time import perf_counter
+from unittest.mock import AsyncMock
+
+start = perf_counter()
+
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.db.session import get_async_session
+
+session = AsyncMock()
+session.add = lambda _: None
+
+async def _override():
+    return session
+
+app.dependency_overrides[get_async_session] = _override
+
+payload = {
+    "age": 30,
+    "revenu_mensuel": 5000,
+    "annees_dans_l_entreprise": 5,
+    "frequence_deplacement": "frequent",
+}
+
+with TestClient(app) as client:
+    started = perf_counter()
+    while client.get("/ready").status_code != 200:
+        time.sleep(0.001)
+    ready = perf_counter()
+
+    response = client.post(
+        "/predictions/request", json=payload, params={"model_name": MODEL}
+    )
+    done = perf_counter()
+
+assert response.status_code == 201, response.text
+print(json.dumps({
+    "startup_ms": (ready - start) * 1000,
+    "first_request_ms": (done - ready) * 1000,
+    "time_to_first_prediction_ms": (done - start) * 1000,
+    "warmup_wait_ms": (ready - started) * 1000,
+}))
+"""
+
+
+def _run_once(model: str, warmup: bool) -> dict:
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", ".")
+    env.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    env["WARMUP_ENABLED"] = "1" if warmup else "0"
+    env["WARMUP_MODELS"] = model
+    env["WARMUP_DB_CONNECTIONS"] = "0"
+
+    code = f"MODEL = {model!r}\n{CHILD}"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="logistic")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for warmup in (False, True):
+        runs = [_run_once(args.model, warmup) for _ in range(args.runs)]
+        label = "warm-up" if warmup else "no warm-up"
+        print(f"{label:>10}:", end="")
+        for key in runs[0]:
+            print(f"  {key}={median(r[key] for r in runs):.1f}", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+# futurisys-ml-deploy/tests/benchmarks/load_test.py
+
+"""
+Harnais de charge de bout en bout : API réelle (uvicorn) sur une base
+SQLite locale (aiosqlite) en lieu et place de Neon.
+
+Déroulé :
+1. base SQLite neuve dans un répertoire temporaire (tables créées à
+   partir des modèles ORM, cf. src/data/create_db.py)
+2. démarrage de ``uvicorn src.api.main:app`` dans un processus séparé,
+   attente de /ready
+3. charge en boucle ouverte : arrivées de Poisson au débit --rate
+   (req/s), au plus --concurrency requêtes en vol, pendant --duration
+   secondes, selon le mélange --mix :
+   - request : POST /predictions/request
+   - result  : GET /predictions/{request_id} (identifiants déjà créés)
+   - history : GET /predictions/history
+4. rapport JSON : débit et latences p50/p95/p99 par route (la latence
+   inclut l'attente d'un créneau de concurrence : une saturation
+   apparaît dans la queue de distribution)
+
+Payloads : lignes tirées avec remise de data/processed (distribution
+d'entraînement), revenu bruité de ±--jitter pour ne pas mesurer que le
+cache de prédictions (--jitter 0 : lignes rejouées telles quelles).
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.load_test \\
+        --rate 50 --concurrency 16 --duration 30 \\
+        --mix request=0.6,result=0.3,history=0.1 \\
+        --output bench_results/load.json
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+import httpx
+import numpy as np
+from sqlalchemy import create_engine
+
+from src.db.base import Base
+from src.models.prediction_request import PredictionRequest  # noqa: F401
+from src.models.prediction_result import PredictionResult  # noqa: F401
+
+TRAINING_CSV = Path("data/processed/e01_df_central_left_clean.csv")
+
+ROUTES = {
+    "request": "POST /predictions/request",
+    "result": "GET /predictions/{request_id}",
+    "history": "GET /predictions/history",
+}
+
+PERCENTILES = (50, 95, 99)
+
+# Identifiants créés avant la mesure (la route result en a besoin)
+SEED_REQUESTS = 20
+
+# ============================================================
+# Workload
+# ============================================================
+
+
+class PayloadSampler:
+    """
+    Payloads /predictions/request tirés de la distribution d'entraînement.
+    """
+
+    def __init__(self, path: Path, jitter: float, seed: int):
+        with path.open(newline="") as f:
+            self.rows = [
+                {
+                    "age": int(row["age"]),
+                    "revenu_mensuel": float(row["revenu_mensuel"]),
+                    "annees_dans_l_entreprise": int(
+                        row["annees_dans_l_entreprise"],
+                    ),
+                    "frequence_deplacement": row["frequence_deplacement"],
+                }
+                for row in csv.DictReader(f)
+            ]
+        self.jitter = jitter
+        self.random = random.Random(seed)
+
+    def sample(self) -> dict:
+        payload = dict(self.random.choice(self.rows))
+        if self.jitter:
+            factor = 1 + self.random.uniform(-self.jitter, self.jitter)
+            payload["revenu_mensuel"] = round(
+                payload["revenu_mensuel"] * factor,
+                2,
+            )
+        return payload
+
+
+def _parse_mix(raw: str) -> dict[str, float]:
+    mix = {}
+    for item in raw.split(","):
+        route, _, weight = item.partition("=")
+        if route not in ROUTES:
+            raise ValueError(f"Unknown route in mix: {route}")
+        mix[route] = float(weight)
+    return mix
+
+
+# ============================================================
+# Server
+# ============================================================
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _create_schema(db_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+
+def _start_server(db_path: Path, port: int, log_path: Path, model: str):
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", ".")
+    env["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    if model != "default":
+        env.setdefault("WARMUP_MODELS", model)
+
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.api.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdout=log_path.open("w"),
+        stderr=subprocess.STDOUT,
+    )
+
+
+def _wait_ready(base_url: str, server, timeout_s: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("server exited before /ready")
+        try:
+            if httpx.get(f"{base_url}/ready").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server not ready after {timeout_s:.0f}s")
+
+
+# ============================================================
+# Load generation
+# ============================================================
+
+
+class LoadRun:
+    def __init__(self, client: httpx.AsyncClient, sampler, args):
+        self.client = client
+        self.sampler = sampler
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.request_ids: list[str] = []
+        self.latencies_ms = {route: [] for route in ROUTES}
+        self.errors = {route: 0 for route in ROUTES}
+
+    async def _submit(self) -> httpx.Response:
+        response = await self.client.post(
+            "/predictions/request",
+            json=self.sampler.sample(),
+            params={"model_name": self.args.model},
+        )
+        if response.status_code == 201:
+            self.request_ids.append(response.json()["request_id"])
+        return response
+
+    async def _call(self, route: str) -> httpx.Response:
+        if route == "request":
+            return await self._submit()
+        if route == "result":
+            request_id = self.random.choice(self.request_ids)
+            return await self.client.get(f"/predictions/{request_id}")
+        return await self.client.get(
+            "/predictions/history",
+            params={"limit": self.args.history_limit},
+        )
+
+    async def _one(self, route: str, slots: asyncio.Semaphore, record: bool):
+        start = perf_counter()
+        async with slots:
+            try:
+                response = await self._call(route)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+
+        if not record:
+            return
+        if ok:
+            self.latencies_ms[route].append((perf_counter() - start) * 1000)
+        else:
+            self.errors[route] += 1
+
+    async def seed(self) -> None:
+        for _ in range(SEED_REQUESTS):
+            await self._submit()
+        if not self.request_ids:
+            raise RuntimeError("seed requests failed (see server log)")
+
+    async def run(self, mix: dict[str, float]) -> float:
+        """
+        Boucle ouverte : les arrivées ne dépendent pas des réponses.
+        """
+        routes, weights = list(mix), list(mix.values())
+        slots = asyncio.Semaphore(self.args.concurrency)
+        tasks = []
+
+        start = perf_counter()
+        warmup_end = start + self.args.warmup
+        end = warmup_end + self.args.duration
+        next_arrival = start
+
+        while next_arrival < end:
+            delay = next_arrival - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            route = self.random.choices(routes, weights)[0]
+            record = next_arrival >= warmup_end
+            tasks.append(asyncio.create_task(self._one(route, slots, record)))
+            next_arrival += self.random.expovariate(self.args.rate)
+
+        await asyncio.gather(*tasks)
+        return perf_counter() - warmup_end
+
+
+def _summary(latencies_ms: list[float], errors: int, elapsed_s: float):
+    summary = {
+        "count": len(latencies_ms),
+        "errors": errors,
+        "throughput_rps": len(latencies_ms) / elapsed_s,
+    }
+    if latencies_ms:
+        values = np.percentile(latencies_ms, PERCENTILES)
+        for p, value in zip(PERCENTILES, values):
+            summary[f"p{p}_ms"] = float(value)
+        summary["max_ms"] = float(max(latencies_ms))
+    return summary
+
+
+async def _drive(base_url: str, args) -> dict:
+    sampler = PayloadSampler(TRAINING_CSV, args.jitter, args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        limits=limits,
+        timeout=args.timeout,
+    ) as client:
+        load = LoadRun(client, sampler, args)
+        await load.seed()
+        elapsed_s = await load.run(_parse_mix(args.mix))
+
+    routes = {
+        ROUTES[route]: _summary(
+            load.latencies_ms[route],
+            load.errors[route],
+            elapsed_s,
+        )
+        for route in ROUTES
+        if route in _parse_mix(args.mix)
+    }
+    all_latencies = [v for lat in load.latencies_ms.values() for v in lat]
+
+    return {
+        "elapsed_s": elapsed_s,
+        "routes": routes,
+        "total": _summary(all_latencies, sum(load.errors.values()), elapsed_s),
+    }
+
+
+# ============================================================
+# Main
+# ============================================================
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--mix", default="request=0.6,result=0.3,history=0.1")
+    parser.add_argument("--model", default="default")
+    parser.add_argument("--history-limit", type=int, default=50)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_results/load.json")
+    args = parser.parse_args()
+
+    _parse_mix(args.mix)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "load.db"
+        log_path = Path(tmp) / "server.log"
+        _create_schema(db_path)
+
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = _start_server(db_path, port, log_path, args.model)
+        try:
+            _wait_ready(base_url, server)
+            results = asyncio.run(_drive(base_url, args))
+        except RuntimeError:
+            print(log_path.read_text(), file=sys.stderr)
+            raise
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "config": {
+            "rate_rps": args.rate,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "mix": _parse_mix(args.mix),
+            "model": args.model,
+            "jitter": args.jitter,
+            "database": "sqlite+aiosqlite",
+        },
+        **results,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(
+        f"{'route':<34}{'count':>7}{'err':>5}{'rps':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for label, s in [*report["routes"].items(), ("total", report["total"])]:
+        print(
+            f"{label:<34}{s['count']:>7}{s['errors']:>5}"
+            f"{s['throughput_rps']:>8.1f}{s.get('p50_ms', 0):>9.1f}"
+            f"{s.get('p95_ms', 0):>9.1f}{s.get('p99_ms', 0):>9.1f}"
+        )
+    print(f"saved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+# futurisys-ml-deploy/tests/benchmarks/suite.py
+
+"""
+Suite de micro-benchmarks du chemin chaud ML, résultats en JSON.
+
+Charge de travail : lignes réelles de e02_X_test_final.npy et modèles
+du registry (les modèles dont l'artefact est absent sont ignorés et
+listés dans "skipped").
+
+Mesures (meilleur de --rounds tours ; médiane pour le chargement) :
+- features.* : normalize_payload, prepare_features (une ligne),
+  assemblage du lot complet (FeaturePlan.assemble)
+- model.<nom>.* : latence une ligne (MLModelLoader.predict,
+  InferenceSession.predict), lot complet (predict_proba)
+- registry.<nom>.cold_load_ms : import du registry + premier
+  get_model, dans un processus neuf
+
+La commande compare signale les régressions au-delà d'un seuil
+relatif (code de sortie 1), pour toutes les mesures communes.
+
+Usage :
+    PYTHONPATH=. python -m tests.benchmarks.suite run \\
+        --output bench_results/baseline.json
+    PYTHONPATH=. python -m tests.benchmarks.suite run \\
+        --output bench_results/current.json
+    PYTHONPATH=. python -m tests.benchmarks.suite compare \\
+        bench_results/baseline.json bench_results/current.json \\
+        --threshold 0.15
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+import sklearn
+
+from src.ml.features import get_feature_plan
+from src.ml.inference import normalize_payload
+from src.ml.loader import MLModelLoader
+from src.ml.model_registry import available_models, get_features, get_model
+from src.ml.predictor import prepare_features
+from src.ml.session import get_inference_session
+
+X_TEST_PATH = Path("data/ml_artifacts/e02_X_test_final.npy")
+
+SCHEMA_VERSION = 1
+
+COLD_LOAD_CHILD = """
+from time import perf_counter
+start = perf_counter()
+from src.ml.model_registry import get_model
+get_model(MODEL)
+print((perf_counter() - start) * 1000)
+"""
+
+# ============================================================
+# Workload
+# ============================================================
+
+
+def _load_rows() -> list[dict]:
+    """
+    Payloads construits à partir des lignes de e02_X_test_final.npy.
+    """
+    features = get_features()
+    X = np.load(X_TEST_PATH)
+    return [
+        {
+            **{f: float(x[j]) for j, f in enumerate(features)},
+            "frequence_deplacement": "occasionnel",
+        }
+        for x in X
+    ]
+
+
+def _best_us(fn, calls: int, rounds: int) -> float:
+    """
+    Meilleure durée par appel (µs) sur ``rounds`` tours de ``calls``
+    appels : le minimum est moins sensible que la médiane au bruit
+    de la machine (cf. timeit), ce qui limite les fausses régressions.
+    """
+    fn()
+    per_call = []
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(calls):
+            fn()
+        per_call.append((perf_counter() - start) / calls * 1e6)
+    return min(per_call)
+
+
+def _cycle(rows: list):
+    """
+    Appels successifs sur des lignes différentes (pas de ligne « chaude »).
+    """
+    state = {"i": 0}
+
+    def next_row():
+        state["i"] = (state["i"] + 1) % len(rows)
+        return rows[state["i"]]
+
+    return next_row
+
+
+# ============================================================
+# Benchmarks
+# ============================================================
+
+
+def bench_features(rows: list[dict], calls: int, rounds: int) -> dict:
+    row = _cycle(rows)
+    plan = get_feature_plan()
+
+    return {
+        "features.normalize_payload_us": _best_us(
+            lambda: normalize_payload(row()),
+            calls,
+            rounds,
+        ),
+        "features.prepare_features_us": _best_us(
+            lambda: prepare_features(row()),
+            calls,
+            rounds,
+        ),
+        "features.assemble_batch_us": _best_us(
+            lambda: plan.assemble(rows),
+            max(1, calls // len(rows)),
+            rounds,
+        ),
+    }
+
+
+def bench_model(name: str, rows: list[dict], calls: int, rounds: int):
+    row = _cycle(rows)
+    loader = MLModelLoader(model_name=name)
+    session = get_inference_session(name)
+    X = np.load(X_TEST_PATH)
+
+    prefix = f"model.{name}"
+    return {
+        f"{prefix}.loader_single_row_us": _best_us(
+            lambda: loader.predict(row()),
+            calls,
+            rounds,
+        ),
+        f"{prefix}.session_single_row_us": _best_us(
+            lambda: session.predict(normalize_payload(row())),
+            calls,
+            rounds,
+        ),
+        f"{prefix}.batch_us": _best_us(
+            lambda: session.predict_proba(X),
+            max(1, calls // 100),
+            rounds,
+        ),
+    }
+
+
+def bench_cold_load(name: str, runs: int) -> dict:
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", ".")
+
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", f"MODEL = {name!r}\n{COLD_LOAD_CHILD}"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if out.returncode != 0:
+            raise RuntimeError(f"cold load of {name} failed:\n{out.stderr}")
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+
+    return {f"registry.{name}.cold_load_ms": median(timings)}
+
+
+def _loadable_models(names: list[str]) -> tuple[list[str], dict]:
+    loadable, skipped = [], {}
+    for name in names:
+        try:
+            get_model(name)
+            loadable.append(name)
+        except (FileNotFoundError, ValueError) as e:
+            skipped[name] = str(e)
+    return loadable, skipped
+
+
+# ============================================================
+# Commands
+# ============================================================
+
+
+def run(args) -> int:
+    rows = _load_rows()
+    names = args.models.split(",") if args.models else available_models()
+    models, skipped = _loadable_models(names)
+
+    results = bench_features(rows, args.calls, args.rounds)
+    for name in models:
+        results.update(bench_model(name, rows, args.calls, args.rounds))
+        results.update(bench_cold_load(name, args.cold_runs))
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "sklearn": sklearn.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "workload": {
+            "rows": len(rows),
+            "calls": args.calls,
+            "rounds": args.rounds,
+            "cold_runs": args.cold_runs,
+        },
+        "skipped": skipped,
+        "results": results,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    for key, value in results.items():
+        print(f"{key:<48}{value:>12.1f}")
+    for name, reason in skipped.items():
+        print(f"skipped {name}: {reason}")
+    print(f"saved to {output}")
+    return 0
+
+
+def compare(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())["results"]
+    current = json.loads(Path(args.current).read_text())["results"]
+
+    regressions = []
+    print(f"{'benchmark':<48}{'baseline':>12}{'current':>12}{'delta':>9}")
+
+    for key in sorted(baseline.keys() & current.keys()):
+        delta = current[key] / baseline[key] - 1
+        flag = ""
+        if delta > args.threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key:<48}{baseline[key]:>12.1f}{current[key]:>12.1f}"
+            f"{delta:>+9.1%}{flag}"
+        )
+
+    for key in sorted(baseline.keys() ^ current.keys()):
+        side = "baseline" if key in baseline else "current"
+        print(f"{key:<48} only in {side}")
+
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) above "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+
+    print(f"no regression above {args.threshold:.0%}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run and save results")
+    run_parser.add_argument("--output", default="bench_results/current.json")
+    run_parser.add_argument("--models", default=None)
+    run_parser.add_argument("--calls", type=int, default=500)
+    run_parser.add_argument("--rounds", type=int, default=7)
+    run_parser.add_argument("--cold-runs", type=int, default=3)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
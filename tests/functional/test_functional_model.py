@@ -1,19 +1,20 @@
 # futurisys-ml-deploy/tests/functional/test_functional_model.py
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+import src.api.offload as offload
 from src.api.main import app
 from src.db.session import get_async_session
+from src.ml.batching import MicroBatchQueueFull
+from src.ml.executor import InferenceQueueFull
 from src.models.enums import PredictionStatus
-
-# from datetime import datetime
-
-
-# from src.models.prediction_request import PredictionRequest
+from src.models.prediction_request import PredictionRequest
+from src.models.prediction_result import PredictionResult
 
 # ============================================================
 # Test client
@@ -37,6 +38,7 @@ def mock_async_session():
 
     # session.add.return_value = None
     session.add = lambda _: None
+    session.add_all = lambda _: None
     session.commit.return_value = None
     session.refresh.return_value = None
     session.rollback.return_value = None
@@ -113,6 +115,207 @@ def test_create_prediction_request_invalid_enum():
     assert response.status_code == 422
 
 
+# ============================================================
+# Tests fonctionnels – POST /predictions/batch
+# ============================================================
+
+
+def test_create_prediction_batch_partial_errors():
+    """
+    Cas nominal lot :
+    - 2 lignes valides, 1 ligne invalide
+    → 201 Created, la ligne invalide est reportée sans échec du lot
+    """
+    valid = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+    invalid = {**valid, "frequence_deplacement": "Rarement"}  # ❌ hors Enum
+
+    response = client.post(
+        "/predictions/batch?model_name=baseline",
+        json={"items": [valid, invalid, valid]},
+    )
+
+    assert response.status_code == 201
+
+    body = response.json()
+    assert body["submitted"] == 3
+    assert body["accepted"] == 2
+    assert body["rejected"] == 1
+    assert [r["index"] for r in body["results"]] == [0, 2]
+    assert body["errors"][0]["index"] == 1
+    assert "inference_latency_ms" in body
+
+
+def test_create_prediction_batch_unknown_model():
+    """
+    Modèle inconnu → 400 (erreur métier contrôlée)
+    """
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post(
+        "/predictions/batch?model_name=unknown",
+        json={"items": [payload]},
+    )
+
+    assert response.status_code == 400
+
+
+def test_create_prediction_request_saturated_executor(monkeypatch):
+    """
+    Exécuteur d'inférence saturé → 503 + Retry-After (pas de file infinie)
+    """
+
+    class SaturatedExecutor:
+        async def run(self, fn, *args, **kwargs):
+            raise InferenceQueueFull("saturated", retry_after_s=3)
+
+    monkeypatch.setattr(
+        offload,
+        "get_inference_executor",
+        lambda: SaturatedExecutor(),
+    )
+
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post("/predictions/request", json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_create_prediction_request_saturated_micro_batcher(monkeypatch):
+    """
+    File de micro-batch pleine → même réponse que l'exécuteur saturé
+    (503 + Retry-After estimé par le micro-batcher)
+    """
+    import src.api.routes.predictions as predictions
+
+    class SaturatedBatcher:
+        async def submit(self, payload, model_name=None):
+            raise MicroBatchQueueFull("queue full", retry_after_s=2)
+
+    monkeypatch.setattr(predictions, "MICROBATCH_ENABLED", True)
+    monkeypatch.setattr(
+        predictions,
+        "get_micro_batcher",
+        lambda: SaturatedBatcher(),
+    )
+
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post("/predictions/request", json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+
+
+def test_create_prediction_request_unknown_model():
+    """
+    Modèle inconnu → 400, comme /predictions/batch
+    """
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post(
+        "/predictions/request?model_name=unknown",
+        json=payload,
+    )
+
+    assert response.status_code == 400
+
+
+def test_prediction_request_server_timing():
+    """
+    Durées par étape dans l'en-tête Server-Timing et à /runtime/metrics
+    (payload absent du cache de prédictions)
+    """
+    payload = {
+        "age": 47,
+        "revenu_mensuel": 6133,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post("/predictions/request", json=payload)
+    metrics = client.get("/runtime/metrics")
+
+    assert response.status_code == 201
+    server_timing = response.headers["Server-Timing"]
+    for name in ("normalize", "prepare", "predict", "serialize", "total"):
+        assert f"{name};dur=" in server_timing
+
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert 'route="/predictions/request"' in metrics.text
+
+
+# ============================================================
+# Tests fonctionnels – POST /models/compare
+# ============================================================
+
+
+def test_compare_models_batch():
+    """
+    Un seul appel : chaque modèle score toutes les lignes
+    """
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post(
+        "/models/compare",
+        json={"items": [payload] * 3, "models": ["logistic", "dummy"]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["rows"] == 3
+    assert [r["model_name"] for r in body["results"]] == ["logistic", "dummy"]
+    assert all(len(r["probabilities"]) == 3 for r in body["results"])
+    assert all(r["latency_ms"] is not None for r in body["results"])
+
+
+def test_compare_models_unknown_model():
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "frequent",
+    }
+
+    response = client.post(
+        "/models/compare",
+        json={"items": [payload], "models": ["logistic", "unknown"]},
+    )
+
+    assert response.status_code == 400
+
+
 # ============================================================
 # Tests fonctionnels – GET /predictions/{request_id}
 # ============================================================
@@ -144,3 +347,210 @@ def test_get_prediction_result_not_found(mock_async_session):
     # 4️⃣ Assertions
     assert response.status_code == 404
     assert response.json()["detail"] == "Prediction request not found"
+
+
+def test_get_prediction_result_reports_approximate_probability(
+    mock_async_session,
+):
+    """
+    Probabilité stockée issue d'une sortie anticipée
+    → probability_exact = False à la relecture
+    """
+    request_id = uuid4()
+    stored = [
+        PredictionRequest(
+            id=1,
+            request_id=str(request_id),
+            status=PredictionStatus.completed,
+            created_at=datetime.now(UTC),
+        ),
+        PredictionResult(
+            request_id=1,
+            prediction=1,
+            probability=0.8,
+            probability_exact=False,
+            created_at=datetime.now(UTC),
+        ),
+    ]
+
+    class FakeResult:
+        def __init__(self, value):
+            self.value = value
+
+        def scalar_one_or_none(self):
+            return self.value
+
+    async def fake_execute(*args, **kwargs):
+        return FakeResult(stored.pop(0))
+
+    mock_async_session.execute.side_effect = fake_execute
+
+    response = client.get(f"/predictions/{request_id}")
+
+    assert response.status_code == 200
+    assert response.json()["probability"] == 0.8
+    assert response.json()["probability_exact"] is False
+
+
+# ============================================================
+# Tests fonctionnels – GET /metrics/live
+# ============================================================
+
+
+def test_live_metrics_per_model():
+    response = client.get("/metrics/live")
+
+    assert response.status_code == 200
+    logistic = response.json()["logistic"]
+    assert logistic["model_version"]
+    assert set(logistic["confusion_matrix"]) == {"tn", "fp", "fn", "tp"}
+
+    single = client.get("/metrics/live/logistic").json()
+    assert single["computed_at"] == logistic["computed_at"]
+
+    assert client.get("/metrics/live/unknown").status_code == 404
+
+
+def test_live_metrics_go_through_the_inference_executor(monkeypatch):
+    """
+    Évaluation soumise à l'exécuteur borné : saturé → 503 + Retry-After
+    """
+
+    class SaturatedExecutor:
+        async def run(self, fn, *args, **kwargs):
+            raise InferenceQueueFull("saturated", retry_after_s=3)
+
+    monkeypatch.setattr(
+        offload,
+        "get_inference_executor",
+        lambda: SaturatedExecutor(),
+    )
+
+    response = client.get("/metrics/live/logistic")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+# ============================================================
+# Tests fonctionnels – explications
+# ============================================================
+
+
+@pytest.fixture
+def explainable_logistic(monkeypatch):
+    """
+    Session "logistic" servant une vraie régression logistique
+    (le registry de test sert un modèle constant).
+    """
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+
+    from src.ml.session import get_inference_session
+
+    session = get_inference_session("logistic")
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(100, session.plan.n_features))
+    y = (X[:, 0] > 0).astype(int)
+
+    model = LogisticRegression().fit(X, y)
+    monkeypatch.setattr(session, "model", model)
+    monkeypatch.setattr(session, "classes", model.classes_)
+    return session
+
+
+def test_explain_stored_prediction(mock_async_session, explainable_logistic):
+    stored = PredictionRequest(
+        request_id=str(uuid4()),
+        model_name="logistic",
+        status=PredictionStatus.completed,
+        age=30,
+        revenu_mensuel=5000,
+        annees_dans_l_entreprise=5,
+        frequence_deplacement="occasionnel",
+    )
+
+    class FakeResult:
+        def scalar_one_or_none(self):
+            return stored
+
+    async def fake_execute(*args, **kwargs):
+        return FakeResult()
+
+    mock_async_session.execute.side_effect = fake_execute
+
+    response = client.get(
+        f"/predictions/{stored.request_id}/explain",
+        params={"top_k": 3},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    explanation = body["explanations"][0]
+
+    assert body["method"] == "linear"
+    assert explanation["request_id"] == stored.request_id
+    assert len(explanation["contributions"]) == 3
+
+
+def test_explain_batch_and_unexplainable_model(explainable_logistic):
+    payload = {
+        "age": 30,
+        "revenu_mensuel": 5000,
+        "annees_dans_l_entreprise": 5,
+        "frequence_deplacement": "occasionnel",
+    }
+
+    response = client.post(
+        "/predictions/explain",
+        params={"model_name": "logistic"},
+        json={"items": [payload, {**payload, "age": 50}]},
+    )
+    assert response.status_code == 200
+    assert len(response.json()["explanations"]) == 2
+
+    # Modèle constant du registry de test : pas de méthode d'explication
+    response = client.post(
+        "/predictions/explain",
+        params={"model_name": "dummy"},
+        json={"items": [payload]},
+    )
+    assert response.status_code == 422
+
+
+# ============================================================
+# Tests fonctionnels – réponses en cache (ETag, 304, gzip)
+# ============================================================
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/metrics/summary",
+        "/metrics/e04_rf_smote_test_metrics.csv",
+        "/docs/api",
+        "/metadata/",
+        "/models/",
+    ],
+)
+def test_artifact_endpoints_support_conditional_get(path):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+
+    not_modified = client.get(
+        path,
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert client.get(path).json() == response.json()
+
+
+def test_metric_file_with_empty_cells():
+    response = client.get("/metrics/e04_rf_smote_test_metrics.csv")
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["mean_pr_auc"] is None
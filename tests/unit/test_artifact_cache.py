@@ -0,0 +1,127 @@
+# futurisys-ml-deploy/tests/unit/test_artifact_cache.py
+
+import gzip
+import json
+import os
+
+import pytest
+from fastapi import Request
+
+from src.api.artifact_cache import ArtifactCache, accepts_gzip
+
+
+def _request(**headers) -> Request:
+    raw = [
+        (name.replace("_", "-").encode(), value.encode())
+        for name, value in headers.items()
+    ]
+    return Request({"type": "http", "headers": raw})
+
+
+def _counting_build(path):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"content": path.read_text(), "nan": None}
+
+    return build, calls
+
+
+def test_build_once_until_file_changes(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("v1")
+    cache = ArtifactCache()
+    build, calls = _counting_build(path)
+
+    first = cache.get("doc", build, paths=[path])
+    assert cache.get("doc", build, paths=[path]) is first
+    assert len(calls) == 1
+    assert json.loads(first.body) == {"content": "v1", "nan": None}
+
+    path.write_text("v2")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = cache.get("doc", build, paths=[path])
+    assert len(calls) == 2
+    assert second.etag != first.etag
+    assert cache.stats()["hits"] == 1
+
+
+def test_version_change_rebuilds():
+    cache = ArtifactCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"models": ["logistic"]}
+
+    cache.get("models", build, version=1)
+    cache.get("models", build, version=1)
+    cache.get("models", build, version=2)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, br", False),
+        ("x-gzipped, br", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_conditional_requests(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("x" * 2000)
+    cache = ArtifactCache(gzip_min_bytes=512)
+    build, _ = _counting_build(path)
+
+    response = cache.serve(_request(), "doc", build, paths=[path])
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+    zipped = cache.serve(
+        _request(accept_encoding="gzip, br"),
+        "doc",
+        build,
+        paths=[path],
+    )
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.headers["etag"] == etag
+    assert gzip.decompress(zipped.body) == response.body
+
+    for headers in (
+        {"if_none_match": etag},
+        {"if_none_match": f'"other", {etag.removeprefix("W/")}'},
+        {"if_modified_since": last_modified},
+    ):
+        not_modified = cache.serve(
+            _request(**headers),
+            "doc",
+            build,
+            paths=[path],
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+
+    # If-None-Match prioritaire sur If-Modified-Since
+    stale = cache.serve(
+        _request(if_none_match='"other"', if_modified_since=last_modified),
+        "doc",
+        build,
+        paths=[path],
+    )
+    assert stale.status_code == 200
+    assert cache.stats()["not_modified"] == 3
@@ -0,0 +1,164 @@
+# futurisys-ml-deploy/tests/unit/test_batching.py
+
+import asyncio
+
+import pytest
+
+from src.ml.batching import (
+    MicroBatcher,
+    MicroBatchQueueFull,
+    MicroBatchTimeout,
+)
+from src.ml.cache import get_prediction_cache
+
+PAYLOAD = {
+    "age": 30,
+    "revenu_mensuel": 5000,
+    "annees_dans_l_entreprise": 5,
+    "frequence_deplacement": "frequent",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_prediction_cache():
+    """
+    Les payloads identiques seraient servis par le cache sans passer
+    par le micro-batcher.
+    """
+    get_prediction_cache().clear()
+    yield
+    get_prediction_cache().clear()
+
+
+def test_concurrent_requests_are_scored_in_one_batch():
+    """
+    Des requêtes concurrentes dans la même fenêtre forment un seul lot,
+    chaque appelant reçoit sa propre ligne.
+    """
+    batcher = MicroBatcher(window_ms=50, max_batch=64, queue_depth=128)
+
+    async def scenario():
+        return await asyncio.gather(
+            *[batcher.submit(PAYLOAD, "logistic") for _ in range(10)]
+        )
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 10
+    assert all(r["prediction"] in [0, 1] for r in results)
+
+    stats = batcher.stats()
+    assert stats["batch_size"]["count"] == 1
+    assert stats["batch_size"]["sum"] == 10
+    assert stats["wait_time_ms"]["count"] == 10
+
+
+def test_batch_is_capped_at_max_batch():
+    batcher = MicroBatcher(window_ms=50, max_batch=4, queue_depth=128)
+
+    async def scenario():
+        return await asyncio.gather(
+            *[batcher.submit(PAYLOAD, "logistic") for _ in range(10)]
+        )
+
+    asyncio.run(scenario())
+
+    assert batcher.stats()["batch_size"]["count"] == 3  # 4 + 4 + 2
+
+
+def test_queue_full_is_rejected():
+    batcher = MicroBatcher(window_ms=50, max_batch=64, queue_depth=1)
+
+    async def scenario():
+        return await asyncio.gather(
+            *[batcher.submit(PAYLOAD, "logistic") for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    rejected = [r for r in results if isinstance(r, MicroBatchQueueFull)]
+    assert rejected
+    assert all(r.retry_after_s >= 1 for r in rejected)
+
+
+def test_unknown_model_is_rejected():
+    batcher = MicroBatcher()
+
+    with pytest.raises(ValueError):
+        asyncio.run(batcher.submit(PAYLOAD, "unknown"))
+
+
+def test_scoring_failure_reaches_every_caller(monkeypatch):
+    """
+    Une erreur de scoring est propagée à chaque appelant du lot ;
+    la tâche collectrice continue de servir les lots suivants.
+    """
+    import src.ml.batching as batching
+
+    batcher = MicroBatcher(window_ms=20, max_batch=64, queue_depth=128)
+    predict_timed = batching._predict_timed
+
+    def failing(session, rows):
+        raise RuntimeError("scoring failed")
+
+    async def scenario():
+        monkeypatch.setattr(batching, "_predict_timed", failing)
+        failed = await asyncio.gather(
+            *[batcher.submit(PAYLOAD, "logistic") for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        monkeypatch.setattr(batching, "_predict_timed", predict_timed)
+        recovered = await batcher.submit(PAYLOAD, "logistic")
+        return failed, recovered
+
+    failed, recovered = asyncio.run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in failed)
+    assert recovered["prediction"] in [0, 1]
+
+
+def test_shadow_failure_does_not_fail_callers(monkeypatch):
+    import src.ml.batching as batching
+
+    class BrokenShadow:
+        def observe(self, *args):
+            raise RuntimeError("shadow sink down")
+
+    monkeypatch.setattr(batching, "get_shadow_scorer", BrokenShadow)
+    batcher = MicroBatcher(window_ms=5)
+
+    result = asyncio.run(batcher.submit(PAYLOAD, "logistic"))
+
+    assert result["prediction"] in [0, 1]
+
+
+def test_dead_collector_is_restarted_and_wait_is_bounded():
+    batcher = MicroBatcher(window_ms=5, timeout_s=0.2)
+
+    async def scenario():
+        await batcher.submit(PAYLOAD, "logistic")
+        get_prediction_cache().clear()
+
+        # Collecteur arrêté : recréé au prochain submit
+        task = next(iter(batcher._tasks.values()))
+        task.cancel()
+        await asyncio.sleep(0)
+        restarted = await batcher.submit(PAYLOAD, "logistic")
+
+        # Lot jamais scoré : l'appelant n'attend pas indéfiniment
+        get_prediction_cache().clear()
+        for task in batcher._tasks.values():
+            task.cancel()
+        batcher._tasks = {}
+        batcher._queue_for = lambda name: asyncio.Queue()
+        try:
+            await batcher.submit(PAYLOAD, "logistic")
+        except MicroBatchTimeout as e:
+            return restarted, e
+
+    restarted, error = asyncio.run(scenario())
+
+    assert restarted["prediction"] in [0, 1]
+    assert isinstance(error, MicroBatchTimeout)
@@ -0,0 +1,154 @@
+# futurisys-ml-deploy/tests/unit/test_bulk.py
+
+import csv
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from src.ml.bulk import bulk_score
+from src.ml.features import FeaturePlan
+from src.ml.inference import normalize_payload
+from src.ml.session import get_inference_session
+
+HEADER = [
+    "id_employee",
+    "age",
+    "genre",
+    "revenu_mensuel",
+    "annees_dans_l_entreprise",
+    "frequence_deplacement",
+]
+
+
+def _write_csv(path, n_rows: int) -> list[dict]:
+    rng = np.random.default_rng(0)
+    frequences = ["aucun", "occasionnel", "frequent"]
+    rows = [
+        {
+            "id_employee": str(1000 + i),
+            "age": str(int(rng.integers(18, 60))),
+            "genre": "F",
+            "revenu_mensuel": f"{rng.uniform(1000, 20000):.2f}",
+            "annees_dans_l_entreprise": str(int(rng.integers(0, 30))),
+            "frequence_deplacement": frequences[i % 3],
+        }
+        for i in range(n_rows)
+    ]
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=HEADER)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+def _read_csv(path) -> list[dict]:
+    with path.open(newline="") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def logistic_session(monkeypatch):
+    """
+    Session "logistic" servant un vrai modèle (le registry de test
+    sert un modèle constant).
+    """
+    session = get_inference_session("logistic")
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(200, session.plan.n_features))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+
+    model = LogisticRegression().fit(X, y)
+    monkeypatch.setattr(session, "model", model)
+    monkeypatch.setattr(session, "classes", model.classes_)
+    return session
+
+
+def test_assemble_columns_matches_assemble():
+    plan = FeaturePlan(["a", "b", "c"], defaults={"c": 7.0})
+    rows = [{"a": 1.0, "b": 2.0}, {"a": 3.0, "c": 4.0}]
+
+    columns = {
+        "a": np.array([1.0, 3.0]),
+        "c": np.array([np.nan, 4.0]),
+        "unknown": np.array([9.0, 9.0]),
+    }
+    X = plan.assemble_columns(columns, 2)
+
+    np.testing.assert_array_equal(
+        X,
+        [[1.0, 0.0, 7.0], [3.0, 0.0, 4.0]],
+    )
+    np.testing.assert_array_equal(
+        X[:, [0, 2]],
+        plan.assemble(rows)[:, [0, 2]],
+    )
+
+
+def test_bulk_scores_match_api_path(tmp_path, logistic_session):
+    rows = _write_csv(tmp_path / "in.csv", 25)
+
+    report = bulk_score(
+        tmp_path / "in.csv",
+        tmp_path / "out.csv",
+        model_name="logistic",
+        chunk_rows=7,
+        id_column="id_employee",
+    )
+    scored = _read_csv(tmp_path / "out.csv")
+
+    assert report["rows"] == 25
+    ids = [r["id_employee"] for r in rows]
+    assert [r["id_employee"] for r in scored] == ids
+
+    for row, out in zip(rows, scored):
+        payload = {
+            key: float(row[key])
+            for key in ("age", "revenu_mensuel", "annees_dans_l_entreprise")
+        }
+        payload["frequence_deplacement"] = row["frequence_deplacement"]
+        expected = logistic_session.predict(normalize_payload(payload))
+
+        assert int(out["prediction"]) == expected["prediction"]
+        assert out["probability_exact"] == "True"
+        assert float(out["probability"]) == pytest.approx(
+            expected["probability"],
+            abs=1e-6,
+        )
+
+
+def test_invalid_values_fall_back_to_defaults(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text(
+        "age,revenu_mensuel,frequence_deplacement\n"
+        "30,abc,frequent\n"
+        ",5000,inconnu\n"
+    )
+
+    report = bulk_score(path, tmp_path / "out.csv", model_name="logistic")
+    scored = _read_csv(tmp_path / "out.csv")
+
+    assert report["invalid_values"] == 1
+    assert [r["row"] for r in scored] == ["0", "1"]
+
+
+def test_workers_preserve_input_order(tmp_path):
+    _write_csv(tmp_path / "in.csv", 30)
+
+    bulk_score(
+        tmp_path / "in.csv",
+        tmp_path / "inline.csv",
+        model_name="logistic",
+        chunk_rows=4,
+    )
+    bulk_score(
+        tmp_path / "in.csv",
+        tmp_path / "pool.csv",
+        model_name="logistic",
+        chunk_rows=4,
+        workers=2,
+    )
+
+    assert _read_csv(tmp_path / "pool.csv") == _read_csv(
+        tmp_path / "inline.csv",
+    )
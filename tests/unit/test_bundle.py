@@ -0,0 +1,123 @@
+# futurisys-ml-deploy/tests/unit/test_bundle.py
+
+import json
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.dummy import DummyClassifier
+from sklearn.ensemble import RandomForestClassifier
+
+import src.ml.model_registry as registry
+from src.ml.native import (
+    ConstantScorer,
+    LinearScorer,
+    compile_model,
+    export_bundle,
+    load_bundle,
+    read_bundle_header,
+)
+from src.ml.native.bundle import ARRAY_ALIGNMENT, _data_offset
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+@pytest.fixture(scope="module")
+def X_test():
+    return np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+
+@pytest.fixture(scope="module")
+def forest(X_test):
+    y = (X_test[:, 0] > np.median(X_test[:, 0])).astype(int)
+    return RandomForestClassifier(n_estimators=10, random_state=0).fit(
+        X_test,
+        y,
+    )
+
+
+def test_forest_bundle_round_trip(forest, X_test, tmp_path):
+    compiled = compile_model(forest)
+    path = export_bundle(compiled, tmp_path / "rf.npz", {"model": "rf"})
+
+    loaded = load_bundle(path)
+
+    assert isinstance(loaded.threshold, np.memmap)
+    np.testing.assert_array_equal(
+        loaded.predict_proba(X_test),
+        compiled.predict_proba(X_test),
+    )
+    assert read_bundle_header(path)["source"] == {"model": "rf"}
+
+
+def test_bundle_arrays_are_aligned(forest, tmp_path):
+    path = export_bundle(compile_model(forest), tmp_path / "rf.npz")
+
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            if info.filename.endswith(".npy"):
+                assert _data_offset(f, info) % ARRAY_ALIGNMENT == 0
+
+
+def test_constant_bundle_round_trip(X_test, tmp_path):
+    y = (X_test[:, 0] > 0).astype(int)
+    dummy = DummyClassifier(strategy="prior").fit(X_test, y)
+    scorer = compile_model(dummy)
+
+    loaded = load_bundle(export_bundle(scorer, tmp_path / "d.npz"), False)
+
+    assert isinstance(loaded, ConstantScorer)
+    assert not isinstance(loaded.proba, np.memmap)
+    np.testing.assert_allclose(
+        loaded.predict_proba(X_test),
+        dummy.predict_proba(X_test),
+    )
+    np.testing.assert_array_equal(
+        loaded.predict(X_test),
+        dummy.predict(X_test),
+    )
+
+
+def test_bundle_version_is_checked(forest, tmp_path):
+    path = export_bundle(compile_model(forest), tmp_path / "rf.npz")
+
+    with zipfile.ZipFile(path) as zf:
+        header = json.loads(zf.read("header.json"))
+    header["format_version"] = 99
+
+    patched = tmp_path / "patched.npz"
+    with zipfile.ZipFile(patched, "w") as zf:
+        zf.writestr("header.json", json.dumps(header))
+
+    with pytest.raises(ValueError, match="format version"):
+        load_bundle(patched)
+
+
+def test_compressed_members_are_rejected(forest, tmp_path):
+    path = export_bundle(compile_model(forest), tmp_path / "rf.npz")
+    compressed = tmp_path / "compressed.npz"
+
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(
+        compressed,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+    ) as dst:
+        for info in src.infolist():
+            dst.writestr(info.filename, src.read(info))
+
+    with pytest.raises(ValueError, match="compressed"):
+        load_bundle(compressed)
+
+
+def test_registry_serves_bundles(monkeypatch, X_test):
+    monkeypatch.setattr(registry, "ENV", "prod")
+    monkeypatch.setattr(registry, "MODEL_FORMAT", "bundle")
+    monkeypatch.setattr(registry, "_snapshot", None)
+
+    snapshot = registry.get_snapshot()
+    model = registry.get_model("logistic")
+
+    assert snapshot.model_paths["logistic"].suffix == ".npz"
+    assert isinstance(model, LinearScorer)
+    assert model.predict_proba(X_test).shape == (len(X_test), 2)
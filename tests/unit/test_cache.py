@@ -0,0 +1,75 @@
+# futurisys-ml-deploy/tests/unit/test_cache.py
+
+import time
+
+from src.ml.cache import PredictionCache
+
+RESULT = {"prediction": 1, "probability": 0.95}
+
+
+def _key(cache: PredictionCache, age: int):
+    return cache.key("logistic", {"age": age, "frequence_deplacement": 2})
+
+
+def test_cache_hit_and_miss():
+    cache = PredictionCache(max_entries=10)
+    key = _key(cache, 30)
+
+    assert cache.get(key, "v1") is None
+    cache.put(key, "v1", RESULT)
+    assert cache.get(key, "v1") == RESULT
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_cache_key_is_order_independent():
+    assert PredictionCache.key("m", {"a": 1, "b": 2}) == PredictionCache.key(
+        "m", {"b": 2, "a": 1}
+    )
+
+
+def test_cache_lru_eviction_by_entries():
+    cache = PredictionCache(max_entries=2)
+
+    for age in (30, 31):
+        cache.put(_key(cache, age), "v1", RESULT)
+    cache.get(_key(cache, 30), "v1")  # 30 devient le plus récent
+    cache.put(_key(cache, 32), "v1", RESULT)
+
+    assert cache.get(_key(cache, 31), "v1") is None
+    assert cache.get(_key(cache, 30), "v1") == RESULT
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_eviction_by_memory():
+    cache = PredictionCache(max_entries=1000, max_bytes=2000)
+
+    for age in range(18, 70):
+        cache.put(_key(cache, age), "v1", RESULT)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 2000
+    assert stats["evictions"] > 0
+
+
+def test_cache_ttl_expiration():
+    cache = PredictionCache(max_entries=10, ttl_s=0.01)
+    key = _key(cache, 30)
+
+    cache.put(key, "v1", RESULT)
+    time.sleep(0.02)
+
+    assert cache.get(key, "v1") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_flushed_on_version_change():
+    cache = PredictionCache(max_entries=10)
+    key = _key(cache, 30)
+
+    cache.put(key, "v1", RESULT)
+
+    assert cache.get(key, "v2") is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["entries"] == 0
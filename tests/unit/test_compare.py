@@ -0,0 +1,53 @@
+# futurisys-ml-deploy/tests/unit/test_compare.py
+
+import pytest
+
+import src.ml.model_registry as registry
+from src.ml.inference import normalize_payload, run_model_comparison
+from src.ml.session import get_inference_session
+
+PAYLOADS = [
+    {"age": 30, "revenu_mensuel": 5000, "frequence_deplacement": "aucun"},
+    {"age": 52, "revenu_mensuel": 7200, "frequence_deplacement": "frequent"},
+]
+
+
+@pytest.fixture
+def prod_registry(monkeypatch):
+    monkeypatch.setattr(registry, "ENV", "prod")
+    monkeypatch.setattr(registry, "_snapshot", None)
+    return registry
+
+
+def test_comparison_matches_single_model_scoring(prod_registry):
+    report = run_model_comparison(PAYLOADS, ["logistic", "dummy"])
+
+    assert report["rows"] == 2
+    for result in report["results"]:
+        expected = get_inference_session(result["model_name"]).predict_batch(
+            [normalize_payload(p) for p in PAYLOADS],
+        )
+        assert result["probabilities"] == [r["probability"] for r in expected]
+        assert result["predictions"] == [r["prediction"] for r in expected]
+
+
+def test_unavailable_model_does_not_fail_comparison(
+    prod_registry,
+    monkeypatch,
+):
+    monkeypatch.setitem(
+        prod_registry.get_snapshot().model_paths,
+        "random_forest",
+        prod_registry.BASE_PATH / "models" / "missing.joblib",
+    )
+
+    report = run_model_comparison(PAYLOADS[:1], ["random_forest", "logistic"])
+
+    failed, scored = report["results"]
+    assert failed["error"].startswith("FileNotFoundError")
+    assert len(scored["probabilities"]) == 1
+
+
+def test_comparison_rejects_unknown_models():
+    with pytest.raises(ValueError):
+        run_model_comparison(PAYLOADS, ["unknown"])
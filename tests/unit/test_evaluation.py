@@ -0,0 +1,81 @@
+# futurisys-ml-deploy/tests/unit/test_evaluation.py
+
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    confusion_matrix,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from src.ml.evaluation import ModelEvaluator, binary_metrics
+from src.ml.session import get_inference_session
+
+
+@pytest.mark.parametrize("decimals", [None, 1])
+def test_binary_metrics_match_sklearn(decimals):
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 500)
+    scores = rng.random(500)
+    if decimals is not None:
+        scores = np.round(scores, decimals)  # seuils ex aequo
+
+    metrics = binary_metrics(y, scores, threshold=0.5)
+    y_pred = scores >= 0.5
+
+    assert metrics["accuracy"] == pytest.approx(accuracy_score(y, y_pred))
+    assert metrics["precision"] == pytest.approx(precision_score(y, y_pred))
+    assert metrics["recall"] == pytest.approx(recall_score(y, y_pred))
+    assert metrics["f1"] == pytest.approx(f1_score(y, y_pred))
+    assert metrics["roc_auc"] == pytest.approx(roc_auc_score(y, scores))
+    assert metrics["pr_auc"] == pytest.approx(
+        average_precision_score(y, scores),
+    )
+
+    tn, fp, fn, tp = confusion_matrix(y, y_pred).ravel().tolist()
+    assert metrics["confusion_matrix"] == {
+        "tn": tn,
+        "fp": fp,
+        "fn": fn,
+        "tp": tp,
+    }
+
+
+def test_binary_metrics_single_class_has_no_auc():
+    metrics = binary_metrics(np.zeros(4, dtype=int), np.full(4, 0.2))
+
+    assert metrics["accuracy"] == 1.0
+    assert metrics["f1"] == 0.0
+    assert metrics["roc_auc"] is None
+    assert metrics["pr_auc"] is None
+
+
+def test_cold_evaluation_does_not_block_other_models():
+    evaluator = ModelEvaluator()
+
+    # Évaluation à froid de "dummy" en cours (verrou tenu)
+    with evaluator._lock_for("dummy"):
+        result = evaluator.evaluate("logistic")
+
+    assert result["model"] == "logistic"
+
+
+def test_evaluation_is_cached_per_model_version(monkeypatch):
+    evaluator = ModelEvaluator()
+    session = get_inference_session("logistic")
+
+    first = evaluator.evaluate("logistic")
+    assert evaluator.evaluate("logistic") is first
+    assert evaluator.evaluations == 1
+
+    # Artefact remplacé : nouvelle version → réévaluation
+    monkeypatch.setattr(session, "version", "replaced")
+    second = evaluator.evaluate("logistic")
+
+    assert evaluator.evaluations == 2
+    assert second["model_version"] == "replaced"
+    assert evaluator.evaluate("logistic") is second
@@ -0,0 +1,78 @@
+# futurisys-ml-deploy/tests/unit/test_executor.py
+
+import asyncio
+import threading
+
+import pytest
+
+from src.ml.executor import InferenceExecutor, InferenceQueueFull
+
+
+def test_inference_runs_off_the_event_loop():
+    executor = InferenceExecutor(concurrency=2, queue_depth=0)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        return loop_thread, await executor.run(threading.get_ident)
+
+    loop_thread, inference_thread = asyncio.run(scenario())
+
+    assert inference_thread != loop_thread
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["queue_wait_ms"]["count"] == 1
+    assert stats["run_time_ms"]["count"] == 1
+
+
+def test_saturated_executor_rejects_immediately():
+    executor = InferenceExecutor(concurrency=1, queue_depth=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(InferenceQueueFull) as excinfo:
+            await executor.run(release.wait)
+
+        stats = executor.stats()
+        release.set()
+        await asyncio.gather(running, queued)
+        return excinfo.value, stats
+
+    error, stats = asyncio.run(scenario())
+
+    assert error.retry_after_s >= 1
+    assert stats["active"] == 1
+    assert stats["queued"] == 1
+    assert stats["rejected"] == 1
+    assert executor.stats()["completed"] == 2
+
+
+def test_cancelled_caller_keeps_slot_until_job_finishes():
+    executor = InferenceExecutor(concurrency=1, queue_depth=0)
+    release = threading.Event()
+
+    async def scenario():
+        task = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.sleep(0)
+
+        # Le thread travaille toujours : pas de nouvelle admission
+        try:
+            with pytest.raises(InferenceQueueFull):
+                await executor.run(release.wait)
+        finally:
+            release.set()
+
+        for _ in range(100):
+            if executor.stats()["completed"]:
+                break
+            await asyncio.sleep(0.01)
+
+        return await executor.run(lambda: "ok")
+
+    assert asyncio.run(scenario()) == "ok"
+    assert executor.stats()["active"] == 0
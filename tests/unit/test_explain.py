@@ -0,0 +1,164 @@
+# futurisys-ml-deploy/tests/unit/test_explain.py
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.ml.inference import run_explanation
+from src.ml.native import ConstantScorer, compile_model
+from src.ml.native.explain import (
+    LinearExplainer,
+    TreeExplainer,
+    build_explainer,
+)
+from src.ml.session import get_inference_session
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+@pytest.fixture(scope="module")
+def test_arrays():
+    return (
+        np.load(ARTIFACTS / "e02_X_train_final.npy"),
+        np.load(ARTIFACTS / "e02_y_train.npy"),
+        np.load(ARTIFACTS / "e02_X_test_final.npy"),
+    )
+
+
+@pytest.fixture(scope="module")
+def forest(test_arrays):
+    X_train, y_train, _ = test_arrays
+    return RandomForestClassifier(
+        n_estimators=30,
+        class_weight="balanced",
+        random_state=42,
+    ).fit(X_train, y_train)
+
+
+def _path_contributions(tree, row: np.ndarray) -> np.ndarray:
+    """
+    Attribution par chemin d'un arbre sklearn, noeud par noeud.
+    """
+    value = tree.tree_.value[:, 0, :]
+    value = value[:, 1] / value.sum(axis=1)
+    path = tree.decision_path(row[None, :]).indices
+
+    out = np.zeros(len(row))
+    for parent, child in zip(path[:-1], path[1:]):
+        out[tree.tree_.feature[parent]] += value[child] - value[parent]
+    return out
+
+
+def test_tree_contributions_sum_to_probability(forest, test_arrays):
+    _, _, X_test = test_arrays
+    explainer = build_explainer(forest)
+
+    contributions = explainer.explain(X_test)
+
+    assert isinstance(explainer, TreeExplainer)
+    assert contributions.shape == X_test.shape
+    np.testing.assert_allclose(
+        explainer.base_value + contributions.sum(axis=1),
+        forest.predict_proba(X_test)[:, 1],
+        atol=1e-9,
+    )
+
+
+def test_tree_contributions_match_path_walk(forest, test_arrays):
+    _, _, X_test = test_arrays
+    explainer = build_explainer(compile_model(forest))
+
+    expected = np.mean(
+        [_path_contributions(tree, X_test[0]) for tree in forest.estimators_],
+        axis=0,
+    )
+
+    np.testing.assert_allclose(explainer.explain(X_test[:1])[0], expected)
+
+
+def test_compact_forest_explanations(forest, test_arrays):
+    _, _, X_test = test_arrays
+    compact = compile_model(forest).compact()
+
+    explainer = build_explainer(compact)
+    output = explainer.base_value + explainer.explain(X_test).sum(axis=1)
+
+    np.testing.assert_allclose(
+        output,
+        compact.predict_proba(X_test)[:, 1],
+        atol=1e-5,
+    )
+
+
+def test_linear_contributions_sum_to_log_odds(test_arrays):
+    X_train, y_train, X_test = test_arrays
+    model = Pipeline(
+        [
+            ("scaler", StandardScaler()),
+            ("clf", LogisticRegression(max_iter=1000)),
+        ]
+    ).fit(X_train, y_train)
+
+    explainer = build_explainer(model)
+    output = explainer.base_value + explainer.explain(X_test).sum(axis=1)
+
+    assert isinstance(explainer, LinearExplainer)
+    np.testing.assert_allclose(output, model.decision_function(X_test))
+    np.testing.assert_allclose(
+        explainer.probability(output),
+        model.predict_proba(X_test)[:, 1],
+    )
+
+
+def test_constant_model_is_not_explainable():
+    scorer = ConstantScorer(np.array([0.8, 0.2]), 3, np.array([0, 1]))
+
+    with pytest.raises(ValueError, match="No explanation method"):
+        build_explainer(scorer)
+
+
+def test_session_builds_explainer_once(monkeypatch):
+    session = get_inference_session("logistic")
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(100, session.plan.n_features))
+    y = (X[:, 0] > 0).astype(int)
+
+    model = LogisticRegression().fit(X, y)
+    monkeypatch.setattr(session, "model", model)
+    monkeypatch.setattr(session, "classes", model.classes_)
+
+    assert session.explainer is session.explainer
+
+    result = run_explanation(
+        [
+            {
+                "age": 30,
+                "revenu_mensuel": 5000,
+                "annees_dans_l_entreprise": 5,
+                "frequence_deplacement": "frequent",
+            }
+        ],
+        model_name="logistic",
+        top_k=2,
+    )
+    explanation = result["explanations"][0]
+    contributions = [c["contribution"] for c in explanation["contributions"]]
+
+    assert result["method"] == "linear"
+    assert len(contributions) == 2
+    assert abs(contributions[0]) >= abs(contributions[1])
+    assert explanation["probability"] == pytest.approx(
+        session.predict(
+            {
+                "age": 30,
+                "revenu_mensuel": 5000,
+                "annees_dans_l_entreprise": 5,
+                "frequence_deplacement": 2,
+            }
+        )["probability"],
+    )
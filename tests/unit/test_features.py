@@ -0,0 +1,52 @@
+# futurisys-ml-deploy/tests/unit/test_features.py
+
+import numpy as np
+import pytest
+
+from src.ml.features import FeaturePlan, get_feature_plan
+from src.ml.model_registry import get_features
+
+
+def test_plan_keeps_strict_feature_order():
+    plan = get_feature_plan()
+
+    assert plan.features == tuple(get_features())
+    positions = [plan.index[f] for f in plan.features]
+    assert positions == list(range(plan.n_features))
+
+
+def test_plan_rejects_duplicate_features():
+    with pytest.raises(ValueError):
+        FeaturePlan(["age", "age"])
+
+
+def test_plan_row_and_batch_are_identical():
+    """
+    Une ligne (buffer du pool) et un lot produisent les mêmes valeurs,
+    défauts appliqués aux champs absents, champs inconnus ignorés.
+    """
+    plan = FeaturePlan(["a", "b", "c"], defaults={"c": -1.0})
+    rows = [
+        {"a": 1, "b": 2.5, "unknown": 9},
+        {"a": 3, "b": None},
+    ]
+
+    X = plan.assemble(rows)
+
+    assert X.dtype == np.float64
+    np.testing.assert_array_equal(X, [[1.0, 2.5, -1.0], [3.0, 0.0, -1.0]])
+
+    for i, row in enumerate(rows):
+        with plan.row(row) as buffer:
+            np.testing.assert_array_equal(buffer, X[[i]])
+
+
+def test_plan_row_buffer_is_reused():
+    plan = FeaturePlan(["a", "b"])
+
+    with plan.row({"a": 1}) as first:
+        pass
+    with plan.row({"b": 2}) as second:
+        np.testing.assert_array_equal(second, [[0.0, 2.0]])
+
+    assert first is second
@@ -0,0 +1,69 @@
+# futurisys-ml-deploy/tests/unit/test_model_registry.py
+
+import threading
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import src.ml.model_registry as registry
+
+
+@pytest.fixture
+def prod_registry(monkeypatch):
+    """
+    Registry en mode prod (artefacts réels), état de chargement isolé.
+    """
+    monkeypatch.setattr(registry, "ENV", "prod")
+    monkeypatch.setattr(registry, "_snapshot", None)
+    registry.get_snapshot()
+    return registry
+
+
+def test_models_are_loaded_lazily(prod_registry):
+    prod_registry.get_model("logistic")
+
+    stats = prod_registry.get_load_stats()
+    assert stats["loaded"] == ["logistic"]
+    assert stats["models"]["logistic"]["load_ms"] > 0
+    assert stats["models"]["logistic"]["array_bytes"] > 0
+
+
+def test_concurrent_first_requests_load_once(prod_registry, monkeypatch):
+    calls = []
+    original_load = joblib.load
+    barrier = threading.Barrier(8)
+
+    def counting_load(*args, **kwargs):
+        calls.append(args[0])
+        return original_load(*args, **kwargs)
+
+    monkeypatch.setattr(registry.joblib, "load", counting_load)
+
+    models = []
+
+    def first_request():
+        barrier.wait()
+        models.append(prod_registry.get_model("dummy"))
+
+    threads = [threading.Thread(target=first_request) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(model is models[0] for model in models)
+
+
+def test_baseline_is_an_alias_of_the_default_model():
+    assert registry.get_model("baseline") is registry.get_model()
+
+
+def test_forest_array_bytes_are_measured():
+    X = np.random.default_rng(0).random((50, 3))
+    forest = RandomForestClassifier(n_estimators=3, random_state=0)
+    forest.fit(X, X[:, 0] > 0.5)
+
+    assert registry._array_nbytes(forest) > 0
@@ -0,0 +1,180 @@
+# futurisys-ml-deploy/tests/unit/test_native.py
+
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.ml.model_registry import _parse_backends
+from src.ml.native import (
+    CompiledForest,
+    LinearScorer,
+    compile_model,
+    parity_delta,
+    precision_drift,
+)
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+@pytest.fixture(scope="module")
+def test_arrays():
+    return (
+        np.load(ARTIFACTS / "e02_X_train_final.npy"),
+        np.load(ARTIFACTS / "e02_y_train.npy"),
+        np.load(ARTIFACTS / "e02_X_test_final.npy"),
+    )
+
+
+@pytest.fixture(scope="module")
+def forest(test_arrays):
+    X_train, y_train, _ = test_arrays
+    return RandomForestClassifier(
+        n_estimators=30,
+        class_weight="balanced",
+        random_state=42,
+    ).fit(X_train, y_train)
+
+
+def test_compiled_forest_parity_on_test_set(forest, test_arrays):
+    """
+    Parité native / sklearn sur e02_X_test_final.npy.
+    """
+    _, _, X_test = test_arrays
+    compiled = compile_model(forest)
+
+    assert isinstance(compiled, CompiledForest)
+    assert parity_delta(compiled, forest, X_test) <= 1e-12
+    np.testing.assert_array_equal(
+        compiled.predict(X_test),
+        forest.predict(X_test),
+    )
+
+
+def test_compiled_forest_single_row(forest, test_arrays):
+    _, _, X_test = test_arrays
+    compiled = compile_model(forest)
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X_test[:1]),
+        forest.predict_proba(X_test[:1]),
+        atol=1e-12,
+    )
+
+
+def test_compact_forest_keeps_decisions(forest, test_arrays):
+    _, _, X_test = test_arrays
+    native = compile_model(forest)
+    compact = native.compact()
+
+    assert compact.threshold.dtype == np.float32
+    assert compact.left.dtype == np.int32
+    assert compact.nbytes < 0.6 * native.nbytes
+    np.testing.assert_array_equal(compact.apply(X_test), native.apply(X_test))
+
+    drift = precision_drift(forest, compact, X_test)
+    assert drift["flips"] == 0
+    assert drift["max_abs_delta"] <= 1e-6
+
+
+def test_compact_thresholds_round_down():
+    """
+    float32(0.1) > 0.1 : le seuil compact ne doit pas renvoyer
+    cette valeur à gauche.
+    """
+    native = CompiledForest(
+        feature=np.array([0, 0, 0]),
+        threshold=np.array([0.1, -2.0, -2.0]),
+        left=np.array([1, 1, 2]),
+        right=np.array([2, 1, 2]),
+        missing_left=np.zeros(3, dtype=bool),
+        value=np.array([[0.5, 0.5], [1.0, 0.0], [0.0, 1.0]]),
+        roots=np.array([0]),
+        max_depth=1,
+        n_features=1,
+        classes=np.array([0, 1]),
+    )
+    X = np.array([[np.float32(0.1)], [0.09]])
+
+    np.testing.assert_array_equal(
+        native.compact().predict(X),
+        native.predict(X),
+    )
+
+
+def test_early_exit_keeps_classes(forest, test_arrays):
+    _, _, X_test = test_arrays
+    compiled = compile_model(forest)
+
+    proba, evaluated = compiled.predict_proba_early_exit(X_test)
+    exact = evaluated == compiled.n_trees
+
+    np.testing.assert_array_equal(
+        proba.argmax(axis=1),
+        forest.predict_proba(X_test).argmax(axis=1),
+    )
+    assert evaluated.min() == compiled.n_trees // 2 + 1
+    assert not exact.all()
+    np.testing.assert_allclose(
+        proba[exact],
+        forest.predict_proba(X_test[exact]),
+        atol=1e-12,
+    )
+
+
+def test_compiled_forest_rejects_transformer_pipeline(forest):
+    pipeline = Pipeline([("scaler", StandardScaler()), ("rf", forest)])
+
+    with pytest.raises(ValueError):
+        compile_model(pipeline)
+
+
+def test_linear_scorer_parity_on_test_set(test_arrays):
+    """
+    Parité native / sklearn du modèle logistique servi (artefact réel).
+    """
+    _, _, X_test = test_arrays
+    model = joblib.load(
+        ARTIFACTS / "models" / "e03_logistic_regression_balanced.joblib"
+    )
+    scorer = compile_model(model)
+
+    assert isinstance(scorer, LinearScorer)
+    assert parity_delta(scorer, model, X_test) <= 1e-12
+    assert parity_delta(scorer, model, X_test[:1]) <= 1e-12
+    np.testing.assert_array_equal(
+        scorer.predict(X_test),
+        model.predict(X_test),
+    )
+
+
+def test_linear_scorer_folds_standard_scaler(test_arrays):
+    X_train, y_train, X_test = test_arrays
+    pipeline = Pipeline(
+        [
+            ("scaler", StandardScaler()),
+            ("clf", LogisticRegression(max_iter=1000)),
+        ]
+    ).fit(X_train, y_train)
+
+    scorer = compile_model(pipeline)
+
+    assert parity_delta(scorer, pipeline, X_test) <= 1e-10
+
+
+def test_parse_backends():
+    assert _parse_backends(
+        "random_forest=native, logistic=sklearn, random_forest_e04=compact"
+    ) == {
+        "random_forest": "native",
+        "logistic": "sklearn",
+        "random_forest_e04": "compact",
+    }
+
+    with pytest.raises(ValueError):
+        _parse_backends("random_forest=onnx")
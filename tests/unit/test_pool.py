@@ -0,0 +1,172 @@
+# futurisys-ml-deploy/tests/unit/test_pool.py
+
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import src.ml.pool as pool_module
+from src.ml.model_registry import DEFAULT_MODEL_NAME
+from src.ml.native import compile_model
+from src.ml.pool import InferencePool, InferencePoolTimeout
+from src.ml.session import get_inference_session
+
+ARTIFACTS = Path("data/ml_artifacts")
+
+
+class SlowModel:
+    """
+    Modèle volontairement lent (importable par les processus du pool).
+    """
+
+    def predict_proba(self, X):
+        time.sleep(1)
+        return np.zeros((len(X), 2))
+
+
+class FailingChunkModel:
+    """
+    Échoue sur la tranche dont la première valeur est nulle,
+    bloque sur les autres.
+    """
+
+    def predict_proba(self, X):
+        if X[0, 0] == 0:
+            raise ValueError("bad chunk")
+        time.sleep(3)
+        return np.zeros((len(X), 2))
+
+
+@pytest.fixture(scope="module")
+def X_test():
+    return np.load(ARTIFACTS / "e02_X_test_final.npy")
+
+
+@pytest.fixture(scope="module")
+def forest(X_test):
+    X_train = np.load(ARTIFACTS / "e02_X_train_final.npy")
+    y_train = np.load(ARTIFACTS / "e02_y_train.npy")
+    model = RandomForestClassifier(n_estimators=20, random_state=42)
+    return compile_model(model.fit(X_train, y_train))
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = InferencePool(size=2, min_chunk=32, timeout_s=30)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_matches_in_process_scoring(pool, forest, X_test):
+    expected = forest.predict_proba(X_test)
+
+    # Lot découpé en 2 tranches (une par processus)
+    np.testing.assert_array_equal(
+        pool.predict_proba("rf", "v1", forest, X_test),
+        expected,
+    )
+    np.testing.assert_array_equal(
+        pool.predict_proba("rf", "v1", forest, X_test[:1]),
+        expected[:1],
+    )
+    assert pool.stats()["tasks"] == 3
+
+
+def test_pool_exports_once_per_version(pool, X_test):
+    logistic = compile_model(
+        joblib.load(
+            ARTIFACTS / "models" / "e03_logistic_regression_balanced.joblib",
+        )
+    )
+
+    pool.predict_proba("logistic", "v1", logistic, X_test[:4])
+    v1_path = Path(pool.stats()["exports"]["logistic"]["path"])
+    pool.predict_proba("logistic", "v1", logistic, X_test[:4])
+
+    assert Path(pool.stats()["exports"]["logistic"]["path"]) == v1_path
+
+    pool.predict_proba("logistic", "v2", logistic, X_test[:4])
+    v2_path = Path(pool.stats()["exports"]["logistic"]["path"])
+
+    assert v2_path != v1_path
+    assert v2_path.exists() and not v1_path.exists()
+
+
+def test_pool_restarts_after_worker_crash(pool, forest, X_test):
+    pool.predict_proba("rf", "v1", forest, X_test[:1])
+    restarts = pool.restarts
+
+    for process in list(pool._executor._processes.values()):
+        process.kill()
+        process.join()
+
+    np.testing.assert_array_equal(
+        pool.predict_proba("rf", "v1", forest, X_test[:1]),
+        forest.predict_proba(X_test[:1]),
+    )
+    assert pool.restarts == restarts + 1
+
+
+def test_pool_task_timeout(forest, X_test):
+    pool = InferencePool(size=1, timeout_s=0.2)
+    try:
+        with pytest.raises(InferencePoolTimeout):
+            pool.predict_proba("slow", "v1", SlowModel(), X_test[:1])
+        assert pool.stats()["timeouts"] == 1
+
+        # Processus bloqué recyclé : le pool garde toute sa capacité
+        assert pool.stats()["restarts"] == 1
+        pool.timeout_s = 30
+        np.testing.assert_array_equal(
+            pool.predict_proba("rf", "v1", forest, X_test[:1]),
+            forest.predict_proba(X_test[:1]),
+        )
+    finally:
+        pool.shutdown()
+
+
+def test_failed_chunk_does_not_wait_for_the_others(X_test):
+    pool = InferencePool(size=2, min_chunk=32, timeout_s=30)
+    X = np.ones((64, X_test.shape[1]))
+    X[0, 0] = 0
+    try:
+        pool.start()
+        start = time.perf_counter()
+
+        with pytest.raises(ValueError, match="bad chunk"):
+            pool.predict_proba("failing", "v1", FailingChunkModel(), X)
+
+        assert time.perf_counter() - start < 2
+    finally:
+        pool.shutdown()
+
+
+def test_concurrent_resets_keep_the_new_executor(pool, forest, X_test):
+    pool.predict_proba("rf", "v1", forest, X_test[:1])
+    failed = pool._executor
+    restarts = pool.restarts
+
+    pool._reset_executor(failed)
+    replacement = pool._get_executor()
+
+    # Constat tardif de la même panne : sans effet sur le nouvel exécuteur
+    pool._reset_executor(failed)
+
+    assert pool._executor is replacement
+    assert pool.restarts == restarts + 1
+    np.testing.assert_array_equal(
+        pool.predict_proba("rf", "v1", forest, X_test[:1]),
+        forest.predict_proba(X_test[:1]),
+    )
+
+
+def test_session_scores_through_enabled_pool(monkeypatch, pool):
+    monkeypatch.setattr(pool_module, "_pool", pool)
+
+    result = get_inference_session().predict({"age": 30})
+
+    assert result["probability"] == pytest.approx(0.95)
+    assert DEFAULT_MODEL_NAME in pool.stats()["exports"]
@@ -0,0 +1,114 @@
+# futurisys-ml-deploy/tests/unit/test_profiling.py
+
+import asyncio
+from time import perf_counter
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.profiling import get_profiling_policy
+from src.api.routes import admin
+from src.core.profiling import StackSampler, get_stack_sampler
+from src.ml.executor import InferenceExecutor
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def clean_profiles(monkeypatch):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "secret")
+    get_stack_sampler().clear()
+    yield
+    get_profiling_policy().sample_rate = 0.0
+    get_stack_sampler().clear()
+
+
+def _busy_inference(seconds: float) -> int:
+    total = 0
+    deadline = perf_counter() + seconds
+    while perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def test_inference_threads_are_sampled():
+    sampler = StackSampler(interval_s=0.001, ring_size=2)
+    executor = InferenceExecutor(concurrency=1, queue_depth=0)
+
+    async def scenario():
+        profile, token = sampler.start("GET /test", "header")
+        try:
+            await executor.run(_busy_inference, 0.05)
+        finally:
+            sampler.stop(profile, token, 200)
+        return profile
+
+    profile = asyncio.run(scenario())
+
+    assert profile.samples > 0
+    assert "_busy_inference" in profile.folded()
+    assert profile.as_dict()["status"] == 200
+
+
+def test_ring_keeps_most_recent_profiles():
+    sampler = StackSampler(ring_size=2)
+
+    ids = []
+    for _ in range(3):
+        profile, token = sampler.start("GET /", "sampled")
+        sampler.stop(profile, token, 200)
+        ids.append(profile.id)
+
+    assert [p["id"] for p in sampler.profiles()] == ids[:0:-1]
+    assert sampler.get(ids[0]) is None
+
+
+def test_profile_header_requires_admin_token():
+    client = TestClient(app)
+
+    response = client.get("/", headers={"X-Profile": "1"})
+    assert "x-profile-id" not in response.headers
+
+    bad = {"X-Profile": "1", "X-Admin-Token": "bad"}
+    response = client.get("/", headers=bad)
+    assert "x-profile-id" not in response.headers
+
+    response = client.get("/", headers={"X-Profile": "1", **ADMIN})
+    profile_id = response.headers["x-profile-id"]
+
+    listed = client.get("/admin/profiling", headers=ADMIN).json()
+    assert listed["profiles"][0]["id"] == profile_id
+    assert listed["profiles"][0]["reason"] == "header"
+
+    download = client.get(f"/admin/profiles/{profile_id}", headers=ADMIN)
+    assert download.status_code == 200
+    assert "attachment" in download.headers["content-disposition"]
+
+    missing = client.get("/admin/profiles/unknown", headers=ADMIN)
+    assert missing.status_code == 404
+
+
+def test_sample_rate_is_set_at_runtime():
+    client = TestClient(app)
+
+    assert "x-profile-id" not in client.get("/").headers
+
+    response = client.post(
+        "/admin/profiling",
+        params={"sample_rate": 1.0},
+        headers=ADMIN,
+    )
+    assert response.json() == {"sample_rate": 1.0}
+    assert "x-profile-id" in client.get("/").headers
+
+    # Les routes /admin ne sont jamais tirées au sort
+    response = client.get("/admin/profiling", headers=ADMIN)
+    assert "x-profile-id" not in response.headers
+
+    response = client.post(
+        "/admin/profiling",
+        params={"sample_rate": 2.0},
+        headers=ADMIN,
+    )
+    assert response.status_code == 422
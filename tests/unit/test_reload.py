@@ -0,0 +1,140 @@
+# futurisys-ml-deploy/tests/unit/test_reload.py
+
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.routes.admin as admin
+import src.ml.model_registry as registry
+from src.api.main import app
+from src.ml.reload import MetadataWatcher
+from src.ml.session import get_inference_session
+
+ARTIFACTS = [
+    "metadata.json",
+    "e02_X_test_final.npy",
+    "features/e02_all_features_final_list.joblib",
+    "models/e03_dummy_most_frequent.joblib",
+    "models/e03_logistic_regression_balanced.joblib",
+]
+
+
+@pytest.fixture
+def artifacts(tmp_path, monkeypatch):
+    """
+    Copie des artefacts réels, registry en mode prod sur cette copie.
+    """
+    for artifact in ARTIFACTS:
+        target = tmp_path / artifact
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(registry.BASE_PATH / artifact, target)
+
+    monkeypatch.setattr(registry, "ENV", "prod")
+    monkeypatch.setattr(registry, "BASE_PATH", tmp_path)
+    monkeypatch.setattr(registry, "_snapshot", None)
+    # La forêt e04 (modèle par défaut) n'est pas versionnée
+    monkeypatch.setattr(registry, "DEFAULT_MODEL_NAME", "logistic")
+    monkeypatch.setattr(registry, "WARMUP_MODELS", ["logistic"])
+    return tmp_path
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_reload_swaps_snapshot_and_keeps_in_flight_session(artifacts):
+    in_flight = get_inference_session("logistic")
+
+    report = registry.reload_registry()
+
+    assert report["previous_generation"] == in_flight.generation
+    assert report["loaded"] == ["logistic"]
+
+    session = get_inference_session("logistic")
+    assert session.generation == report["generation"]
+    assert session.model is not in_flight.model
+    # L'ancienne session reste utilisable jusqu'à la fin de la requête
+    assert in_flight.predict({"age": 30}) == session.predict({"age": 30})
+
+
+def test_reload_before_traffic_validates_default_and_warmup_models(
+    artifacts,
+    monkeypatch,
+):
+    monkeypatch.setattr(registry, "WARMUP_MODELS", ["dummy"])
+    active = registry.get_snapshot()
+
+    (artifacts / "models/e03_logistic_regression_balanced.joblib").write_bytes(
+        b"corrupted",
+    )
+
+    # Aucun modèle chargé : le modèle par défaut est tout de même validé
+    with pytest.raises(registry.RegistryReloadError):
+        registry.reload_registry()
+    assert registry.get_snapshot() is active
+
+    monkeypatch.setattr(registry, "DEFAULT_MODEL_NAME", "dummy")
+    report = registry.reload_registry()
+
+    assert report["loaded"] == ["dummy"]
+
+
+def test_failed_reload_keeps_active_snapshot(artifacts):
+    model = registry.get_model("logistic")
+    active = registry.get_snapshot()
+
+    (artifacts / "models/e03_logistic_regression_balanced.joblib").write_bytes(
+        b"corrupted",
+    )
+
+    with pytest.raises(registry.RegistryReloadError):
+        registry.reload_registry()
+
+    assert registry.get_snapshot() is active
+    assert registry.get_model("logistic") is model
+
+
+def test_watcher_reloads_on_metadata_change(artifacts):
+    watcher = MetadataWatcher(poll_s=0.01)
+    generation = registry.get_snapshot().generation
+
+    assert watcher.check() is False
+
+    _touch(artifacts / "metadata.json")
+
+    assert watcher.check() is True
+    assert registry.get_snapshot().generation > generation
+    assert watcher.check() is False
+
+
+def test_watcher_does_not_retry_a_rejected_metadata_file(artifacts):
+    watcher = MetadataWatcher(poll_s=0.01)
+    registry.get_model("logistic")
+
+    (artifacts / "models/e03_logistic_regression_balanced.joblib").write_bytes(
+        b"corrupted",
+    )
+    _touch(artifacts / "metadata.json")
+
+    assert watcher.check() is False
+    assert watcher.check() is False
+    assert watcher.stats()["failures"] == 1
+
+
+def test_admin_reload_requires_token(artifacts, monkeypatch):
+    client = TestClient(app)
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", None)
+    assert client.post("/admin/reload").status_code == 403
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "secret")
+    response = client.post("/admin/reload", headers={"X-Admin-Token": "bad"})
+    assert response.status_code == 401
+
+    headers = {"X-Admin-Token": "secret"}
+    response = client.post("/admin/reload", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["generation"] == registry.get_snapshot().generation
@@ -0,0 +1,91 @@
+# futurisys-ml-deploy/tests/unit/test_session.py
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import src.ml.session as session_module
+from src.ml.model_registry import DEFAULT_MODEL_NAME, get_snapshot
+from src.ml.native import compile_model
+from src.ml.session import InferenceSession, get_inference_session
+
+
+def test_session_is_built_once_per_model():
+    """
+    La session est construite une seule fois par modèle
+    (None / "default" → modèle par défaut).
+    """
+    session = get_inference_session()
+
+    assert session is get_inference_session(DEFAULT_MODEL_NAME)
+    assert session is get_inference_session("default")
+    assert session.model_name == DEFAULT_MODEL_NAME
+
+
+def test_session_predict_single_model_call(monkeypatch):
+    """
+    Une prédiction = un seul appel predict_proba, jamais predict.
+    """
+    session = get_inference_session("logistic")
+    calls = []
+
+    original = session.model.predict_proba
+    monkeypatch.setattr(
+        session.model,
+        "predict_proba",
+        lambda X: calls.append(X) or original(X),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        session.model,
+        "predict",
+        lambda X: pytest.fail("predict ne doit pas être appelé"),
+        raising=False,
+    )
+
+    result = session.predict({"age": 30, "frequence_deplacement": 1})
+
+    assert len(calls) == 1
+    assert calls[0].shape == (1, len(session.features))
+    assert result["prediction"] in [0, 1]
+    assert isinstance(result["probability"], float)
+
+
+def test_session_unknown_model():
+    with pytest.raises(ValueError):
+        get_inference_session("unknown")
+
+
+def test_session_early_exit_flags_approximate_rows(monkeypatch):
+    features = get_snapshot().features
+    rng = np.random.default_rng(0)
+    X = rng.random((200, len(features)))
+    forest = RandomForestClassifier(n_estimators=40, random_state=0).fit(
+        X,
+        X[:, 0] > 0.5,
+    )
+    snapshot = SimpleNamespace(
+        features=features,
+        metadata={},
+        versions={"random_forest": "v1"},
+        generation=0,
+        get_model=lambda name: compile_model(forest),
+    )
+
+    monkeypatch.setattr(session_module, "EARLY_EXIT_MODELS", ["random_forest"])
+    monkeypatch.setattr(session_module, "EARLY_EXIT_MIN_ROWS", 2)
+    session = InferenceSession("random_forest", snapshot=snapshot)
+
+    results = session.predict_matrix(X)
+    single = session.predict(dict(zip(features, X[0])))
+
+    assert session.early_exit
+    assert [r["prediction"] for r in results] == forest.predict(X).tolist()
+    assert not all(r["probability_exact"] for r in results)
+    assert single["probability_exact"] is True
+
+    _, probabilities, exact = session.classify(X)
+    assert exact.tolist() == [r["probability_exact"] for r in results]
+    assert probabilities.tolist() == [r["probability"] for r in results]
@@ -0,0 +1,150 @@
+# futurisys-ml-deploy/tests/unit/test_shadow.py
+
+import json
+import threading
+
+import pytest
+
+import src.ml.shadow as shadow_module
+from src.ml.cache import get_prediction_cache
+from src.ml.inference import run_inference
+from src.ml.model_registry import DEFAULT_MODEL_NAME
+from src.ml.session import get_inference_session
+from src.ml.shadow import ShadowScorer
+
+ROWS = [{"age": 30}, {"age": 52}]
+
+
+@pytest.fixture
+def primary():
+    session = get_inference_session()
+    return session, session.predict_batch(ROWS)
+
+
+def test_shadow_compares_candidates_and_writes_sink(tmp_path, primary):
+    session, results = primary
+    sink = tmp_path / "shadow.jsonl"
+    scorer = ShadowScorer(
+        models=["logistic", DEFAULT_MODEL_NAME],
+        fraction=1.0,
+        sink_path=str(sink),
+        flush_rows=100,
+    )
+
+    scorer.observe(session.model_name, session.version, ROWS, results, 1.5)
+    scorer.stop()
+
+    stats = scorer.stats()
+    # Le modèle principal n'est pas rejoué contre lui-même
+    assert list(stats["comparisons"]) == [f"{DEFAULT_MODEL_NAME}→logistic"]
+
+    comparison = stats["comparisons"][f"{DEFAULT_MODEL_NAME}→logistic"]
+    assert comparison["rows"] == 2
+    assert comparison["agreement_rate"] == 1.0
+    assert comparison["probability_delta"]["max_abs"] == 0.0
+    assert comparison["latency_ms"]["primary"]["sum"] == 1.5
+
+    records = [json.loads(line) for line in sink.read_text().splitlines()]
+    assert stats["written"] == len(records) == 2
+    assert records[0]["shadow_model"] == "logistic"
+    assert records[0]["probability"] == records[0]["shadow_probability"]
+
+
+def test_shadow_is_off_the_request_path(tmp_path, primary):
+    session, results = primary
+    scorer = ShadowScorer(
+        models=["logistic"],
+        fraction=1.0,
+        sink_path=str(tmp_path / "shadow.jsonl"),
+        queue_depth=1,
+    )
+    scorer._ensure_started = lambda: None  # file non consommée
+
+    for _ in range(3):
+        scorer.observe(session.model_name, session.version, ROWS, results, 1)
+
+    assert scorer.stats()["sampled"] == 1
+    assert scorer.stats()["dropped"] == 2
+
+
+def test_background_thread_flushes_on_stop(tmp_path, primary):
+    session, results = primary
+    sink = tmp_path / "shadow.jsonl"
+    scorer = ShadowScorer(models=["logistic"], fraction=1.0, sink_path=sink)
+
+    scorer.observe(session.model_name, session.version, ROWS, results, 1)
+    scorer.stop()
+
+    assert len(sink.read_text().splitlines()) == 2
+
+
+def test_approximate_rows_are_left_out_of_comparisons(tmp_path, primary):
+    session, results = primary
+    sink = tmp_path / "shadow.jsonl"
+    scorer = ShadowScorer(models=["logistic"], fraction=1.0, sink_path=sink)
+    approximate = [
+        {**results[0], "probability": 0.5, "probability_exact": False},
+        results[1],
+    ]
+
+    scorer.observe(session.model_name, session.version, ROWS, approximate, 1)
+    scorer.stop()
+
+    key = f"{DEFAULT_MODEL_NAME}→logistic"
+    comparison = scorer.stats()["comparisons"][key]
+    assert comparison["rows"] == 1
+    assert comparison["approximate_rows"] == 1
+    assert comparison["probability_delta"]["max_abs"] == 0.0
+
+    records = [json.loads(line) for line in sink.read_text().splitlines()]
+    assert [r["probability_exact"] for r in records] == [False, True]
+
+
+def test_stop_does_not_block_on_a_full_queue(tmp_path, primary):
+    session, results = primary
+    scorer = ShadowScorer(
+        models=["logistic"],
+        fraction=1.0,
+        sink_path=str(tmp_path / "shadow.jsonl"),
+        queue_depth=1,
+    )
+    # Thread démarré mais file pleine : le sentinel ne peut être ajouté
+    scorer._thread = threading.Thread(target=lambda: None)
+    scorer._thread.start()
+    scorer.observe(session.model_name, session.version, ROWS, results, 1)
+
+    scorer.stop()
+
+    assert scorer.stats()["pending"] == 0
+    assert scorer.stats()["comparisons"]
+
+
+def test_scoring_thread_is_throttled_without_pool(tmp_path):
+    scorer = ShadowScorer(
+        models=["logistic"],
+        fraction=1.0,
+        sink_path=str(tmp_path / "shadow.jsonl"),
+        max_duty=0.5,
+    )
+
+    scorer._throttle(0.01)
+
+    assert scorer.stats()["throttled_s"] == pytest.approx(0.01)
+
+
+def test_live_inference_is_sampled(monkeypatch, tmp_path):
+    scorer = ShadowScorer(
+        models=["logistic"],
+        fraction=1.0,
+        sink_path=str(tmp_path / "shadow.jsonl"),
+    )
+    scorer._ensure_started = lambda: None
+    monkeypatch.setattr(shadow_module, "_scorer", scorer)
+    get_prediction_cache().clear()
+
+    run_inference({"age": 41, "frequence_deplacement": "aucun"})
+    # Servi par le cache : pas de nouvel échantillon
+    run_inference({"age": 41, "frequence_deplacement": "aucun"})
+
+    assert scorer.stats()["sampled"] == 1
+    assert scorer.stats()["pending"] == 1
@@ -0,0 +1,86 @@
+# futurisys-ml-deploy/tests/unit/test_timing.py
+
+import asyncio
+
+import pytest
+
+from src.core.timing import (
+    BACKGROUND_ROUTE,
+    StageMetrics,
+    begin_request,
+    end_request,
+    get_stage_metrics,
+    record_stage,
+    stage,
+)
+from src.ml.executor import InferenceExecutor
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    get_stage_metrics().reset()
+    yield
+    get_stage_metrics().reset()
+
+
+def test_request_stages_are_aggregated():
+    timings, token = begin_request()
+    try:
+        record_stage("db_flush", 0.001)
+        record_stage("db_flush", 0.002, model="logistic")
+        with stage("predict", model="dummy"):
+            pass
+    finally:
+        end_request(token)
+
+    assert timings.model == "logistic"
+    assert list(timings.totals()) == ["db_flush", "predict"]
+    assert timings.totals()["db_flush"] == pytest.approx(0.003)
+
+    header = timings.server_timing(0.01)
+    assert header.startswith("db_flush;dur=3.000, predict;dur=")
+    assert header.endswith("total;dur=10.000")
+
+
+def test_stages_outside_requests_go_to_background():
+    record_stage("predict", 0.0002, model="logistic")
+
+    text = get_stage_metrics().render_prometheus()
+
+    assert f'route="{BACKGROUND_ROUTE}",model="logistic"' in text
+
+
+def test_executor_propagates_request_context():
+    executor = InferenceExecutor(concurrency=1, queue_depth=0)
+
+    async def scenario():
+        timings, token = begin_request()
+        try:
+            await executor.run(record_stage, "predict", 0.001)
+        finally:
+            end_request(token)
+        return timings
+
+    timings = asyncio.run(scenario())
+
+    assert list(timings.totals()) == ["queue_wait", "predict"]
+
+
+def test_prometheus_exposition_format():
+    metrics = StageMetrics(buckets=(0.001, 0.01))
+    timings, token = begin_request()
+    end_request(token)
+    timings.model = "logistic"
+    timings.stages.append(("predict", 0.002))
+
+    metrics.observe_request("POST", "/predictions/request", timings, 0.005)
+    lines = metrics.render_prometheus().splitlines()
+
+    name = "futurisys_stage_duration_seconds"
+    labels = 'method="POST",route="/predictions/request",model="logistic"'
+    labels += ',stage="predict"'
+
+    assert lines[1] == f"# TYPE {name} histogram"
+    assert f'{name}_bucket{{{labels},le="0.001"}} 0' in lines
+    assert f'{name}_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"{name}_count{{{labels}}} 1" in lines
@@ -0,0 +1,58 @@
+# futurisys-ml-deploy/tests/unit/test_warmup.py
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.main as main
+import src.api.warmup as warmup
+
+
+@pytest.fixture
+def state(monkeypatch):
+    """
+    Etat de warm-up isolé, sans connexion DB.
+    """
+    fresh = warmup.WarmupState()
+    monkeypatch.setattr(warmup, "warmup_state", fresh)
+    monkeypatch.setattr(main, "warmup_state", fresh)
+    monkeypatch.setattr(warmup, "WARMUP_DB_CONNECTIONS", 0)
+    return fresh
+
+
+def test_ready_is_503_until_warmup_completes(state):
+    client = TestClient(main.app)
+
+    assert client.get("/ready").status_code == 503
+
+    asyncio.run(warmup.run_warmup())
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert set(response.json()["steps"]) == {
+        "artifacts",
+        *(f"model:{name}" for name in warmup.WARMUP_MODELS),
+    }
+
+
+def test_failed_step_keeps_instance_not_ready(state, monkeypatch):
+    monkeypatch.setattr(warmup, "WARMUP_MODELS", ["unknown_model"])
+
+    asyncio.run(warmup.run_warmup())
+
+    assert state.status == "failed"
+    assert state.steps["model:unknown_model"]["status"] == "failed"
+    assert TestClient(main.app).get("/ready").status_code == 503
+
+
+def test_lifespan_runs_warmup(state):
+    with TestClient(main.app) as client:
+        for _ in range(100):
+            if state.status not in ("pending", "running"):
+                break
+            time.sleep(0.01)
+
+        assert client.get("/ready").status_code == 200